@@ -0,0 +1,44 @@
+"""
+转换器共用的选项常量。
+
+本模块不导入任何第三方库，界面构建时可直接使用，
+不必为读取选项表而提前加载 PyMuPDF / pdfplumber 等依赖。
+"""
+
+# 图片→PDF 支持的图片扩展名
+SUPPORTED_IMAGE_EXTS = {
+    '.png', '.jpg', '.jpeg', '.bmp', '.gif',
+    '.tiff', '.tif', '.webp',
+}
+
+# 压缩级别预设：(图片质量, 目标DPI, garbage回收级别, deflate压缩)
+COMPRESS_PRESETS = {
+    '轻度压缩': {
+        'image_quality': 85,
+        'max_dpi': 200,
+        'garbage': 2,
+        'description': '文件略微减小，画质几乎无损',
+    },
+    '标准压缩': {
+        'image_quality': 60,
+        'max_dpi': 150,
+        'garbage': 3,
+        'description': '平衡文件大小与画质（推荐）',
+    },
+    '极限压缩': {
+        'image_quality': 30,
+        'max_dpi': 96,
+        'garbage': 4,
+        'description': '最大程度压缩，画质会明显下降',
+    },
+}
+
+# 表格提取策略
+TABLE_STRATEGIES = {
+    "自动检测": {
+        "description": "先按表格线检测，若行数明显偏少自动回退为文本对齐",
+    },
+    "文本对齐": {
+        "description": "按文本位置对齐推断表格（适合无边框/线条断裂表格）",
+    },
+}
@@ -15,6 +15,8 @@ try:
 except ImportError:
     FITZ_AVAILABLE = False
 
+from converters.constants import SUPPORTED_IMAGE_EXTS
+
 # 标准页面尺寸（单位：点，72 pts/inch）
 PAGE_SIZES = {
     'A4': (595.28, 841.89),
@@ -24,11 +26,6 @@ PAGE_SIZES = {
     '自适应': None,       # 页面大小匹配图片
 }
 
-SUPPORTED_IMAGE_EXTS = {
-    '.png', '.jpg', '.jpeg', '.bmp', '.gif',
-    '.tiff', '.tif', '.webp',
-}
-
 
 class ImageToPDFConverter:
     """图片→PDF 转换器，与 UI 完全解耦。
@@ -17,6 +17,8 @@ import json
 import logging
 import os
 import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 try:
@@ -37,15 +39,25 @@ try:
 except ImportError:
     OPENPYXL_AVAILABLE = False
 
-from core.ocr_client import BaiduOCRClient, REQUESTS_AVAILABLE
+from core.ocr_client import get_shared_client, REQUESTS_AVAILABLE
 
 
 class PDFBatchExtractConverter:
     """PDF 批量文本/图片提取转换器（与 UI 解耦）。"""
 
+    # 图片格式转换与写盘的线程数；Pillow 编解码和文件写入期间会释放 GIL
+    IMAGE_WORKERS = max(2, min(8, os.cpu_count() or 1))
+
     def __init__(self, on_progress=None):
         self.on_progress = on_progress or (lambda *a: None)
 
+    def _get_image_pool(self):
+        """图片写盘线程池，首次使用时创建，随转换器实例复用"""
+        pool = getattr(self, "_image_pool", None)
+        if pool is None:
+            pool = self._image_pool = ThreadPoolExecutor(max_workers=self.IMAGE_WORKERS)
+        return pool
+
     def _report(self, percent=-1, progress_text="", status_text=""):
         self.on_progress(percent, progress_text, status_text)
 
@@ -183,11 +195,14 @@ class PDFBatchExtractConverter:
         # OCR 客户端
         ocr_client = None
         if ocr_enabled:
-            ocr_client = BaiduOCRClient(api_key, secret_key)
+            ocr_client = get_shared_client(api_key, secret_key)
         ocr_dpi = self._ocr_mode_to_dpi(ocr_mode)
 
         processed_pages = 0
         dedupe_hashes = set()
+        # PyMuPDF 不支持多线程，提取仍在当前线程；格式转换和写盘交给线程池
+        image_pool = self._get_image_pool() if extract_images else None
+        pending_writes = deque()
 
         all_text_rows = []  # for csv/json
         summary = []
@@ -277,11 +292,7 @@ class PDFBatchExtractConverter:
                             img_bytes = extracted.get("image")
                             img_ext = extracted.get("ext", "bin")
 
-                            if image_format != "原格式":
-                                img_bytes, img_ext = self._convert_image_format(
-                                    img_bytes, image_format
-                                )
-
+                            # 按原始图片数据去重，保证先出现的图片被保留
                             if image_dedupe:
                                 h = hashlib.sha256(img_bytes).hexdigest()
                                 if h in dedupe_hashes:
@@ -295,10 +306,13 @@ class PDFBatchExtractConverter:
                             else:
                                 target_dir = per_pdf_img_dir
 
-                            filename = f"{base_name}_第{page_idx + 1}页_img{img_i}.{img_ext}"
-                            out_path = os.path.join(target_dir, filename)
-                            with open(out_path, "wb") as f:
-                                f.write(img_bytes)
+                            stem = os.path.join(
+                                target_dir, f"{base_name}_第{page_idx + 1}页_img{img_i}"
+                            )
+                            self._wait_writes(pending_writes, self.IMAGE_WORKERS * 4)
+                            pending_writes.append(image_pool.submit(
+                                self._write_image, img_bytes, img_ext, image_format, stem
+                            ))
                             per_pdf_images += 1
 
                     processed_pages += 1
@@ -312,6 +326,8 @@ class PDFBatchExtractConverter:
                     if ocr_used:
                         per_pdf_ocr_pages += 1
 
+                self._wait_writes(pending_writes)
+
                 # 写文本输出
                 if extract_text:
                     if text_format_norm == "txt":
@@ -353,6 +369,7 @@ class PDFBatchExtractConverter:
                 doc.close()
 
             except Exception as e:
+                pending_writes.clear()
                 result["errors"].append(f"处理失败: {pdf_path} ({e})")
 
         # 汇总输出
@@ -458,6 +475,20 @@ class PDFBatchExtractConverter:
                     pages.add(p - 1)
         return sorted(pages)
 
+    @staticmethod
+    def _wait_writes(pending, limit=0):
+        """等待最早提交的写盘任务，直到未完成任务不超过 limit 个；任务异常原样抛出"""
+        while len(pending) > limit:
+            pending.popleft().result()
+
+    @classmethod
+    def _write_image(cls, img_bytes, img_ext, image_format, stem):
+        """（线程池中执行）按需转换图片格式后写入 stem.<扩展名>"""
+        if image_format != "原格式":
+            img_bytes, img_ext = cls._convert_image_format(img_bytes, image_format)
+        with open(f"{stem}.{img_ext}", "wb") as f:
+            f.write(img_bytes)
+
     @staticmethod
     def _convert_image_format(img_bytes, target_format):
         target = target_format.upper()
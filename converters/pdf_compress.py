@@ -15,28 +15,7 @@ try:
 except ImportError:
     FITZ_AVAILABLE = False
 
-
-# 压缩级别预设：(图片质量, 目标DPI, garbage回收级别, deflate压缩)
-COMPRESS_PRESETS = {
-    '轻度压缩': {
-        'image_quality': 85,
-        'max_dpi': 200,
-        'garbage': 2,
-        'description': '文件略微减小，画质几乎无损',
-    },
-    '标准压缩': {
-        'image_quality': 60,
-        'max_dpi': 150,
-        'garbage': 3,
-        'description': '平衡文件大小与画质（推荐）',
-    },
-    '极限压缩': {
-        'image_quality': 30,
-        'max_dpi': 96,
-        'garbage': 4,
-        'description': '最大程度压缩，画质会明显下降',
-    },
-}
+from converters.constants import COMPRESS_PRESETS
 
 
 class PDFCompressConverter:
@@ -52,6 +52,7 @@ class PDFOCRConverter:
         self.on_progress = on_progress or (lambda *a: None)
         self._access_token = None
         self._token_time = 0
+        self._token_key = None
 
     def _report(self, percent=-1, progress_text="", status_text=""):
         self.on_progress(percent, progress_text, status_text)
@@ -246,7 +247,9 @@ class PDFOCRConverter:
 
     def _get_access_token(self, api_key, secret_key):
         """获取百度API access_token"""
-        if self._access_token and (time.time() - self._token_time) < 86400 * 25:
+        # 转换器实例会被复用，令牌需与当前密钥对应
+        if (self._access_token and self._token_key == (api_key, secret_key)
+                and (time.time() - self._token_time) < 86400 * 25):
             return self._access_token
         params = {
             "grant_type": "client_credentials",
@@ -261,6 +264,7 @@ class PDFOCRConverter:
                 f"百度API认证失败: {data.get('error_description', data)}")
         self._access_token = data["access_token"]
         self._token_time = time.time()
+        self._token_key = (api_key, secret_key)
         return self._access_token
 
     def _ocr_with_location(self, image_bytes, token, dpi):
@@ -1,11 +1,15 @@
 ﻿"""Batch PDF stamping converter."""
 
+import functools
 import io
 import json
 import logging
 import os
+from concurrent.futures import as_completed
 from datetime import datetime
 
+from core.process_pool import get_process_pool, reset_process_pool
+
 try:
     import fitz
     FITZ_AVAILABLE = True
@@ -13,7 +17,7 @@ except ImportError:
     FITZ_AVAILABLE = False
 
 try:
-    from PIL import Image, ImageEnhance, ImageChops
+    from PIL import Image, ImageChops
     PIL_AVAILABLE = True
 except ImportError:
     PIL_AVAILABLE = False
@@ -25,9 +29,30 @@ except ImportError:
     QRCODE_AVAILABLE = False
 
 
+@functools.lru_cache(maxsize=32)
+def _alpha_scale_table(factor):
+    """Lookup table that scales an alpha channel by ``factor``."""
+    return [int(v * factor + 0.5) for v in range(256)]
+
+
+@functools.lru_cache(maxsize=8)
+def _white_mask_table(threshold):
+    """Lookup table mapping a channel value to 255 when it counts as white."""
+    return [255 if v >= threshold else 0 for v in range(256)]
+
+
+def _stamp_one_file(pdf_path, options):
+    """Process-pool entry point: stamp a single PDF and return its outcome."""
+    return PDFBatchStampConverter()._stamp_file(pdf_path, **options)
+
+
 class PDFBatchStampConverter:
     """Batch PDF stamp converter (UI-decoupled)."""
 
+    # Files are independent, so larger batches are stamped in worker processes.
+    # Below this many readable files, process start-up costs more than it saves
+    PARALLEL_MIN_FILES = 4
+
     def __init__(self, on_progress=None):
         self.on_progress = on_progress or (lambda *a: None)
 
@@ -136,94 +161,72 @@ class PDFBatchStampConverter:
                 result["message"] = f"Template JSON parse failed: {e}"
                 return result
 
-        for file_idx, pdf_path in enumerate(readable_files, 1):
-            doc = None
-            try:
-                doc = fitz.open(pdf_path)
-                page_count = len(doc)
-                if has_page_filter:
-                    pages = [p for p in parsed_pages if p < page_count]
-                    if not pages:
-                        result["skipped_page_filtered"] += 1
-                        result["errors"].append(
-                            f"Skipped (no valid pages in file): {os.path.basename(pdf_path)}"
-                        )
-                        continue
-                else:
-                    pages = list(range(page_count))
-
-                if mode == "seal":
-                    for sp in normalized_profiles:
-                        image_bytes = self._image_with_opacity(
-                            sp["image_path"],
-                            opacity=sp["opacity"],
-                            remove_white_bg=remove_white_bg,
-                        )
-                        self._apply_seal(
-                            doc,
-                            pages,
-                            image_bytes,
-                            position=position,
-                            size_ratio=sp["size_ratio"],
-                            placement=sp.get("placement"),
-                        )
-                elif mode == "qr":
-                    qr_bytes = self._make_qr_png_bytes(
-                        qr_text.strip(),
-                        opacity=opacity,
-                        remove_white_bg=remove_white_bg,
-                    )
-                    self._apply_seal(
-                        doc,
-                        pages,
-                        qr_bytes,
-                        position=position,
-                        size_ratio=size_ratio,
-                        placement=placement,
-                    )
-                elif mode == "seam":
-                    for sp in normalized_profiles:
-                        self._apply_seam(
-                            doc,
-                            pages,
-                            sp["image_path"],
-                            side=seam_side,
-                            align=seam_align,
-                            overlap_ratio=seam_overlap_ratio,
-                            opacity=sp["opacity"],
-                            remove_white_bg=remove_white_bg,
-                            size_ratio=sp["size_ratio"],
-                        )
-                elif mode == "template":
-                    self._apply_template(
-                        doc,
-                        pages,
-                        template_obj,
-                        opacity_default=opacity,
-                        size_ratio_default=size_ratio,
-                        remove_white_bg=remove_white_bg,
-                    )
-                else:
-                    result["errors"].append(f"Unsupported mode: {mode}")
-                    continue
+        options = {
+            "mode": mode,
+            "parsed_pages": parsed_pages,
+            "has_page_filter": has_page_filter,
+            "normalized_profiles": normalized_profiles,
+            "opacity": opacity,
+            "position": position,
+            "size_ratio": size_ratio,
+            "qr_text": qr_text,
+            "seam_side": seam_side,
+            "seam_align": seam_align,
+            "seam_overlap_ratio": seam_overlap_ratio,
+            "template_obj": template_obj,
+            "placement": placement,
+            "remove_white_bg": remove_white_bg,
+        }
 
-                out_path = self._make_output_path(pdf_path, suffix="盖章")
-                doc.save(out_path, garbage=3, deflate=True)
-                result["output_files"].append(out_path)
-                result["file_count"] += 1
-                result["page_count"] += len(pages)
+        total = len(readable_files)
+        outcomes = [None] * total
+
+        def report_done(done, pdf_path):
+            self._report(
+                int((done / max(1, total)) * 100),
+                progress_text=f"Stamping {done}/{total}: {os.path.basename(pdf_path)}",
+                status_text=f"Processed {done}/{total} files",
+            )
+
+        futures = None
+        if total >= self.PARALLEL_MIN_FILES:
+            try:
+                pool = get_process_pool()
+                futures = {
+                    pool.submit(_stamp_one_file, pdf_path, options): idx
+                    for idx, pdf_path in enumerate(readable_files)
+                }
             except Exception as e:
-                logging.error("Stamp failed: %s: %s", pdf_path, e, exc_info=True)
-                result["errors"].append(f"Stamp failed: {os.path.basename(pdf_path)} ({e})")
-            finally:
-                if doc is not None:
-                    doc.close()
-                pct = int((file_idx / max(1, len(readable_files))) * 100)
-                self._report(
-                    pct,
-                    progress_text=f"Stamping {file_idx}/{len(readable_files)}: {os.path.basename(pdf_path)}",
-                    status_text=f"Processed {file_idx}/{len(readable_files)} files",
-                )
+                # No usable process pool (e.g. restricted environment): stamp serially
+                logging.warning("Process pool unavailable, stamping serially: %s", e)
+                reset_process_pool()
+                futures = None
+
+        if futures is not None:
+            for done, fut in enumerate(as_completed(futures), 1):
+                idx = futures[fut]
+                pdf_path = readable_files[idx]
+                try:
+                    outcomes[idx] = fut.result()
+                except Exception as e:
+                    logging.error("Stamp failed: %s: %s", pdf_path, e, exc_info=True)
+                    outcomes[idx] = {"error": f"Stamp failed: {os.path.basename(pdf_path)} ({e})"}
+                    reset_process_pool()
+                report_done(done, pdf_path)
+        else:
+            for idx, pdf_path in enumerate(readable_files):
+                outcomes[idx] = self._stamp_file(pdf_path, **options)
+                report_done(idx + 1, pdf_path)
+
+        for outcome in outcomes:
+            if outcome.get("skipped"):
+                result["skipped_page_filtered"] += 1
+            if outcome.get("error"):
+                result["errors"].append(outcome["error"])
+            if outcome.get("output_file"):
+                result["output_files"].append(outcome["output_file"])
+                result["file_count"] += 1
+                result["page_count"] += outcome["page_count"]
 
         result["error_count"] = len(result["errors"])
         result["success"] = result["file_count"] > 0
@@ -240,6 +243,103 @@ class PDFBatchStampConverter:
         self._report(100, progress_text="Batch stamping completed")
         return result
 
+    def _stamp_file(
+        self,
+        pdf_path,
+        mode,
+        parsed_pages,
+        has_page_filter,
+        normalized_profiles,
+        opacity,
+        position,
+        size_ratio,
+        qr_text,
+        seam_side,
+        seam_align,
+        seam_overlap_ratio,
+        template_obj,
+        placement,
+        remove_white_bg,
+    ):
+        """Stamp one PDF; returns {output_file, page_count} or {error[, skipped]}."""
+        doc = None
+        try:
+            doc = fitz.open(pdf_path)
+            page_count = len(doc)
+            if has_page_filter:
+                pages = [p for p in parsed_pages if p < page_count]
+                if not pages:
+                    return {
+                        "skipped": True,
+                        "error": f"Skipped (no valid pages in file): {os.path.basename(pdf_path)}",
+                    }
+            else:
+                pages = list(range(page_count))
+
+            if mode == "seal":
+                for sp in normalized_profiles:
+                    image_bytes = self._image_with_opacity(
+                        sp["image_path"],
+                        opacity=sp["opacity"],
+                        remove_white_bg=remove_white_bg,
+                    )
+                    self._apply_seal(
+                        doc,
+                        pages,
+                        image_bytes,
+                        position=position,
+                        size_ratio=sp["size_ratio"],
+                        placement=sp.get("placement"),
+                    )
+            elif mode == "qr":
+                qr_bytes = self._make_qr_png_bytes(
+                    qr_text.strip(),
+                    opacity=opacity,
+                    remove_white_bg=remove_white_bg,
+                )
+                self._apply_seal(
+                    doc,
+                    pages,
+                    qr_bytes,
+                    position=position,
+                    size_ratio=size_ratio,
+                    placement=placement,
+                )
+            elif mode == "seam":
+                for sp in normalized_profiles:
+                    self._apply_seam(
+                        doc,
+                        pages,
+                        sp["image_path"],
+                        side=seam_side,
+                        align=seam_align,
+                        overlap_ratio=seam_overlap_ratio,
+                        opacity=sp["opacity"],
+                        remove_white_bg=remove_white_bg,
+                        size_ratio=sp["size_ratio"],
+                    )
+            elif mode == "template":
+                self._apply_template(
+                    doc,
+                    pages,
+                    template_obj,
+                    opacity_default=opacity,
+                    size_ratio_default=size_ratio,
+                    remove_white_bg=remove_white_bg,
+                )
+            else:
+                return {"error": f"Unsupported mode: {mode}"}
+
+            out_path = self._make_output_path(pdf_path, suffix="盖章")
+            doc.save(out_path, garbage=3, deflate=True)
+            return {"output_file": out_path, "page_count": len(pages)}
+        except Exception as e:
+            logging.error("Stamp failed: %s: %s", pdf_path, e, exc_info=True)
+            return {"error": f"Stamp failed: {os.path.basename(pdf_path)} ({e})"}
+        finally:
+            if doc is not None:
+                doc.close()
+
     def _apply_seal(self, doc, pages, image_bytes, position, size_ratio, placement=None):
         img_size = self._image_size_from_bytes(image_bytes)
         for p in pages:
@@ -546,9 +646,8 @@ class PDFBatchStampConverter:
     def _apply_alpha(img_rgba, opacity):
         if img_rgba.mode != "RGBA":
             img_rgba = img_rgba.convert("RGBA")
-        alpha = img_rgba.getchannel("A")
-        alpha = ImageEnhance.Brightness(alpha).enhance(max(0.05, min(1.0, float(opacity))))
-        img_rgba.putalpha(alpha)
+        factor = max(0.05, min(1.0, float(opacity)))
+        img_rgba.putalpha(img_rgba.getchannel("A").point(_alpha_scale_table(factor)))
         return img_rgba
 
     @staticmethod
@@ -556,10 +655,9 @@ class PDFBatchStampConverter:
         if img_rgba.mode != "RGBA":
             img_rgba = img_rgba.convert("RGBA")
         r, g, b, a = img_rgba.split()
-        r_mask = r.point(lambda v: 255 if v >= threshold else 0)
-        g_mask = g.point(lambda v: 255 if v >= threshold else 0)
-        b_mask = b.point(lambda v: 255 if v >= threshold else 0)
-        white_mask = ImageChops.multiply(ImageChops.multiply(r_mask, g_mask), b_mask)
+        # A pixel is white when its darkest channel reaches the threshold
+        darkest = ImageChops.darker(ImageChops.darker(r, g), b)
+        white_mask = darkest.point(_white_mask_table(threshold))
         new_alpha = ImageChops.subtract(a, white_mask)
         img_rgba.putalpha(new_alpha)
         return img_rgba
@@ -655,9 +753,7 @@ class PDFBatchStampConverter:
         if remove_white_bg:
             img = PDFBatchStampConverter._remove_white_background(img)
         if opacity < 0.999:
-            alpha = img.getchannel("A")
-            alpha = ImageEnhance.Brightness(alpha).enhance(max(0.05, min(1.0, float(opacity))))
-            img.putalpha(alpha)
+            img = PDFBatchStampConverter._apply_alpha(img, opacity)
         buf = io.BytesIO()
         img.save(buf, format="PNG")
         return buf.getvalue()
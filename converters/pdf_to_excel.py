@@ -32,17 +32,7 @@ try:
 except ImportError:
     OPENPYXL_AVAILABLE = False
 
-from core.ocr_client import BaiduOCRClient, REQUESTS_AVAILABLE
-
-# 表格提取策略
-TABLE_STRATEGIES = {
-    "自动检测": {
-        "description": "先按表格线检测，若行数明显偏少自动回退为文本对齐",
-    },
-    "文本对齐": {
-        "description": "按文本位置对齐推断表格（适合无边框/线条断裂表格）",
-    },
-}
+from core.ocr_client import get_shared_client, REQUESTS_AVAILABLE
 
 
 class PDFToExcelConverter:
@@ -329,7 +319,7 @@ class PDFToExcelConverter:
 
     def _extract_tables_ocr(self, page, api_key, secret_key, ocr_mode="平衡"):
         """使用 OCR 表格识别，返回二维表格列表。"""
-        client = BaiduOCRClient(api_key, secret_key)
+        client = get_shared_client(api_key, secret_key)
         resolution = self._ocr_mode_to_resolution(ocr_mode)
         try:
             page_img = page.to_image(resolution=resolution).original
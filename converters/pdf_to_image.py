@@ -2,14 +2,19 @@
 PDF → 图片 批量转换器
 
 支持多文件批量转换，每个PDF输出到以文件名命名的文件夹。
+多文件时各PDF在子进程中并行渲染（PyMuPDF 不支持多线程）。
 通过 on_progress 回调报告进度，不直接操作UI。
 """
 
 import logging
 import os
 import time
+from concurrent.futures import as_completed
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 
+from core.process_pool import get_process_pool, reset_process_pool
+
 try:
     import fitz
     FITZ_AVAILABLE = True
@@ -17,6 +22,45 @@ except ImportError:
     FITZ_AVAILABLE = False
 
 
+def _page_span(page_count, use_range, start_page, end_page):
+    """返回 (s_idx, e_idx)：0-based 起始页与结束页（不含）"""
+    if not use_range:
+        return 0, page_count
+    s = max(1, min(start_page or 1, page_count))
+    e = max(s, min(end_page or page_count, page_count))
+    return s - 1, e
+
+
+def _render_one_file(pdf_path, output_dir, zoom, ext, img_format,
+                     use_range, start_page, end_page, on_page=None):
+    """渲染单个PDF的页范围到 output_dir，返回 (成功输出的页数, 错误信息或 None)。
+
+    也作为进程池任务入口，子进程中 on_page 为 None。单个文件的错误
+    （加密、损坏等）在这里捕获并作为结果返回，不让任务抛出异常。
+    """
+    done = 0
+    try:
+        doc = fitz.open(pdf_path)
+        try:
+            s_idx, e_idx = _page_span(len(doc), use_range, start_page, end_page)
+            mat = fitz.Matrix(zoom, zoom)
+            for page_idx in range(s_idx, e_idx):
+                pix = doc[page_idx].get_pixmap(matrix=mat, alpha=False)
+                img_path = os.path.join(output_dir, f"{page_idx + 1}{ext}")
+                if img_format == "JPEG":
+                    pix.save(img_path, jpg_quality=95)
+                else:
+                    pix.save(img_path)
+                done += 1
+                if on_page is not None:
+                    on_page(page_idx + 1)
+        finally:
+            doc.close()
+    except Exception as e:
+        return done, str(e)
+    return done, None
+
+
 class PDFToImageConverter:
     """PDF→图片 批量转换器，与 UI 完全解耦。
 
@@ -33,6 +77,11 @@ class PDFToImageConverter:
         """
         self.on_progress = on_progress or (lambda *a: None)
 
+    # 至少这么多个文件且总页数达到 PARALLEL_MIN_PAGES 时才启用进程池，
+    # 否则子进程启动开销大于并行收益（并行时进度也只能按文件粒度汇报）
+    PARALLEL_MIN_FILES = 4
+    PARALLEL_MIN_PAGES = 40
+
     def _report(self, percent=-1, progress_text="", status_text=""):
         self.on_progress(percent, progress_text, status_text)
 
@@ -86,19 +135,15 @@ class PDFToImageConverter:
         # 计算实际处理页数（考虑页范围）
         use_range = start_page is not None or end_page is not None
         total_pages_all = 0
-        file_page_counts = []
+        file_spans = []   # 每个文件实际要转换的页数
         for f in files:
             try:
                 doc = fitz.open(f)
                 count = len(doc)
                 doc.close()
-                file_page_counts.append(count)
-                if use_range:
-                    s = max(1, min(start_page or 1, count))
-                    e = max(s, min(end_page or count, count))
-                    total_pages_all += (e - s + 1)
-                else:
-                    total_pages_all += count
+                s_idx, e_idx = _page_span(count, use_range, start_page, end_page)
+                file_spans.append(e_idx - s_idx)
+                total_pages_all += e_idx - s_idx
             except Exception as e:
                 result['message'] = f"无法打开: {os.path.basename(f)}\n{e}"
                 return result
@@ -110,7 +155,7 @@ class PDFToImageConverter:
         output_dirs = []
         errors = []
 
-        for file_idx, pdf_path in enumerate(files):
+        for pdf_path in files:
             basename = os.path.splitext(os.path.basename(pdf_path))[0]
             output_dir = os.path.join(os.path.dirname(pdf_path), basename)
 
@@ -121,49 +166,78 @@ class PDFToImageConverter:
             os.makedirs(output_dir, exist_ok=True)
             output_dirs.append(output_dir)
 
+        render_args = (zoom, ext, img_format, use_range, start_page, end_page)
+        futures = None
+        if (len(files) >= self.PARALLEL_MIN_FILES
+                and total_pages_all >= self.PARALLEL_MIN_PAGES):
             try:
-                doc = fitz.open(pdf_path)
-                page_count = len(doc)
-
-                # 确定页范围
-                s_idx = 0
-                e_idx = page_count
-                if use_range:
-                    s = start_page if start_page else 1
-                    e = end_page if end_page else page_count
-                    s = max(1, min(s, page_count))
-                    e = max(s, min(e, page_count))
-                    s_idx = s - 1
-                    e_idx = e
-
-                file_label = os.path.basename(pdf_path)
-                for page_idx in range(s_idx, e_idx):
-                    page = doc[page_idx]
-                    mat = fitz.Matrix(zoom, zoom)
-                    pix = page.get_pixmap(matrix=mat, alpha=False)
-
-                    img_filename = f"{page_idx + 1}{ext}"
-                    img_path = os.path.join(output_dir, img_filename)
-
-                    if img_format == "JPEG":
-                        pix.save(img_path, jpg_quality=95)
-                    else:
-                        pix.save(img_path)
-
-                    processed += 1
-                    progress = int(processed / total_pages_all * 100)
-                    page_num = page_idx + 1
-                    self._report(
-                        percent=progress,
-                        progress_text=f"[{file_idx+1}/{len(files)}] {file_label} - "
-                                      f"第{page_num}页 ({progress}%)",
-                        status_text=f"正在转换: {file_label}",
-                    )
-
-                doc.close()
+                pool = get_process_pool()
+                futures = {
+                    pool.submit(_render_one_file, pdf_path, output_dir, *render_args): idx
+                    for idx, (pdf_path, output_dir) in enumerate(zip(files, output_dirs))
+                }
             except Exception as e:
-                errors.append(f"{os.path.basename(pdf_path)}: {str(e)}")
-                logging.error(f"PDF转图片失败 [{pdf_path}]: {e}")
+                logging.warning(f"进程池不可用，改为逐个转换: {e}")
+                reset_process_pool()
+                futures = None
+
+        finished_pages = 0   # 已处理完的页数（含失败文件的页数，保证进度能走满）
+        serial_indices = range(len(files))
+        if futures is not None:
+            # 并行模式：按文件完成情况汇报进度
+            serial_indices = []
+            done_files = 0
+            for fut in as_completed(futures):
+                idx = futures[fut]
+                try:
+                    done, error = fut.result()
+                except BrokenProcessPool:
+                    # 子进程意外退出：未完成的文件稍后在本进程中逐个重做
+                    serial_indices.append(idx)
+                    continue
+                except Exception as e:
+                    done, error = 0, str(e)
+                pdf_path = files[idx]
+                file_label = os.path.basename(pdf_path)
+                processed += done
+                if error:
+                    errors.append(f"{file_label}: {error}")
+                    logging.error(f"PDF转图片失败 [{pdf_path}]: {error}")
+                done_files += 1
+                finished_pages += file_spans[idx]
+                progress = int(finished_pages / total_pages_all * 100)
+                self._report(
+                    percent=progress,
+                    progress_text=f"[{done_files}/{len(files)}] {file_label} 完成 ({progress}%)",
+                    status_text=f"已完成 {done_files}/{len(files)} 个文件",
+                )
+            if serial_indices:
+                logging.warning(f"进程池异常中断，剩余 {len(serial_indices)} 个文件改为逐个转换")
+                reset_process_pool()
+                serial_indices.sort()
+
+        for file_idx in serial_indices:
+            pdf_path, output_dir = files[file_idx], output_dirs[file_idx]
+            file_label = os.path.basename(pdf_path)
+            file_start = finished_pages
+
+            def on_page(page_num, file_idx=file_idx, file_label=file_label):
+                nonlocal processed, finished_pages
+                processed += 1
+                finished_pages += 1
+                progress = int(finished_pages / total_pages_all * 100)
+                self._report(
+                    percent=progress,
+                    progress_text=f"[{file_idx+1}/{len(files)}] {file_label} - "
+                                  f"第{page_num}页 ({progress}%)",
+                    status_text=f"正在转换: {file_label}",
+                )
+
+            _, error = _render_one_file(pdf_path, output_dir, *render_args, on_page=on_page)
+            finished_pages = file_start + file_spans[file_idx]
+            if error:
+                errors.append(f"{file_label}: {error}")
+                logging.error(f"PDF转图片失败 [{pdf_path}]: {error}")
 
         result['success'] = len(errors) == 0 or processed > 0
         result['output_dirs'] = output_dirs
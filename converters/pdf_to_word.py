@@ -29,7 +29,7 @@ from core.math_utils import (
     is_display_equation, get_block_text,
     latex_to_omml, insert_omml_to_paragraph,
 )
-from core.ocr_client import BaiduOCRClient, REQUESTS_AVAILABLE
+from core.ocr_client import get_shared_client, REQUESTS_AVAILABLE
 from core.progress_converter import ProgressConverter, PDF2DOCX_AVAILABLE
 
 
@@ -143,7 +143,7 @@ class PDFToWordConverter:
             math_doc.close()
             if math_pages:
                 self._report(progress_text="正在调用API识别公式...")
-                client = BaiduOCRClient(api_key, secret_key)
+                client = get_shared_client(api_key, secret_key)
                 formula_count = self._post_process_formula_api(
                     output_file, input_file, math_pages, client, xslt_path)
                 result['formula_count'] = formula_count
@@ -167,7 +167,7 @@ class PDFToWordConverter:
         range_total = actual_end - start_page
         result['page_count'] = range_total
 
-        client = BaiduOCRClient(api_key, secret_key)
+        client = get_shared_client(api_key, secret_key)
         doc = Document()
         formula_count = 0
         ocr_errors = []
@@ -294,12 +294,7 @@ class PDFWatermarkConverter:
         rect = page.rect
         try:
             if PIL_AVAILABLE:
-                pil_img = PILImage.open(image_path).convert("RGBA")
-                alpha = pil_img.split()[3]
-                alpha = alpha.point(lambda a: int(a * opacity))
-                pil_img.putalpha(alpha)
-                if abs(float(rotation)) > 0.01:
-                    pil_img = pil_img.rotate(float(rotation), expand=True, resample=PILImage.BICUBIC)
+                pil_img, png_cache = self._prepare_watermark_image(image_path, opacity, rotation)
                 img_w, img_h = pil_img.size
             else:
                 with open(image_path, "rb") as f:
@@ -331,7 +326,6 @@ class PDFWatermarkConverter:
                 # 与预览窗口一致：平铺时以页面宽度的 22% 作为基准宽度，再叠加 size_scale
                 scaled_w = max(16, rect.width * 0.22 * size_scale)
                 scaled_h = max(16, scaled_w * img_h / max(1, img_w))
-                resized_cache = {}
                 for cx, cy, row, col in self._iter_positions(
                     page_w=rect.width,
                     page_h=rect.height,
@@ -350,21 +344,20 @@ class PDFWatermarkConverter:
                     cur_w = max(10, int(scaled_w * factor))
                     cur_h = max(10, int(scaled_h * factor))
                     key = (cur_w, cur_h)
-                    if key not in resized_cache:
-                        render_img = pil_img.resize((cur_w, cur_h), PILImage.LANCZOS)
-                        buf = io.BytesIO()
-                        render_img.save(buf, format="PNG")
-                        resized_cache[key] = buf.getvalue()
+                    if key not in png_cache:
+                        png_cache[key] = self._pil_to_png_bytes(
+                            pil_img.resize((cur_w, cur_h), PILImage.LANCZOS))
                     x = cx - cur_w / 2
                     y = cy - cur_h / 2
                     target = fitz.Rect(x, y, x + cur_w, y + cur_h)
-                    page.insert_image(target, stream=resized_cache[key], overlay=True)
+                    page.insert_image(target, stream=png_cache[key], overlay=True)
             else:
                 # 与预览窗口一致：单点模式以页面宽度的 33% 作为基准宽度
                 scaled_w = max(16, rect.width * 0.33 * size_scale)
                 scaled_h = max(16, scaled_w * img_h / max(1, img_w))
-                buf = io.BytesIO()
-                pil_img.resize((max(10, int(scaled_w)), max(10, int(scaled_h))), PILImage.LANCZOS).save(buf, format="PNG")
+                key = (max(10, int(scaled_w)), max(10, int(scaled_h)))
+                if key not in png_cache:
+                    png_cache[key] = self._pil_to_png_bytes(pil_img.resize(key, PILImage.LANCZOS))
                 x0, y0 = self._single_anchor_xy(
                     rect=rect,
                     position=position,
@@ -372,12 +365,31 @@ class PDFWatermarkConverter:
                     item_h=max(10, int(scaled_h)),
                 )
                 target = fitz.Rect(x0, y0, x0 + max(10, int(scaled_w)), y0 + max(10, int(scaled_h)))
-                page.insert_image(target, stream=buf.getvalue())
+                page.insert_image(target, stream=png_cache[key])
 
         except Exception as e:
             logging.error(f"添加图片水印失败: {e}")
             raise
 
+    def _prepare_watermark_image(self, image_path, opacity, rotation):
+        """读取水印图片并应用透明度与旋转，返回 (图片, {(宽, 高): PNG字节})。
+
+        各页使用相同参数，结果按 (路径, 修改时间, 透明度, 角度) 缓存，
+        各尺寸的缩放结果也随之在页间复用。
+        """
+        key = (image_path, os.path.getmtime(image_path), float(opacity), float(rotation))
+        cached = getattr(self, "_watermark_image_cache", None)
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+        pil_img = PILImage.open(image_path).convert("RGBA")
+        # 透明度用 256 项查找表一次映射 alpha 通道
+        lut = [int(a * opacity) for a in range(256)]
+        pil_img.putalpha(pil_img.getchannel("A").point(lut))
+        if abs(float(rotation)) > 0.01:
+            pil_img = pil_img.rotate(float(rotation), expand=True, resample=PILImage.BICUBIC)
+        self._watermark_image_cache = (key, pil_img, {})
+        return pil_img, self._watermark_image_cache[2]
+
     @staticmethod
     def _is_tile_mode(position):
         return str(position).startswith("tile")
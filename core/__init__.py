@@ -2,13 +2,45 @@
 
 __version__ = "1.0.0"
 
+import functools
 import sys
 import os
 
 
+@functools.lru_cache(maxsize=1)
 def get_app_dir():
-    """获取应用程序目录（兼容PyInstaller打包）"""
+    """获取应用程序目录（兼容PyInstaller打包），结果在进程内缓存"""
     if getattr(sys, 'frozen', False):
         return os.path.dirname(sys.executable)
     # core/ 包的上一层即项目根目录
     return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def copy_file_fast(src, dst):
+    """复制文件，优先使用系统级快速复制，失败时退回 shutil.copyfile。
+
+    Windows 使用 CopyFileW（由系统完成复制，ReFS 上可块克隆）；
+    Linux 使用 os.copy_file_range（支持的文件系统上可 reflink）。
+    """
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        return dst
+    if sys.platform == 'win32':
+        import ctypes
+        if ctypes.windll.kernel32.CopyFileW(str(src), str(dst), False):
+            return dst
+    elif hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fin, open(dst, 'wb') as fout:
+                remaining = os.fstat(fin.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fin.fileno(), fout.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                return dst
+        except OSError:
+            pass
+    import shutil
+    shutil.copyfile(src, dst)
+    return dst
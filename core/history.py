@@ -2,11 +2,15 @@
 转换历史记录管理
 
 保存在 conversion_history.json 中，最多保留100条。
+新增记录由后台线程写盘，连续多条记录只写最后一次。
 """
 
 import json
 import logging
 import os
+import queue
+import threading
+import time
 from datetime import datetime
 
 from core import get_app_dir
@@ -16,10 +20,18 @@ class ConversionHistory:
     """管理转换历史记录"""
 
     MAX_RECORDS = 100
+    # 后台写盘的合并窗口：最多攒 SAVE_BATCH_SIZE 条或等待 SAVE_BATCH_WINDOW 秒
+    SAVE_BATCH_SIZE = 16
+    SAVE_BATCH_WINDOW = 0.5
 
     def __init__(self):
         self.history_file = os.path.join(get_app_dir(), "conversion_history.json")
         self._records = []
+        self._lock = threading.Lock()
+        # 写盘锁：保证复制记录与写文件整体串行，后写入的一定是较新的记录
+        self._write_lock = threading.Lock()
+        self._save_q = queue.Queue()
+        self._writer = None
         self.load()
 
     def load(self):
@@ -34,11 +46,47 @@ class ConversionHistory:
 
     def save(self):
         """保存历史记录到文件"""
-        try:
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(self._records, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            logging.error(f"保存历史记录失败: {e}")
+        with self._write_lock:
+            with self._lock:
+                records = list(self._records)
+            try:
+                with open(self.history_file, 'w', encoding='utf-8') as f:
+                    json.dump(records, f, ensure_ascii=False, indent=2)
+            except Exception as e:
+                logging.error(f"保存历史记录失败: {e}")
+
+    def _schedule_save(self):
+        """通知后台线程写盘（首次调用时启动线程）"""
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+            self._writer.start()
+        self._save_q.put(None)
+
+    def _writer_loop(self):
+        while True:
+            self._save_q.get()
+            pending = 1
+            # 合并窗口内到达的写盘请求，只写一次
+            deadline = time.monotonic() + self.SAVE_BATCH_WINDOW
+            while pending < self.SAVE_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    self._save_q.get(timeout=remaining)
+                    pending += 1
+                except queue.Empty:
+                    break
+            try:
+                self.save()
+            finally:
+                for _ in range(pending):
+                    self._save_q.task_done()
+
+    def flush(self):
+        """等待排队中的写盘完成（退出程序前调用）"""
+        if self._writer is not None:
+            self._save_q.join()
 
     def add(self, record):
         """添加一条记录
@@ -55,19 +103,22 @@ class ConversionHistory:
         """
         if 'timestamp' not in record:
             record['timestamp'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self._records.insert(0, record)
-        # 限制最大记录数
-        if len(self._records) > self.MAX_RECORDS:
-            self._records = self._records[:self.MAX_RECORDS]
-        self.save()
+        with self._lock:
+            self._records.insert(0, record)
+            # 限制最大记录数
+            if len(self._records) > self.MAX_RECORDS:
+                self._records = self._records[:self.MAX_RECORDS]
+        self._schedule_save()
 
     def get_all(self):
         """获取所有记录"""
-        return list(self._records)
+        with self._lock:
+            return list(self._records)
 
     def clear(self):
         """清空历史记录"""
-        self._records = []
+        with self._lock:
+            self._records = []
         self.save()
 
     @property
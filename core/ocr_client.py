@@ -5,8 +5,10 @@
 """
 
 import base64
+import functools
 import io
 import logging
+import threading
 import time
 
 try:
@@ -60,17 +62,34 @@ class BaiduOCRClient:
         self.secret_key = secret_key
         self._access_token = None
         self._token_time = 0
+        self._token_lock = threading.Lock()
+        self._session = None
+
+    def _post(self, url, **kwargs):
+        """经由复用的 requests.Session 发送 POST，多次请求共用 HTTP 连接"""
+        if self._session is None:
+            self._session = requests.Session()
+        return self._session.post(url, **kwargs)
+
+    def _token_valid(self):
+        return self._access_token and (time.time() - self._token_time) < 86400 * 25
 
     def _get_access_token(self):
         """获取百度API access_token（有效期30天，自动缓存）"""
-        if self._access_token and (time.time() - self._token_time) < 86400 * 25:
+        if self._token_valid():
             return self._access_token
+        with self._token_lock:
+            if self._token_valid():
+                return self._access_token  # 等锁期间已由其他线程刷新
+            return self._fetch_access_token()
+
+    def _fetch_access_token(self):
         params = {
             "grant_type": "client_credentials",
             "client_id": self.api_key,
             "client_secret": self.secret_key,
         }
-        resp = requests.post(self.TOKEN_URL, params=params, timeout=10)
+        resp = self._post(self.TOKEN_URL, params=params, timeout=10)
         resp.raise_for_status()
         data = resp.json()
         if "access_token" not in data:
@@ -163,7 +182,7 @@ class BaiduOCRClient:
             "detect_direction": "true",
             "paragraph": "true",
         }
-        resp = requests.post(
+        resp = self._post(
             f"{self.OCR_URL}?access_token={token}",
             headers=headers, data=data, timeout=60
         )
@@ -217,7 +236,7 @@ class BaiduOCRClient:
             "image": img_b64,
             "recognize_granularity": "big",
         }
-        resp = requests.post(
+        resp = self._post(
             f"{self.FORMULA_URL}?access_token={token}",
             headers=headers, data=data, timeout=60
         )
@@ -251,7 +270,7 @@ class BaiduOCRClient:
             "return_excel": "true" if return_excel else "false",
             "cell_contents": "true" if cell_contents else "false",
         }
-        resp = requests.post(
+        resp = self._post(
             f"{self.TABLE_URL}?access_token={token}",
             headers=headers, data=data, timeout=60
         )
@@ -262,3 +281,9 @@ class BaiduOCRClient:
             raise RuntimeError(f"表格识别失败[{result.get('error_code')}]: "
                                f"{result.get('error_msg', result)}")
         return result
+
+
+@functools.lru_cache(maxsize=4)
+def get_shared_client(api_key, secret_key):
+    """按 API Key 复用客户端，access_token 与 HTTP 连接在多次转换之间共享"""
+    return BaiduOCRClient(api_key, secret_key)
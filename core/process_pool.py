@@ -0,0 +1,46 @@
+"""
+转换器共用的进程池。
+
+PyMuPDF 不支持多线程并发操作，因此多文件批处理改用子进程并行，
+进程池在首次使用时创建并在后续批次中复用。
+"""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+_POOL = None
+
+
+def get_process_pool():
+    """获取（必要时创建）共用进程池"""
+    global _POOL
+    if _POOL is None:
+        _POOL = ProcessPoolExecutor(max_workers=max(1, os.cpu_count() or 1))
+    return _POOL
+
+
+def reset_process_pool():
+    """丢弃已损坏的进程池，下次使用时重新创建"""
+    global _POOL
+    pool, _POOL = _POOL, None
+    if pool is not None:
+        try:
+            pool.shutdown(wait=False)
+        except Exception as e:
+            logging.warning(f"关闭进程池失败: {e}")
+
+
+def shutdown_process_pool():
+    """程序退出时关闭共用进程池，不等待也不再执行排队中的任务"""
+    global _POOL
+    pool, _POOL = _POOL, None
+    if pool is None:
+        return
+    try:
+        pool.shutdown(wait=False, cancel_futures=True)
+    except TypeError:
+        # Python 3.8 不支持 cancel_futures
+        pool.shutdown(wait=False)
+    except Exception as e:
+        logging.warning(f"关闭进程池失败: {e}")
@@ -12,6 +12,7 @@ PDF转换工具 — 主入口
 """
 
 import logging
+import multiprocessing
 import os
 import sys
 import tkinter as tk
@@ -44,4 +45,6 @@ def main():
     root.mainloop()
 
 if __name__ == "__main__":
+    # 批量盖章、PDF转图片使用进程池，PyInstaller 打包后需要此调用
+    multiprocessing.freeze_support()
     main()
@@ -5,51 +5,63 @@ PDF转换工具主应用类
 转换逻辑委托给 converters/ 模块。
 """
 
+import functools
+import hashlib
+import importlib.util
 import io
 import json
 import logging
+import marshal
 import os
+import queue
 import random
-import shutil
 import sys
 import threading
 import time
 import tkinter as tk
-from datetime import datetime
+from collections import deque
+from itertools import islice
 from tkinter import ttk, filedialog, messagebox
+from tkinter import font as tkfont
 
-from core import get_app_dir
-from core.ocr_client import simple_encrypt, simple_decrypt, BaiduOCRClient, REQUESTS_AVAILABLE
-from core.progress_converter import PDF2DOCX_AVAILABLE
+from core import get_app_dir, copy_file_fast
+from core.ocr_client import simple_encrypt, simple_decrypt, get_shared_client, REQUESTS_AVAILABLE
 from core.history import ConversionHistory
-from converters.pdf_to_word import PDFToWordConverter
-from converters.pdf_to_image import PDFToImageConverter
-from converters.pdf_merge import PDFMergeConverter
-from converters.pdf_split import PDFSplitConverter
-from converters.image_to_pdf import ImageToPDFConverter, SUPPORTED_IMAGE_EXTS
-from converters.pdf_watermark import PDFWatermarkConverter
-from converters.pdf_encrypt import PDFEncryptConverter
-from converters.pdf_compress import PDFCompressConverter, COMPRESS_PRESETS
-from converters.pdf_extract import PDFExtractConverter
-from converters.pdf_ocr import PDFOCRConverter
-from converters.pdf_to_excel import PDFToExcelConverter, TABLE_STRATEGIES
-from converters.pdf_batch_extract import PDFBatchExtractConverter
-from converters.pdf_stamp_batch import PDFBatchStampConverter
-from converters.pdf_sign_batch import PDFBatchSignConverter
-from converters.pdf_reorder import PDFReorderConverter
-from converters.pdf_bookmark import PDFBookmarkConverter
+from core.process_pool import shutdown_process_pool
+from converters.constants import SUPPORTED_IMAGE_EXTS, COMPRESS_PRESETS, TABLE_STRATEGIES
+
+# 转换器依赖 pdf2docx / pdfplumber / openpyxl 等较重的库，按类名登记所在模块，
+# 首次用到时才由 _load_converter() 导入
+_CONVERTER_MODULES = {
+    "PDFToWordConverter": "converters.pdf_to_word",
+    "PDFToImageConverter": "converters.pdf_to_image",
+    "PDFMergeConverter": "converters.pdf_merge",
+    "PDFSplitConverter": "converters.pdf_split",
+    "ImageToPDFConverter": "converters.image_to_pdf",
+    "PDFWatermarkConverter": "converters.pdf_watermark",
+    "PDFEncryptConverter": "converters.pdf_encrypt",
+    "PDFCompressConverter": "converters.pdf_compress",
+    "PDFExtractConverter": "converters.pdf_extract",
+    "PDFOCRConverter": "converters.pdf_ocr",
+    "PDFToExcelConverter": "converters.pdf_to_excel",
+    "PDFBatchExtractConverter": "converters.pdf_batch_extract",
+    "PDFBatchStampConverter": "converters.pdf_stamp_batch",
+    "PDFBatchSignConverter": "converters.pdf_sign_batch",
+    "PDFReorderConverter": "converters.pdf_reorder",
+    "PDFBookmarkConverter": "converters.pdf_bookmark",
+}
 
-try:
-    from PIL import Image, ImageTk, ImageDraw, ImageFont
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+# pdf2docx 启动时只探测是否安装，真正导入推迟到PDF转Word转换时
+PDF2DOCX_AVAILABLE = all(importlib.util.find_spec(m) is not None
+                         for m in ("pdf2docx", "docx", "fitz"))
 
-try:
-    import fitz
-    FITZ_UI_AVAILABLE = True
-except ImportError:
-    FITZ_UI_AVAILABLE = False
+# Pillow 较重，启动时只探测是否安装，首次用到图片功能时由 _load_pil() 导入
+PIL_AVAILABLE = importlib.util.find_spec("PIL") is not None
+Image = ImageDraw = ImageFont = ImageTk = None
+
+# PyMuPDF 同样按需导入，见 _load_fitz()
+FITZ_UI_AVAILABLE = importlib.util.find_spec("fitz") is not None
+fitz = None
 
 # 拖拽支持（可选依赖）
 try:
@@ -58,6 +70,20 @@ try:
 except ImportError:
     WINDND_AVAILABLE = False
 
+# 更快的 JSON 编解码（可选依赖），用于 settings.json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# SIMD 图片缩放（可选依赖），用于窗口背景图
+try:
+    from pic_scale import resize as ps_resize, Resampling as PSResampling
+    PIC_SCALE_AVAILABLE = True
+except ImportError:
+    PIC_SCALE_AVAILABLE = False
+
 
 # 所有支持的功能列表
 ALL_FUNCTIONS = [
@@ -67,6 +93,24 @@ ALL_FUNCTIONS = [
     "PDF页面重排/旋转/倒序", "PDF添加/移除书签",
 ]
 
+# 压缩级别 / 表格提取策略 → 说明文字（切换单选按钮时直接查表）
+COMPRESS_DESCRIPTIONS = {k: v['description'] for k, v in COMPRESS_PRESETS.items()}
+TABLE_STRATEGY_DESCRIPTIONS = {k: v['description'] for k, v in TABLE_STRATEGIES.items()}
+
+# 支持多文件、可显示"排序"按钮的功能
+ORDER_BTN_FUNCTIONS = frozenset({
+    "图片转PDF", "PDF合并", "PDF转Word", "PDF转图片", "PDF批量文本/图片提取", "PDF批量盖章",
+})
+# 浏览文件时可多选PDF的功能
+MULTI_PDF_FUNCTIONS = frozenset({
+    "PDF转Word", "PDF转图片", "PDF合并", "PDF批量文本/图片提取", "PDF批量盖章",
+})
+# 浏览文件时只能单选PDF的功能（PDF拆分单独处理）
+SINGLE_PDF_FUNCTIONS = frozenset({
+    "PDF加水印", "PDF加密/解密", "PDF压缩", "PDF提取/删页", "OCR可搜索PDF",
+    "PDF转Excel", "PDF页面重排/旋转/倒序", "PDF添加/移除书签",
+})
+
 BATCH_REGEX_TEMPLATES = [
     ("不使用模板", ""),
     ("包含数字", r"\d+"),
@@ -102,10 +146,272 @@ WATERMARK_POSITION_TO_MODE = {
     "右下角": ("bottom-right", "grid"),
 }
 
+# 界面选项文字 → 转换器参数
+STAMP_MODE_TO_KEY = {
+    "普通章": "seal",
+    "二维码": "qr",
+    "骑缝章": "seam",
+    "模板": "template",
+    "签名": "signature",
+}
+SEAM_SIDE_TO_KEY = {"右侧": "right", "左侧": "left", "顶部": "top", "底部": "bottom"}
+SEAM_ALIGN_TO_KEY = {"居中": "center", "顶部": "top", "底部": "bottom"}
+SPLIT_MODE_TO_KEY = {
+    "每页一个PDF": "every_page",
+    "每N页一个PDF": "by_interval",
+    "按范围拆分": "by_ranges",
+}
+REORDER_MODE_TO_KEY = {
+    "页面重排": "reorder",
+    "页面旋转": "rotate",
+    "页面倒序": "reverse",
+}
+BOOKMARK_MODE_TO_KEY = {
+    "添加书签": "add",
+    "移除书签": "remove",
+    "导入JSON": "import_json",
+    "导出JSON": "export_json",
+    "清空书签": "clear",
+    "自动生成": "auto",
+}
+
+# 模式切换时的控件配置表：提示文字及各控件状态
+STAMP_MODE_CONFIG = {
+    "seal": {
+        "hint": "普通章：支持多个章图，预览中勾选章图并拖拽定位，可调透明度和缩放。",
+        "qr_entry": "disabled", "seam_combo": "disabled", "seam_overlap": "disabled", "export_btn": "normal",
+    },
+    "signature": {
+        "hint": "签名：支持多个签名，预览中可翻页勾选签名并逐页拖拽定位、缩放、调透明度。",
+        "qr_entry": "disabled", "seam_combo": "disabled", "seam_overlap": "disabled", "export_btn": "disabled",
+    },
+    "qr": {
+        "hint": "二维码：输入内容后可在预览中拖拽位置并调整透明度。",
+        "qr_entry": "normal", "seam_combo": "disabled", "seam_overlap": "disabled", "export_btn": "normal",
+    },
+    "seam": {
+        "hint": "骑缝章：支持多个章图，预览中勾选章图并查看切片效果。",
+        "qr_entry": "disabled", "seam_combo": "readonly", "seam_overlap": "normal", "export_btn": "normal",
+    },
+    "template": {
+        "hint": "模板：按 JSON 模板批量盖章；可预览模板元素效果。",
+        "qr_entry": "disabled", "seam_combo": "disabled", "seam_overlap": "disabled", "export_btn": "normal",
+    },
+}
+# (参数输入框状态, 参数标签, 参数说明, 参数值处理: "clear" 清空 / "default" 为空时填默认值)
+SPLIT_MODE_CONFIG = {
+    "每页一个PDF": ("disabled", "", "每页将生成一个独立PDF文件", "clear"),
+    "每N页一个PDF": ("normal", "N =", "页/文件", "default"),
+    "按范围拆分": ("normal", "范围:", "如: 1-3,4-6,7-10", "clear"),
+}
+# (密码标签文字, 是否显示权限密码及权限选项)
+ENCRYPT_MODE_CONFIG = {
+    "加密": ("打开密码:", True),
+    "解密": ("密码:", False),
+}
+# 加密/解密模式 → (转换器方法名, 参数构造方法名, 功能名称)
+ENCRYPT_ACTIONS = {
+    "加密": ("encrypt", "_encrypt_kwargs", "PDF加密"),
+    "解密": ("decrypt", "_decrypt_kwargs", "PDF解密"),
+}
+# pdf2docx 进度阶段 → 阶段文字；状态栏页进度文字的格式化函数（按阶段预先生成）
+PROGRESS_PHASE_TEXT = {
+    'start-parse': "解析", 'skip-parse': "解析", 'parse': "解析",
+    'start-make': "生成", 'skip-make': "生成", 'make': "生成",
+}
+PAGE_STATUS_FORMATS = {
+    "解析": "正在解析第 {} 页，共 {} 页".format,
+    "生成": "正在生成第 {} 页，共 {} 页".format,
+}
+# 文件对话框的类型过滤（不可变元组，各对话框共用）
+IMAGE_FILETYPES = (("图片文件", "*.png;*.jpg;*.jpeg;*.bmp"), ("所有文件", "*.*"))
+JSON_FILETYPES = (("JSON文件", "*.json"), ("所有文件", "*.*"))
+PDF_FILETYPES = (("PDF文件", "*.pdf"), ("所有文件", "*.*"))
+# 进度条/进度文本/按钮/拖拽提示的默认 y 坐标
+DEFAULT_PANEL_LAYOUT = (290, 325, 370, 410)
+# 功能 → (文件区标题, 选项区标题, 布局 y 坐标, 切换后调用的方法名)
+FUNCTION_PANEL_CONFIG = {
+    "PDF转Word": ("选择PDF文件（可多选）", "页范围（可选）", DEFAULT_PANEL_LAYOUT, None),
+    "PDF转图片": ("选择PDF文件（可多选）", "页范围（可选）", DEFAULT_PANEL_LAYOUT, None),
+    "PDF合并": ("选择PDF文件（至少2个）", "文件信息", DEFAULT_PANEL_LAYOUT, "_reset_merge_info"),
+    "PDF拆分": ("选择PDF文件", "拆分选项", DEFAULT_PANEL_LAYOUT, "_on_split_mode_changed"),
+    "图片转PDF": ("选择图片文件（可多选）", "输出选项", DEFAULT_PANEL_LAYOUT, None),
+    "PDF加水印": ("选择PDF文件", "水印选项", DEFAULT_PANEL_LAYOUT, None),
+    "PDF加密/解密": ("选择PDF文件", "加密/解密选项", DEFAULT_PANEL_LAYOUT, "_on_encrypt_mode_changed"),
+    "PDF压缩": ("选择PDF文件", "压缩选项", DEFAULT_PANEL_LAYOUT, None),
+    "PDF提取/删页": ("选择PDF文件", "提取/删页选项", DEFAULT_PANEL_LAYOUT, None),
+    "OCR可搜索PDF": ("选择扫描版PDF文件", "页范围（可选）", DEFAULT_PANEL_LAYOUT, None),
+    "PDF页面重排/旋转/倒序": ("选择PDF文件", "页面处理选项", (315, 350, 395, 435),
+                          "_on_reorder_mode_changed"),
+    "PDF添加/移除书签": ("选择PDF文件", "书签处理选项", (400, 435, 470, 510),
+                       "_on_bookmark_mode_changed"),
+    "PDF转Excel": ("选择包含表格的PDF文件", "页范围（可选）", DEFAULT_PANEL_LAYOUT, None),
+    "PDF批量文本/图片提取": ("选择PDF文件（可多选）", "批量提取选项", (395, 430, 465, 505), None),
+    "PDF批量盖章": ("选择PDF文件（可多选）", "批量盖章选项", (370, 405, 450, 490),
+                  "_on_stamp_mode_changed"),
+}
+
+
+def _short_name(name, n=15):
+    """超过 n 个字符时截断并以省略号结尾，用于标签显示文件名"""
+    return name if len(name) <= n else f"{name[:n - 1]}…"
+
+
+def _load_converter(name):
+    """按类名返回转换器类，所在模块首次调用时导入（之后由 sys.modules 缓存）"""
+    return getattr(importlib.import_module(_CONVERTER_MODULES[name]), name)
+
+
+def _load_fitz():
+    """按需导入 PyMuPDF 并绑定模块级 fitz，返回是否可用"""
+    global FITZ_UI_AVAILABLE, fitz
+    if fitz is not None:
+        return True
+    if not FITZ_UI_AVAILABLE:
+        return False
+    try:
+        import fitz as _fitz
+    except ImportError:
+        FITZ_UI_AVAILABLE = False
+        return False
+    fitz = _fitz
+    return True
+
+
+def _load_pil():
+    """按需导入 Pillow 并绑定模块级 Image/ImageTk/ImageDraw/ImageFont，返回是否可用"""
+    global PIL_AVAILABLE, Image, ImageDraw, ImageFont, ImageTk
+    if ImageTk is not None:
+        return True
+    if not PIL_AVAILABLE:
+        return False
+    try:
+        from PIL import Image as _Image, ImageDraw as _ImageDraw, ImageFont as _ImageFont
+        from PIL import ImageTk as _ImageTk
+    except ImportError:
+        PIL_AVAILABLE = False
+        return False
+    Image, ImageDraw, ImageFont = _Image, _ImageDraw, _ImageFont
+    ImageTk = _ImageTk  # 最后赋值：其他线程以 ImageTk 判断是否已全部导入
+    return True
+
+
+def _resolve_icon_path():
+    """窗口图标路径（支持打包后路径），不存在时返回 None"""
+    if getattr(sys, 'frozen', False):
+        base_path = sys._MEIPASS
+    else:
+        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    icon_path = os.path.join(base_path, 'logo.ico')
+    return icon_path if os.path.exists(icon_path) else None
+
+
+_ICON_PATH = _resolve_icon_path()
+_APP_ID_SET = False
+
+
+def _resize_background(img, size, draft=False):
+    """缩放窗口背景图。
+
+    draft=True 用于拖动缩放过程中的快速草图（Pillow BILINEAR）；
+    否则为停止缩放后的最终效果：优先 pic-scale 的 SIMD LANCZOS，退回 Pillow LANCZOS。
+    """
+    if not draft and PIC_SCALE_AVAILABLE:
+        try:
+            return ps_resize(img, size, PSResampling.LANCZOS)
+        except Exception as e:
+            logging.debug(f"pic-scale 缩放失败，改用 Pillow: {e}")
+    # 原图远大于窗口时先按整数倍 reduce（盒式平均，很快），再缩放到精确尺寸
+    factor = min(img.width // max(size[0], 1), img.height // max(size[1], 1))
+    if factor >= 2:
+        img = img.reduce(factor)
+    resample = Image.BILINEAR if draft else Image.LANCZOS
+    return img.resize(size, resample, reducing_gap=2.0)
+
+
+def _settings_dumps(data):
+    """序列化设置为缩进2格的 JSON 文本；有 orjson 时优先使用"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except TypeError:
+            pass
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+def _settings_loads(text):
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _parse_int(text, default=None, min_value=None):
+    """解析输入框中的整数；为空、格式错误或小于 min_value 时返回 default"""
+    text = str(text).strip()
+    if not text:
+        return default
+    try:
+        value = int(text)
+    except ValueError:
+        return default
+    if min_value is not None and value < min_value:
+        return default
+    return value
+
+
+def _parse_float(text, default=None):
+    """解析输入框中的小数；为空或格式错误时返回 default"""
+    text = str(text).strip()
+    if not text:
+        return default
+    try:
+        return float(text)
+    except ValueError:
+        return default
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_page_range(start_text, end_text):
+    """页范围文本 → (start_page_0based, end_page_0based_exclusive) 或 (0, None)；按文本缓存"""
+    if not start_text and not end_text:
+        return 0, None
+    start_page = max(0, _parse_int(start_text, 1, min_value=0) - 1)
+    end_page = _parse_int(end_text, min_value=0)
+    # 验证起始页不超过结束页
+    if end_page is not None and start_page >= end_page:
+        return 0, None
+    return start_page, end_page
+
+
+class _BatchProgress:
+    """批量转换时的进度回调：把单文件进度换算为总体进度"""
+
+    __slots__ = ("fi", "tf", "file_label", "ui")
+
+    def __init__(self, ui, file_idx, total_files, input_file):
+        self.ui = ui
+        self.fi = file_idx
+        self.tf = total_files
+        self.file_label = os.path.basename(input_file)
+
+    def __call__(self, percent, progress_text, status_text):
+        overall = int((self.fi / self.tf + max(0, percent) / 100 / self.tf) * 100)
+        self.ui._simple_progress_callback(
+            overall,
+            f"[{self.fi + 1}/{self.tf}] {self.file_label}: {progress_text}",
+            status_text or f"正在转换: {self.file_label}"
+        )
+
 
 class PDFConverterApp:
     """PDF转换工具主应用类"""
 
+    SAVE_SETTINGS_DELAY_MS = 500
+    # 进度队列刷新间隔：转换中 100ms 足以让进度条看起来连续，空闲时再放慢
+    UI_PUMP_ACTIVE_MS = 100
+    UI_PUMP_IDLE_MS = 250
+
     def __init__(self, root):
         self.root = root
         from core import __version__
@@ -113,25 +419,22 @@ class PDFConverterApp:
         self.root.geometry("500x580")
         self.root.resizable(False, False)
 
-        # 设置窗口图标（支持打包后路径）
-        try:
-            import sys
-            if getattr(sys, 'frozen', False):
-                base_path = sys._MEIPASS
-            else:
-                base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            icon_path = os.path.join(base_path, 'logo.ico')
-            if os.path.exists(icon_path):
-                self.root.iconbitmap(icon_path)
-                # 同时设置任务栏图标
+        # 设置窗口图标（路径在导入模块时已解析）
+        global _APP_ID_SET
+        if _ICON_PATH:
+            try:
+                self.root.iconbitmap(_ICON_PATH)
+            except Exception:
+                pass
+            # 同时设置任务栏图标（进程级设置，只需一次）
+            if not _APP_ID_SET:
                 try:
                     import ctypes
                     ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(
                         'PDFConverter.App')
+                    _APP_ID_SET = True
                 except Exception:
                     pass
-        except Exception:
-            pass
 
         # --- 通用变量 ---
         self.selected_file = tk.StringVar()
@@ -146,28 +449,45 @@ class PDFConverterApp:
         self.page_start_time = None
         self.page_timeout_seconds = 60
         self.page_timer_job = None
-        self.current_eta_text = ""
-        self.base_status_text = ""
+        # (基础状态文字, 预计剩余文字)，只由工作线程整体替换，UI线程读取时无需加锁
+        self._status_state = ("", "")
         self.conversion_active = False
         self._state_lock = threading.Lock()  # 保护跨线程共享状态
         self.page_start_var = tk.StringVar()
         self.page_end_var = tk.StringVar()
         self.title_text_var = tk.StringVar(value="PDF转换工具")
-        self.settings_path = os.path.join(get_app_dir(), "settings.json")
+        self._app_dir = get_app_dir()
+        self._cache_dir = os.path.join(self._app_dir, "cache")
+        self.settings_path = os.path.join(self._app_dir, "settings.json")
+        self._compiled_settings_path = os.path.join(self._cache_dir, "settings.marshal")
+        # ((mtime_ns, 大小), 解析结果或None, 文件文本)：文件未变化时免重复解析/写盘
+        self._settings_cache = None
         self._save_settings_job = None
+        self._save_settings_due = 0.0
+        self._loading_settings = False  # 加载设置期间不触发回写
 
         # --- 背景/面板 ---
         self.bg_image_path = None
         self.bg_image = None
         self.bg_pil = None
+        self._bg_source = None  # (路径, 修改时间ns, 原图RGB, 草图底图)，窗口缩放时不重复读取文件
+        self._bg_key = None  # 当前 bg_pil 对应的 (路径, 修改时间ns, 宽, 高)
         self.bg_label = None
         self.panel_opacity_var = tk.DoubleVar(value=85.0)
         self.panel_padding = 20
         self.panel_image = None
         self.panel_canvas = None
         self.panel_image_id = None
+        self._panel_last_key = None  # 上次生成面板图时的 (宽, 高, 透明度)，未变化则跳过
+        self._panel_overlay = None  # 与面板同尺寸的白色混合底图，尺寸不变时复用
         self.resize_job = None
+        self._bg_refine_job = None
+        self._bg_draft = False  # 当前背景是否为缩放过程中的草图
         self.panel_resize_job = None
+        self._resize_layout_job = None
+        self._title_job = None
+        self._layout_job = None
+        self._last_layout = None  # 上次布局的 (宽, 高, 各 y 坐标)
         self.progress_y = 290
         self.progress_text_y = 325
         self.btn_y = 370
@@ -184,7 +504,7 @@ class PDFConverterApp:
         # --- OCR & 公式识别选项 ---
         self.ocr_enabled_var = tk.BooleanVar(value=False)
         self.formula_api_enabled_var = tk.BooleanVar(value=False)
-        self.ocr_quality_mode_var = tk.StringVar(value="平衡")
+        self.ocr_quality_mode = "平衡"
 
         # --- PDF拆分选项 ---
         self.split_mode_var = tk.StringVar(value="每页一个PDF")
@@ -196,13 +516,14 @@ class PDFConverterApp:
         # --- PDF加水印选项 ---
         self.watermark_text_var = tk.StringVar(value="机密文件")
         self.watermark_opacity_var = tk.StringVar(value="0.3")
-        self.watermark_rotation_var = tk.StringVar(value="45")
-        self.watermark_fontsize_var = tk.StringVar(value="40")
-        self.watermark_size_scale_var = tk.StringVar(value="1.0")
-        self.watermark_spacing_var = tk.StringVar(value="1.0")
+        # 旋转/字号/间距等只在预览窗口中调整，没有控件直接绑定，用普通属性保存
+        self.watermark_rotation = "45"
+        self.watermark_fontsize = "40"
+        self.watermark_size_scale = "1.0"
+        self.watermark_spacing = "1.0"
         self.watermark_position_var = tk.StringVar(value="平铺")
-        self.watermark_random_size_var = tk.BooleanVar(value=False)
-        self.watermark_random_strength_var = tk.StringVar(value="0.35")
+        self.watermark_random_size = False
+        self.watermark_random_strength = "0.35"
         self.watermark_pages_var = tk.StringVar()
         self.watermark_image_path = None
 
@@ -214,6 +535,7 @@ class PDFConverterApp:
         self.allow_copy_var = tk.BooleanVar(value=True)
         self.allow_modify_var = tk.BooleanVar(value=False)
         self.allow_annotate_var = tk.BooleanVar(value=True)
+        self._encrypt_owner_packed = True  # 权限密码控件当前是否已 pack
 
         # --- 批量文本/图片提取选项 ---
         self.batch_text_enabled_var = tk.BooleanVar(value=True)
@@ -255,14 +577,18 @@ class PDFConverterApp:
 
         # --- 批量盖章选项 ---
         self.stamp_mode_var = tk.StringVar(value="普通章")
+        # 盖章模式键在预览拖拽/重绘中频繁读取，变量写入时更新一次即可
+        self._stamp_mode_key = "seal"
+        self.stamp_mode_var.trace_add("write", self._on_stamp_mode_var_changed)
         self.stamp_pages_var = tk.StringVar()
-        self.stamp_opacity_var = tk.StringVar(value="0.85")
-        self.stamp_position_var = tk.StringVar(value="右下")
-        self.stamp_size_ratio_var = tk.StringVar(value="0.18")
+        self.stamp_opacity = "0.85"
+        self.stamp_position = "右下"
+        self.stamp_size_ratio = "0.18"
         self.stamp_image_path = ""
         self.stamp_image_paths = []
+        self.stamp_image_path_to_idx = {}  # 与 stamp_image_paths 同步的 路径→下标 索引
         self.stamp_selected_image_idx = 0
-        self.stamp_profiles = {}
+        self.stamp_profiles = {}  # 路径→配置；写入处均先经 _normalize_stamp_profile 规范化
         self.stamp_qr_text_var = tk.StringVar()
         self.stamp_seam_side_var = tk.StringVar(value="右侧")
         self.stamp_seam_align_var = tk.StringVar(value="居中")
@@ -270,6 +596,10 @@ class PDFConverterApp:
         self.stamp_template_path = ""
         self.stamp_remove_white_bg_var = tk.BooleanVar(value=False)
         self.stamp_preview_info_var = tk.StringVar(value="")
+        self.stamp_hint_var = tk.StringVar(value="")
+        self.stamp_image_text_var = tk.StringVar(value="")
+        self.stamp_template_text_var = tk.StringVar(value="")
+        self._clamped_preview_cache = (None, None)  # (stamp_preview_profile, 夹取结果)
         self.stamp_preview_profile = {
             "x_ratio": 0.85,
             "y_ratio": 0.85,
@@ -282,22 +612,42 @@ class PDFConverterApp:
         self._pdf_preview_cache = {}
         self._stamp_base_image_cache = {}
         self._template_preview_cache = {}
+        self._stamp_template_data = (None, None)  # ((路径, mtime), 模板JSON)
+        self._signature_preview_doc = (None, None)  # ((路径, mtime), fitz.Document)
+        self._signature_doc_close_job = None
 
         # --- API 配置 ---
         self.api_provider = "baidu"
         self.baidu_api_key = ""
         self.baidu_secret_key = ""
         self.xslt_path = None
-        self._baidu_client = None
 
         # --- 转换历史 ---
         self.history = ConversionHistory()
 
+        # --- 转换工作线程：常驻一个，任务按提交顺序串行执行 ---
+        self._converter_cache = {}
+        self._job_q = queue.Queue()
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
+
+        # --- 工作线程 → UI线程的更新队列，由 _ui_pump 定时合并应用 ---
+        self._ui_queue = deque()
+        # 最近一次投递的进度/文字/状态，相同值不再重复入队
+        self._last_percent = -1
+        self._last_progress_text = None
+        self._last_status_text = None
+        # 状态栏当前显示的文字，避免每次比较都向 Tcl 读取 status_message
+        self._status_shown = ""
+        self._status_job = None
+
         # --- 初始化 ---
+        self._create_fonts()
         self.create_ui()
         self.load_settings()
         self.check_dependencies()
         self.root.protocol("WM_DELETE_WINDOW", self._on_root_close)
+        self.root.after(self.UI_PUMP_IDLE_MS, self._ui_pump)
 
         # --- 拖拽支持 ---
         if WINDND_AVAILABLE:
@@ -310,6 +660,20 @@ class PDFConverterApp:
     # UI 创建
     # ==========================================================
 
+    def _create_fonts(self):
+        """创建界面共用的命名字体；各控件引用同一字体对象，不必逐个解析字体描述"""
+        def font(size, weight="normal"):
+            return tkfont.Font(root=self.root, family="Microsoft YaHei", size=size, weight=weight)
+        self.font_small = font(8)
+        self.font_body = font(9)
+        self.font_body_bold = font(9, "bold")
+        self.font_medium = font(10)
+        self.font_medium_bold = font(10, "bold")
+        self.font_section = font(11, "bold")
+        self.font_large = font(12)
+        self.font_large_bold = font(12, "bold")
+        self.font_title = font(26, "bold")
+
     def create_ui(self):
         """创建用户界面 - Canvas直绘实现透明面板"""
         self.root.grid_rowconfigure(0, weight=1)
@@ -322,7 +686,7 @@ class PDFConverterApp:
 
         # 设置按钮
         self.settings_btn = tk.Button(
-            self.panel_canvas, text="⚙", font=("Microsoft YaHei", 12),
+            self.panel_canvas, text="⚙", font=self.font_large,
             relief=tk.FLAT, padx=4, cursor='hand2',
             command=self.open_settings_window
         )
@@ -331,7 +695,7 @@ class PDFConverterApp:
 
         # 历史记录按钮
         self.history_btn = tk.Button(
-            self.panel_canvas, text="📋", font=("Microsoft YaHei", 12),
+            self.panel_canvas, text="📋", font=self.font_large,
             relief=tk.FLAT, padx=4, cursor='hand2',
             command=self.open_history_window
         )
@@ -341,17 +705,17 @@ class PDFConverterApp:
         # 标题
         self.cv_title = self.panel_canvas.create_text(
             0, 35, text=self.title_text_var.get(),
-            font=("Microsoft YaHei", 26, "bold"), anchor="n"
+            font=self.font_title, anchor="n"
         )
         self.title_text_var.trace_add("write", self._on_title_var_changed)
 
         # 功能选择器
         func_frame = tk.Frame(self.panel_canvas)
-        tk.Label(func_frame, text="功能:", font=("Microsoft YaHei", 10, "bold")).pack(side=tk.LEFT)
+        tk.Label(func_frame, text="功能:", font=self.font_medium_bold).pack(side=tk.LEFT)
         self.func_combo = ttk.Combobox(
             func_frame, textvariable=self.current_function_var,
             values=ALL_FUNCTIONS,
-            state='readonly', font=("Microsoft YaHei", 10), width=14
+            state='readonly', font=self.font_medium, width=14
         )
         self.func_combo.pack(side=tk.LEFT, padx=(8, 0))
         self.func_combo.bind("<<ComboboxSelected>>", self._on_function_changed)
@@ -362,22 +726,23 @@ class PDFConverterApp:
         # 文件选择区
         self.cv_section1 = self.panel_canvas.create_text(
             15, 105, text="选择PDF文件（可多选）",
-            font=("Microsoft YaHei", 11, "bold"), anchor="nw"
+            font=self.font_section, anchor="nw"
         )
         file_frame = tk.Frame(self.panel_canvas)
         self.file_entry = tk.Entry(
             file_frame, textvariable=self.selected_file,
-            font=("Microsoft YaHei", 10), state='readonly'
+            font=self.font_medium, state='readonly'
         )
         self.file_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, ipady=8)
         self.order_btn = tk.Button(
             file_frame, text="排序", command=self._open_file_order_dialog,
-            font=("Microsoft YaHei", 9), padx=6, cursor='hand2'
+            font=self.font_body, padx=6, cursor='hand2'
         )
         # 排序按钮默认隐藏，多文件时显示
+        self._order_btn_shown = False
         tk.Button(
             file_frame, text="浏览...", command=self.browse_file,
-            font=("Microsoft YaHei", 10), padx=20, cursor='hand2'
+            font=self.font_medium, padx=20, cursor='hand2'
         ).pack(side=tk.LEFT, padx=(10, 0), ipady=6)
         self.cv_file_frame = self.panel_canvas.create_window(
             15, 130, window=file_frame, anchor="nw", width=1
@@ -386,17 +751,17 @@ class PDFConverterApp:
         # 页范围（PDF转Word / PDF转图片 使用）
         self.cv_section2 = self.panel_canvas.create_text(
             15, 185, text="页范围（可选）",
-            font=("Microsoft YaHei", 11, "bold"), anchor="nw"
+            font=self.font_section, anchor="nw"
         )
         range_frame = tk.Frame(self.panel_canvas)
-        tk.Label(range_frame, text="起始页:", font=("Microsoft YaHei", 10)).pack(side=tk.LEFT)
+        tk.Label(range_frame, text="起始页:", font=self.font_medium).pack(side=tk.LEFT)
         tk.Entry(range_frame, textvariable=self.page_start_var, width=6,
-                 font=("Microsoft YaHei", 10)).pack(side=tk.LEFT, padx=(6, 20))
-        tk.Label(range_frame, text="结束页:", font=("Microsoft YaHei", 10)).pack(side=tk.LEFT)
+                 font=self.font_medium).pack(side=tk.LEFT, padx=(6, 20))
+        tk.Label(range_frame, text="结束页:", font=self.font_medium).pack(side=tk.LEFT)
         tk.Entry(range_frame, textvariable=self.page_end_var, width=6,
-                 font=("Microsoft YaHei", 10)).pack(side=tk.LEFT, padx=(6, 20))
+                 font=self.font_medium).pack(side=tk.LEFT, padx=(6, 20))
         tk.Label(range_frame, text="留空表示全部页（页码从1开始）",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+                 font=self.font_body).pack(side=tk.LEFT)
         self.cv_range_frame = self.panel_canvas.create_window(
             15, 210, window=range_frame, anchor="nw"
         )
@@ -404,16 +769,16 @@ class PDFConverterApp:
         # 转换选项区（Word模式）
         self.word_options_frame = tk.Frame(self.panel_canvas)
         tk.Label(self.word_options_frame, text="转换选项:",
-                 font=("Microsoft YaHei", 9, "bold")).pack(side=tk.LEFT)
+                 font=self.font_body_bold).pack(side=tk.LEFT)
         self.ocr_cb = tk.Checkbutton(
             self.word_options_frame, text="OCR识别(扫描件)",
-            variable=self.ocr_enabled_var, font=("Microsoft YaHei", 9),
+            variable=self.ocr_enabled_var, font=self.font_body,
             command=self._on_option_changed
         )
         self.ocr_cb.pack(side=tk.LEFT, padx=(8, 0))
         self.formula_cb = tk.Checkbutton(
             self.word_options_frame, text="公式智能识别",
-            variable=self.formula_api_enabled_var, font=("Microsoft YaHei", 9),
+            variable=self.formula_api_enabled_var, font=self.font_body,
             command=self._on_option_changed
         )
         self.formula_cb.pack(side=tk.LEFT, padx=(8, 0))
@@ -424,20 +789,20 @@ class PDFConverterApp:
         # 转换选项区（图片模式）
         self.image_options_frame = tk.Frame(self.panel_canvas)
         tk.Label(self.image_options_frame, text="输出设置:",
-                 font=("Microsoft YaHei", 9, "bold")).pack(side=tk.LEFT)
+                 font=self.font_body_bold).pack(side=tk.LEFT)
         tk.Label(self.image_options_frame, text="DPI:",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT, padx=(10, 0))
+                 font=self.font_body).pack(side=tk.LEFT, padx=(10, 0))
         ttk.Combobox(
             self.image_options_frame, textvariable=self.image_dpi_var,
             values=["72", "150", "200", "300", "600"],
-            width=5, font=("Microsoft YaHei", 9), state='readonly'
+            width=5, font=self.font_body, state='readonly'
         ).pack(side=tk.LEFT, padx=(4, 0))
         tk.Label(self.image_options_frame, text="格式:",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT, padx=(14, 0))
+                 font=self.font_body).pack(side=tk.LEFT, padx=(14, 0))
         ttk.Combobox(
             self.image_options_frame, textvariable=self.image_format_var,
             values=["PNG", "JPEG"],
-            state='readonly', width=6, font=("Microsoft YaHei", 9)
+            state='readonly', width=6, font=self.font_body
         ).pack(side=tk.LEFT, padx=(4, 0))
         self.cv_image_options = self.panel_canvas.create_window(
             15, 245, window=self.image_options_frame, anchor="nw"
@@ -448,7 +813,7 @@ class PDFConverterApp:
         self.merge_info_frame = tk.Frame(self.panel_canvas)
         self.merge_info_label = tk.Label(
             self.merge_info_frame, text="请选择至少2个PDF文件，将按选择顺序合并",
-            font=("Microsoft YaHei", 9), fg="#666"
+            font=self.font_body, fg="#666"
         )
         self.merge_info_label.pack(side=tk.LEFT)
         self.cv_merge_info = self.panel_canvas.create_window(
@@ -459,24 +824,24 @@ class PDFConverterApp:
         # 拆分选项区 (y=210)
         self.split_options_frame = tk.Frame(self.panel_canvas)
         tk.Label(self.split_options_frame, text="模式:",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+                 font=self.font_body).pack(side=tk.LEFT)
         self.split_combo = ttk.Combobox(
             self.split_options_frame, textvariable=self.split_mode_var,
             values=["每页一个PDF", "每N页一个PDF", "按范围拆分"],
-            state='readonly', font=("Microsoft YaHei", 9), width=12
+            state='readonly', font=self.font_body, width=12
         )
         self.split_combo.pack(side=tk.LEFT, padx=(6, 0))
         self.split_combo.bind("<<ComboboxSelected>>", self._on_split_mode_changed)
         self.split_param_label = tk.Label(
-            self.split_options_frame, text="", font=("Microsoft YaHei", 9))
+            self.split_options_frame, text="", font=self.font_body)
         self.split_param_label.pack(side=tk.LEFT, padx=(14, 0))
         self.split_param_entry = tk.Entry(
             self.split_options_frame, textvariable=self.split_param_var,
-            width=18, font=("Microsoft YaHei", 9), state='disabled'
+            width=18, font=self.font_body, state='disabled'
         )
         self.split_param_entry.pack(side=tk.LEFT, padx=(6, 0))
         self.split_param_hint = tk.Label(
-            self.split_options_frame, text="", font=("Microsoft YaHei", 8), fg="#888"
+            self.split_options_frame, text="", font=self.font_small, fg="#888"
         )
         self.split_param_hint.pack(side=tk.LEFT, padx=(6, 0))
         self.cv_split_options = self.panel_canvas.create_window(
@@ -487,15 +852,15 @@ class PDFConverterApp:
         # 图片转PDF选项区 (y=210)
         self.img2pdf_options_frame = tk.Frame(self.panel_canvas)
         tk.Label(self.img2pdf_options_frame, text="页面尺寸:",
-                 font=("Microsoft YaHei", 9, "bold")).pack(side=tk.LEFT)
+                 font=self.font_body_bold).pack(side=tk.LEFT)
         ttk.Combobox(
             self.img2pdf_options_frame, textvariable=self.page_size_var,
             values=["A4", "A3", "Letter", "Legal", "自适应"],
-            state='readonly', font=("Microsoft YaHei", 9), width=8
+            state='readonly', font=self.font_body, width=8
         ).pack(side=tk.LEFT, padx=(8, 0))
         tk.Label(self.img2pdf_options_frame,
                  text="（自适应 = 页面大小匹配图片）",
-                 font=("Microsoft YaHei", 8), fg="#888"
+                 font=self.font_small, fg="#888"
                  ).pack(side=tk.LEFT, padx=(10, 0))
         self.cv_img2pdf_options = self.panel_canvas.create_window(
             15, 210, window=self.img2pdf_options_frame, anchor="nw"
@@ -505,20 +870,20 @@ class PDFConverterApp:
         # 水印选项区 (y=210)
         self.watermark_options_frame = tk.Frame(self.panel_canvas)
         tk.Label(self.watermark_options_frame, text="文字:",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+                 font=self.font_body).pack(side=tk.LEFT)
         tk.Entry(self.watermark_options_frame, textvariable=self.watermark_text_var,
-                 width=10, font=("Microsoft YaHei", 9)).pack(side=tk.LEFT, padx=(4, 0))
+                 width=10, font=self.font_body).pack(side=tk.LEFT, padx=(4, 0))
         tk.Button(self.watermark_options_frame, text="选图片",
-                  font=("Microsoft YaHei", 8), command=self._choose_watermark_image,
+                  font=self.font_small, command=self._choose_watermark_image,
                   cursor='hand2').pack(side=tk.LEFT, padx=(8, 0))
         tk.Label(self.watermark_options_frame, text="页码:",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT, padx=(10, 0))
+                 font=self.font_body).pack(side=tk.LEFT, padx=(10, 0))
         tk.Entry(self.watermark_options_frame, textvariable=self.watermark_pages_var,
-                 width=12, font=("Microsoft YaHei", 9)).pack(side=tk.LEFT, padx=(4, 0))
+                 width=12, font=self.font_body).pack(side=tk.LEFT, padx=(4, 0))
         tk.Label(self.watermark_options_frame, text="（示例: 1,2,3,4-8）",
-                 font=("Microsoft YaHei", 8), fg="#888").pack(side=tk.LEFT, padx=(6, 0))
+                 font=self.font_small, fg="#888").pack(side=tk.LEFT, padx=(6, 0))
         self.watermark_img_label = tk.Label(self.watermark_options_frame, text="",
-                 font=("Microsoft YaHei", 8), fg="#666")
+                 font=self.font_small, fg="#666")
         self.watermark_img_label.pack(side=tk.LEFT, padx=(4, 0))
         self.cv_watermark_options = self.panel_canvas.create_window(
             15, 210, window=self.watermark_options_frame, anchor="nw"
@@ -528,26 +893,26 @@ class PDFConverterApp:
         # 水印详细选项区 (y=245)
         self.watermark_detail_frame = tk.Frame(self.panel_canvas)
         tk.Label(self.watermark_detail_frame, text="透明度:",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+                 font=self.font_body).pack(side=tk.LEFT)
         ttk.Combobox(
             self.watermark_detail_frame, textvariable=self.watermark_opacity_var,
             values=["0.1", "0.2", "0.3", "0.5", "0.7"],
-            width=4, font=("Microsoft YaHei", 9), state='readonly'
+            width=4, font=self.font_body, state='readonly'
         ).pack(side=tk.LEFT, padx=(4, 0))
         tk.Label(self.watermark_detail_frame, text="位置:",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT, padx=(8, 0))
+                 font=self.font_body).pack(side=tk.LEFT, padx=(8, 0))
         ttk.Combobox(
             self.watermark_detail_frame, textvariable=self.watermark_position_var,
             values=WATERMARK_POSITION_OPTIONS,
-            width=9, font=("Microsoft YaHei", 9), state='readonly'
+            width=9, font=self.font_body, state='readonly'
         ).pack(side=tk.LEFT, padx=(4, 0))
         tk.Button(
             self.watermark_detail_frame, text="预览设置...",
-            font=("Microsoft YaHei", 8), command=self._open_watermark_preview,
+            font=self.font_small, command=self._open_watermark_preview,
             cursor='hand2'
         ).pack(side=tk.LEFT, padx=(8, 0))
         tk.Label(self.watermark_detail_frame, text="（图优先）",
-                 font=("Microsoft YaHei", 8), fg="#888").pack(side=tk.LEFT, padx=(6, 0))
+                 font=self.font_small, fg="#888").pack(side=tk.LEFT, padx=(6, 0))
         self.cv_watermark_detail = self.panel_canvas.create_window(
             15, 245, window=self.watermark_detail_frame, anchor="nw"
         )
@@ -556,27 +921,27 @@ class PDFConverterApp:
         # 加密/解密选项区 (y=210)
         self.encrypt_options_frame = tk.Frame(self.panel_canvas)
         tk.Label(self.encrypt_options_frame, text="模式:",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+                 font=self.font_body).pack(side=tk.LEFT)
         self.encrypt_mode_combo = ttk.Combobox(
             self.encrypt_options_frame, textvariable=self.encrypt_mode_var,
             values=["加密", "解密"], state='readonly',
-            width=5, font=("Microsoft YaHei", 9)
+            width=5, font=self.font_body
         )
         self.encrypt_mode_combo.pack(side=tk.LEFT, padx=(4, 0))
         self.encrypt_mode_combo.bind("<<ComboboxSelected>>", self._on_encrypt_mode_changed)
         self.encrypt_pw_label = tk.Label(self.encrypt_options_frame, text="打开密码:",
-                 font=("Microsoft YaHei", 9))
+                 font=self.font_body)
         self.encrypt_pw_label.pack(side=tk.LEFT, padx=(8, 0))
         self.encrypt_pw_entry = tk.Entry(self.encrypt_options_frame,
                  textvariable=self.user_password_var,
-                 width=10, font=("Microsoft YaHei", 9), show="*")
+                 width=10, font=self.font_body, show="*")
         self.encrypt_pw_entry.pack(side=tk.LEFT, padx=(4, 0))
         self.encrypt_owner_label = tk.Label(self.encrypt_options_frame, text="权限密码:",
-                 font=("Microsoft YaHei", 9))
+                 font=self.font_body)
         self.encrypt_owner_label.pack(side=tk.LEFT, padx=(8, 0))
         self.encrypt_owner_entry = tk.Entry(self.encrypt_options_frame,
                  textvariable=self.owner_password_var,
-                 width=10, font=("Microsoft YaHei", 9), show="*")
+                 width=10, font=self.font_body, show="*")
         self.encrypt_owner_entry.pack(side=tk.LEFT, padx=(4, 0))
         self.cv_encrypt_options = self.panel_canvas.create_window(
             15, 210, window=self.encrypt_options_frame, anchor="nw"
@@ -586,19 +951,19 @@ class PDFConverterApp:
         # 加密权限选项区 (y=245)
         self.encrypt_perm_frame = tk.Frame(self.panel_canvas)
         tk.Label(self.encrypt_perm_frame, text="允许操作:",
-                 font=("Microsoft YaHei", 9, "bold")).pack(side=tk.LEFT)
+                 font=self.font_body_bold).pack(side=tk.LEFT)
         tk.Checkbutton(self.encrypt_perm_frame, text="打印",
                        variable=self.allow_print_var,
-                       font=("Microsoft YaHei", 9)).pack(side=tk.LEFT, padx=(8, 0))
+                       font=self.font_body).pack(side=tk.LEFT, padx=(8, 0))
         tk.Checkbutton(self.encrypt_perm_frame, text="复制",
                        variable=self.allow_copy_var,
-                       font=("Microsoft YaHei", 9)).pack(side=tk.LEFT, padx=(8, 0))
+                       font=self.font_body).pack(side=tk.LEFT, padx=(8, 0))
         tk.Checkbutton(self.encrypt_perm_frame, text="修改",
                        variable=self.allow_modify_var,
-                       font=("Microsoft YaHei", 9)).pack(side=tk.LEFT, padx=(8, 0))
+                       font=self.font_body).pack(side=tk.LEFT, padx=(8, 0))
         tk.Checkbutton(self.encrypt_perm_frame, text="注释",
                        variable=self.allow_annotate_var,
-                       font=("Microsoft YaHei", 9)).pack(side=tk.LEFT, padx=(8, 0))
+                       font=self.font_body).pack(side=tk.LEFT, padx=(8, 0))
         self.cv_encrypt_perm = self.panel_canvas.create_window(
             15, 245, window=self.encrypt_perm_frame, anchor="nw"
         )
@@ -608,12 +973,12 @@ class PDFConverterApp:
         self.compress_level_var = tk.StringVar(value='标准压缩')
         self.compress_options_frame = tk.Frame(self.panel_canvas)
         tk.Label(self.compress_options_frame, text="压缩级别:",
-                 font=("Microsoft YaHei", 9, "bold")).pack(side=tk.LEFT)
-        for level in COMPRESS_PRESETS:
+                 font=self.font_body_bold).pack(side=tk.LEFT)
+        for level in COMPRESS_DESCRIPTIONS:
             tk.Radiobutton(
                 self.compress_options_frame, text=level,
                 variable=self.compress_level_var, value=level,
-                font=("Microsoft YaHei", 9),
+                font=self.font_body,
                 command=self._on_compress_level_changed,
             ).pack(side=tk.LEFT, padx=(6, 0))
         self.cv_compress_options = self.panel_canvas.create_window(
@@ -623,10 +988,10 @@ class PDFConverterApp:
 
         # 压缩级别说明 (y=245)
         self.compress_hint_var = tk.StringVar(
-            value=COMPRESS_PRESETS['标准压缩']['description'])
+            value=COMPRESS_DESCRIPTIONS['标准压缩'])
         self.compress_hint_frame = tk.Frame(self.panel_canvas)
         tk.Label(self.compress_hint_frame, textvariable=self.compress_hint_var,
-                 font=("Microsoft YaHei", 8), fg="#888888").pack(anchor=tk.W)
+                 font=self.font_small, fg="#888888").pack(anchor=tk.W)
         self.cv_compress_hint = self.panel_canvas.create_window(
             15, 245, window=self.compress_hint_frame, anchor="nw"
         )
@@ -637,17 +1002,17 @@ class PDFConverterApp:
         self.extract_pages_var = tk.StringVar()
         self.extract_options_frame = tk.Frame(self.panel_canvas)
         tk.Label(self.extract_options_frame, text="模式:",
-                 font=("Microsoft YaHei", 9, "bold")).pack(side=tk.LEFT)
+                 font=self.font_body_bold).pack(side=tk.LEFT)
         tk.Radiobutton(self.extract_options_frame, text="提取指定页",
                        variable=self.extract_mode_var, value='提取',
-                       font=("Microsoft YaHei", 9)).pack(side=tk.LEFT, padx=(6, 0))
+                       font=self.font_body).pack(side=tk.LEFT, padx=(6, 0))
         tk.Radiobutton(self.extract_options_frame, text="删除指定页",
                        variable=self.extract_mode_var, value='删除',
-                       font=("Microsoft YaHei", 9)).pack(side=tk.LEFT, padx=(6, 0))
+                       font=self.font_body).pack(side=tk.LEFT, padx=(6, 0))
         tk.Label(self.extract_options_frame, text="页码:",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT, padx=(10, 0))
+                 font=self.font_body).pack(side=tk.LEFT, padx=(10, 0))
         tk.Entry(self.extract_options_frame, textvariable=self.extract_pages_var,
-                 width=18, font=("Microsoft YaHei", 9)).pack(side=tk.LEFT, padx=(4, 0))
+                 width=18, font=self.font_body).pack(side=tk.LEFT, padx=(4, 0))
         self.cv_extract_options = self.panel_canvas.create_window(
             15, 210, window=self.extract_options_frame, anchor="nw"
         )
@@ -656,7 +1021,7 @@ class PDFConverterApp:
         # 提取/删页说明 (y=245)
         self.extract_hint_frame = tk.Frame(self.panel_canvas)
         tk.Label(self.extract_hint_frame, text="格式示例：1,3,5-10  支持单页、范围、混合",
-                 font=("Microsoft YaHei", 8), fg="#888888").pack(anchor=tk.W)
+                 font=self.font_small, fg="#888888").pack(anchor=tk.W)
         self.cv_extract_hint = self.panel_canvas.create_window(
             15, 245, window=self.extract_hint_frame, anchor="nw"
         )
@@ -670,42 +1035,42 @@ class PDFConverterApp:
         self.reorder_options_row2.pack(anchor=tk.W, pady=(6, 0))
 
         tk.Label(self.reorder_options_row1, text="模式:",
-                 font=("Microsoft YaHei", 9, "bold")).pack(side=tk.LEFT)
+                 font=self.font_body_bold).pack(side=tk.LEFT)
         self.reorder_mode_combo = ttk.Combobox(
             self.reorder_options_row1, textvariable=self.reorder_mode_var,
             values=["页面重排", "页面旋转", "页面倒序"],
-            state='readonly', width=8, font=("Microsoft YaHei", 9)
+            state='readonly', width=8, font=self.font_body
         )
         self.reorder_mode_combo.pack(side=tk.LEFT, padx=(6, 8))
         self.reorder_mode_combo.bind("<<ComboboxSelected>>", self._on_reorder_mode_changed)
 
         tk.Label(self.reorder_options_row1, text="顺序:",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+                 font=self.font_body).pack(side=tk.LEFT)
         self.reorder_pages_entry = tk.Entry(
             self.reorder_options_row1, textvariable=self.reorder_pages_var,
-            width=16, font=("Microsoft YaHei", 9)
+            width=16, font=self.font_body
         )
         self.reorder_pages_entry.pack(side=tk.LEFT, padx=(4, 6))
         self.reorder_preview_btn = tk.Button(
             self.reorder_options_row1, text="顺序拖拽预览...",
             command=self._open_reorder_preview_dialog,
-            font=("Microsoft YaHei", 8), cursor='hand2'
+            font=self.font_small, cursor='hand2'
         )
         self.reorder_preview_btn.pack(side=tk.LEFT, padx=(0, 0))
 
         tk.Label(self.reorder_options_row2, text="旋转页码:",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+                 font=self.font_body).pack(side=tk.LEFT)
         self.rotate_pages_entry = tk.Entry(
             self.reorder_options_row2, textvariable=self.rotate_pages_var,
-            width=10, font=("Microsoft YaHei", 9)
+            width=10, font=self.font_body
         )
         self.rotate_pages_entry.pack(side=tk.LEFT, padx=(4, 6))
         tk.Label(self.reorder_options_row2, text="角度:",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+                 font=self.font_body).pack(side=tk.LEFT)
         self.rotate_angle_combo = ttk.Combobox(
             self.reorder_options_row2, textvariable=self.rotate_angle_var,
             values=["90", "180", "270"],
-            state='readonly', width=4, font=("Microsoft YaHei", 9)
+            state='readonly', width=4, font=self.font_body
         )
         self.rotate_angle_combo.pack(side=tk.LEFT, padx=(4, 0))
         self.cv_reorder_options = self.panel_canvas.create_window(
@@ -716,7 +1081,7 @@ class PDFConverterApp:
         # 页面处理提示 (y=278)
         self.reorder_hint_frame = tk.Frame(self.panel_canvas)
         tk.Label(self.reorder_hint_frame, textvariable=self.reorder_hint_var,
-                 font=("Microsoft YaHei", 8), fg="#888888").pack(anchor=tk.W)
+                 font=self.font_small, fg="#888888").pack(anchor=tk.W)
         self.cv_reorder_hint = self.panel_canvas.create_window(
             15, 278, window=self.reorder_hint_frame, anchor="nw"
         )
@@ -725,27 +1090,27 @@ class PDFConverterApp:
         # PDF书签选项区（分多行，适配固定窗口）
         self.bookmark_options_frame = tk.Frame(self.panel_canvas)
         tk.Label(self.bookmark_options_frame, text="模式:",
-                 font=("Microsoft YaHei", 9, "bold")).pack(side=tk.LEFT)
+                 font=self.font_body_bold).pack(side=tk.LEFT)
         self.bookmark_mode_combo = ttk.Combobox(
             self.bookmark_options_frame, textvariable=self.bookmark_mode_var,
             values=["添加书签", "移除书签", "导入JSON", "导出JSON", "清空书签", "自动生成"],
-            state='readonly', width=10, font=("Microsoft YaHei", 9)
+            state='readonly', width=10, font=self.font_body
         )
         self.bookmark_mode_combo.pack(side=tk.LEFT, padx=(6, 10))
         self.bookmark_mode_combo.bind("<<ComboboxSelected>>", self._on_bookmark_mode_changed)
         tk.Label(self.bookmark_options_frame, text="级别:",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+                 font=self.font_body).pack(side=tk.LEFT)
         self.bookmark_level_combo = ttk.Combobox(
             self.bookmark_options_frame, textvariable=self.bookmark_level_var,
             values=["1", "2", "3", "4", "5"], state='readonly',
-            width=3, font=("Microsoft YaHei", 9)
+            width=3, font=self.font_body
         )
         self.bookmark_level_combo.pack(side=tk.LEFT, padx=(4, 10))
         tk.Label(self.bookmark_options_frame, text="页码:",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+                 font=self.font_body).pack(side=tk.LEFT)
         self.bookmark_page_entry = tk.Entry(
             self.bookmark_options_frame, textvariable=self.bookmark_page_var,
-            width=6, font=("Microsoft YaHei", 9)
+            width=6, font=self.font_body
         )
         self.bookmark_page_entry.pack(side=tk.LEFT, padx=(4, 0))
         self.cv_bookmark_options = self.panel_canvas.create_window(
@@ -755,10 +1120,10 @@ class PDFConverterApp:
 
         self.bookmark_options2_frame = tk.Frame(self.panel_canvas)
         tk.Label(self.bookmark_options2_frame, text="标题:",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+                 font=self.font_body).pack(side=tk.LEFT)
         self.bookmark_title_entry = tk.Entry(
             self.bookmark_options2_frame, textvariable=self.bookmark_title_var,
-            width=44, font=("Microsoft YaHei", 9)
+            width=44, font=self.font_body
         )
         self.bookmark_title_entry.pack(side=tk.LEFT, padx=(4, 0))
         self.cv_bookmark_options2 = self.panel_canvas.create_window(
@@ -768,23 +1133,23 @@ class PDFConverterApp:
 
         self.bookmark_options3_frame = tk.Frame(self.panel_canvas)
         tk.Label(self.bookmark_options3_frame, text="移除级别:",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+                 font=self.font_body).pack(side=tk.LEFT)
         self.bookmark_remove_levels_entry = tk.Entry(
             self.bookmark_options3_frame, textvariable=self.bookmark_remove_levels_var,
-            width=10, font=("Microsoft YaHei", 9)
+            width=10, font=self.font_body
         )
         self.bookmark_remove_levels_entry.pack(side=tk.LEFT, padx=(4, 8))
         tk.Label(self.bookmark_options3_frame, text="关键词:",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+                 font=self.font_body).pack(side=tk.LEFT)
         self.bookmark_remove_keyword_entry = tk.Entry(
             self.bookmark_options3_frame, textvariable=self.bookmark_remove_keyword_var,
-            width=16, font=("Microsoft YaHei", 9)
+            width=16, font=self.font_body
         )
         self.bookmark_remove_keyword_entry.pack(side=tk.LEFT, padx=(4, 8))
         self.bookmark_merge_cb = tk.Checkbutton(
             self.bookmark_options3_frame, text="导入/自动时合并现有",
             variable=self.bookmark_merge_existing_var,
-            font=("Microsoft YaHei", 8)
+            font=self.font_small
         )
         self.bookmark_merge_cb.pack(side=tk.LEFT, padx=(2, 0))
         self.cv_bookmark_options3 = self.panel_canvas.create_window(
@@ -794,16 +1159,16 @@ class PDFConverterApp:
 
         self.bookmark_options4_frame = tk.Frame(self.panel_canvas)
         tk.Label(self.bookmark_options4_frame, text="JSON:",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+                 font=self.font_body).pack(side=tk.LEFT)
         self.bookmark_json_entry = tk.Entry(
             self.bookmark_options4_frame, textvariable=self.bookmark_json_path_var,
-            width=34, font=("Microsoft YaHei", 9)
+            width=34, font=self.font_body
         )
         self.bookmark_json_entry.pack(side=tk.LEFT, padx=(4, 8))
         self.bookmark_json_btn = tk.Button(
             self.bookmark_options4_frame, text="选择...",
             command=self._choose_bookmark_json_path,
-            font=("Microsoft YaHei", 8), cursor='hand2'
+            font=self.font_small, cursor='hand2'
         )
         self.bookmark_json_btn.pack(side=tk.LEFT, padx=(0, 0))
         self.cv_bookmark_options4 = self.panel_canvas.create_window(
@@ -813,10 +1178,10 @@ class PDFConverterApp:
 
         self.bookmark_options5_frame = tk.Frame(self.panel_canvas)
         tk.Label(self.bookmark_options5_frame, text="自动规则:",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+                 font=self.font_body).pack(side=tk.LEFT)
         self.bookmark_auto_pattern_entry = tk.Entry(
             self.bookmark_options5_frame, textvariable=self.bookmark_auto_pattern_var,
-            width=37, font=("Microsoft YaHei", 9)
+            width=37, font=self.font_body
         )
         self.bookmark_auto_pattern_entry.pack(side=tk.LEFT, padx=(4, 0))
         self.cv_bookmark_options5 = self.panel_canvas.create_window(
@@ -826,85 +1191,212 @@ class PDFConverterApp:
 
         self.bookmark_hint_frame = tk.Frame(self.panel_canvas)
         tk.Label(self.bookmark_hint_frame, textvariable=self.bookmark_hint_var,
-                 font=("Microsoft YaHei", 8), fg="#888888").pack(anchor=tk.W)
+                 font=self.font_small, fg="#888888").pack(anchor=tk.W)
         self.cv_bookmark_hint = self.panel_canvas.create_window(
             15, 375, window=self.bookmark_hint_frame, anchor="nw"
         )
         self.panel_canvas.itemconfigure(self.cv_bookmark_hint, state='hidden')
 
-        # PDF转Excel选项区 (y=210)
+        # PDF转Excel选项变量（选项区由 _build_excel_options 按需创建）
         self.excel_strategy_var = tk.StringVar(value='自动检测')
         self.excel_merge_var = tk.BooleanVar(value=False)
         self.excel_extract_mode_var = tk.StringVar(value='结构提取')
+        self.excel_hint_var = tk.StringVar(
+            value=TABLE_STRATEGY_DESCRIPTIONS['自动检测'])
+
+        # API状态提示
+        self.cv_api_hint = self.panel_canvas.create_text(
+            15, 270, text="", font=self.font_small, anchor="nw", fill="#888888"
+        )
+
+        # 进度条
+        self.progress_bar = ttk.Progressbar(self.panel_canvas, mode='determinate')
+        self.cv_progress_bar = self.panel_canvas.create_window(
+            20, self.progress_y, window=self.progress_bar, anchor="nw", width=1, height=25
+        )
+
+        # 进度文本
+        self.cv_progress_text = self.panel_canvas.create_text(
+            0, self.progress_text_y, text="", font=self.font_body, anchor="n"
+        )
+
+        # 按钮
+        btn_frame = tk.Frame(self.panel_canvas)
+        self.convert_btn = tk.Button(
+            btn_frame, text="开始转换", command=self.start_conversion,
+            font=self.font_large_bold, padx=40, pady=12, cursor='hand2'
+        )
+        self.convert_btn.pack(side=tk.LEFT, expand=True, padx=5)
+        tk.Button(
+            btn_frame, text="清除", command=self.clear_selection,
+            font=self.font_large, padx=40, pady=12, cursor='hand2'
+        ).pack(side=tk.LEFT, expand=True, padx=5)
+        self.cv_btn_frame = self.panel_canvas.create_window(
+            0, self.btn_y, window=btn_frame, anchor="n"
+        )
+
+        # 拖拽提示
+        dnd_text = "支持拖拽文件到窗口" if WINDND_AVAILABLE else ""
+        self.cv_dnd_hint = self.panel_canvas.create_text(
+            0, self.dnd_y, text=dnd_text, font=self.font_small,
+            anchor="n", fill="#aaaaaa"
+        )
+
+        # 状态栏
+        self.cv_status_text = self.panel_canvas.create_text(
+            15, 0, text=self.status_message.get(),
+            font=self.font_body, anchor="sw"
+        )
+        # 各功能需要显示的Canvas项；切换功能时只改这些项的 state，不重建控件
+        mode_frames = {
+            "PDF转Word": (self.cv_range_frame, self.cv_formula_frame, self.cv_api_hint),
+            "PDF转图片": (self.cv_range_frame, self.cv_image_options),
+            "PDF合并": (self.cv_merge_info,),
+            "PDF拆分": (self.cv_split_options,),
+            "图片转PDF": (self.cv_img2pdf_options,),
+            "PDF加水印": (self.cv_watermark_options, self.cv_watermark_detail),
+            "PDF加密/解密": (self.cv_encrypt_options, self.cv_encrypt_perm),
+            "PDF压缩": (self.cv_compress_options, self.cv_compress_hint),
+            "PDF提取/删页": (self.cv_extract_options, self.cv_extract_hint),
+            "OCR可搜索PDF": (self.cv_range_frame, self.cv_api_hint),
+            "PDF页面重排/旋转/倒序": (self.cv_reorder_options, self.cv_reorder_hint),
+            "PDF添加/移除书签": (self.cv_bookmark_options, self.cv_bookmark_options2,
+                                self.cv_bookmark_options3, self.cv_bookmark_options4,
+                                self.cv_bookmark_options5, self.cv_bookmark_hint),
+        }
+        # 以下功能的选项区首次切换到该功能时才创建
+        self._option_builders = {
+            "PDF转Excel": self._build_excel_options,
+            "PDF批量文本/图片提取": self._build_batch_extract_options,
+            "PDF批量盖章": self._build_stamp_options,
+        }
+        self._mode_frames = {func: frozenset(items) for func, items in mode_frames.items()}
+        # 首次切换时按"全部可见"处理，保证不属于当前功能的项都被隐藏
+        self._mode_items_shown = frozenset().union(*self._mode_frames.values())
+        # layout_canvas 的 Tcl 脚本模板；花括号内的字段在布局时填入
+        canvas = self.panel_canvas._w
+        self._layout_script = "\n".join((
+            f"{canvas} coords {self.cv_title} {{cx}} 35",
+            f"{canvas} coords {self.cv_subtitle} {{cx}} 75",
+            f"{canvas} itemconfigure {self.cv_file_frame} -width {{file_w}}",
+            f"{canvas} coords {self.cv_progress_bar} 20 {{progress_y}}",
+            f"{canvas} itemconfigure {self.cv_progress_bar} -width {{bar_w}}",
+            f"{canvas} coords {self.cv_progress_text} {{cx}} {{progress_text_y}}",
+            f"{canvas} coords {self.cv_btn_frame} {{cx}} {{btn_y}}",
+            f"{canvas} coords {self.cv_dnd_hint} {{cx}} {{dnd_y}}",
+            f"{canvas} coords {self.cv_status_text} 15 {{status_y}}",
+        ))
+        self.status_message.trace_add("write", self._on_status_var_changed)
+        self._update_stamp_preview_info()
+        self._on_bookmark_mode_changed(save=False)
+
+        # 事件绑定
+        self.root.bind("<Configure>", self.on_root_resize)
+        self.panel_canvas.bind("<Configure>", self.on_panel_resize)
+        self.root.after(50, self.refresh_layout)
+
+    # ==========================================================
+    # Canvas文字/布局
+    # ==========================================================
+
+    def _on_title_var_changed(self, *args):
+        # 设置窗口中的标题输入框逐键写入变量，停止输入 100ms 后再更新画布
+        if self._title_job is not None:
+            self.root.after_cancel(self._title_job)
+        self._title_job = self.root.after(100, self._apply_title_text)
+
+    def _apply_title_text(self):
+        self._title_job = None
+        if self.panel_canvas:
+            self.panel_canvas.itemconfigure(self.cv_title, text=self.title_text_var.get())
+
+    def _on_status_var_changed(self, *args):
+        self._status_shown = self.status_message.get()
+        # 同一轮事件中多次改写状态时，空闲后只把最后的文字画到画布上
+        if self._status_job is None and self.panel_canvas:
+            self._status_job = self.root.after_idle(self._apply_status_shown)
+
+    def _apply_status_shown(self):
+        self._status_job = None
+        self.panel_canvas.itemconfigure(self.cv_status_text, text=self._status_shown)
+
+    def set_progress_text(self, text):
+        if self.panel_canvas:
+            self.panel_canvas.itemconfigure(self.cv_progress_text, text=text)
+
+    def _build_excel_options(self):
+        """创建PDF转Excel选项区 (y=210)"""
         self.excel_options_frame = tk.Frame(self.panel_canvas)
         tk.Label(self.excel_options_frame, text="提取策略:",
-                 font=("Microsoft YaHei", 9, "bold")).pack(side=tk.LEFT)
-        for strategy in TABLE_STRATEGIES:
+                 font=self.font_body_bold).pack(side=tk.LEFT)
+        for strategy in TABLE_STRATEGY_DESCRIPTIONS:
             tk.Radiobutton(
                 self.excel_options_frame, text=strategy,
                 variable=self.excel_strategy_var, value=strategy,
-                font=("Microsoft YaHei", 9),
+                font=self.font_body,
                 command=self._on_excel_strategy_changed,
             ).pack(side=tk.LEFT, padx=(6, 0))
         tk.Checkbutton(self.excel_options_frame, text="合并到一个Sheet",
                        variable=self.excel_merge_var,
-                       font=("Microsoft YaHei", 9)).pack(side=tk.LEFT, padx=(12, 0))
+                       font=self.font_body).pack(side=tk.LEFT, padx=(12, 0))
         self.cv_excel_options = self.panel_canvas.create_window(
             15, 210, window=self.excel_options_frame, anchor="nw"
         )
         self.panel_canvas.itemconfigure(self.cv_excel_options, state='hidden')
 
-        # Excel提取方式 (y=245)
+        # 提取方式 (y=245)
         self.excel_mode_frame = tk.Frame(self.panel_canvas)
         tk.Label(self.excel_mode_frame, text="提取方式:",
-                 font=("Microsoft YaHei", 9, "bold")).pack(side=tk.LEFT)
+                 font=self.font_body_bold).pack(side=tk.LEFT)
         tk.Radiobutton(
             self.excel_mode_frame, text="结构提取",
             variable=self.excel_extract_mode_var, value="结构提取",
-            font=("Microsoft YaHei", 9)
+            font=self.font_body
         ).pack(side=tk.LEFT, padx=(6, 0))
         tk.Radiobutton(
             self.excel_mode_frame, text="OCR提取",
             variable=self.excel_extract_mode_var, value="OCR提取",
-            font=("Microsoft YaHei", 9)
+            font=self.font_body
         ).pack(side=tk.LEFT, padx=(6, 0))
         self.cv_excel_mode = self.panel_canvas.create_window(
             15, 245, window=self.excel_mode_frame, anchor="nw"
         )
         self.panel_canvas.itemconfigure(self.cv_excel_mode, state='hidden')
 
-        # Excel策略说明 (y=270)
-        self.excel_hint_var = tk.StringVar(
-            value=TABLE_STRATEGIES['自动检测']['description'])
+        # 策略说明 (y=270)
         self.excel_hint_frame = tk.Frame(self.panel_canvas)
         tk.Label(self.excel_hint_frame, textvariable=self.excel_hint_var,
-                 font=("Microsoft YaHei", 8), fg="#888888").pack(anchor=tk.W)
+                 font=self.font_small, fg="#888888").pack(anchor=tk.W)
         self.cv_excel_hint = self.panel_canvas.create_window(
             15, 270, window=self.excel_hint_frame, anchor="nw"
         )
         self.panel_canvas.itemconfigure(self.cv_excel_hint, state='hidden')
 
-        # PDF批量文本/图片提取选项（分4行，避免固定窗口遮挡）
+        return (self.cv_range_frame, self.cv_excel_options,
+                self.cv_excel_mode, self.cv_excel_hint)
+
+    def _build_batch_extract_options(self):
+        """创建PDF批量文本/图片提取选项区（分4行，避免固定窗口遮挡）"""
         self.batch_options_frame = tk.Frame(self.panel_canvas)
         tk.Checkbutton(self.batch_options_frame, text="文本",
                        variable=self.batch_text_enabled_var,
-                       font=("Microsoft YaHei", 9)).pack(side=tk.LEFT, padx=(0, 8))
+                       font=self.font_body).pack(side=tk.LEFT, padx=(0, 8))
         tk.Checkbutton(self.batch_options_frame, text="图片",
                        variable=self.batch_image_enabled_var,
-                       font=("Microsoft YaHei", 9)).pack(side=tk.LEFT, padx=(0, 12))
+                       font=self.font_body).pack(side=tk.LEFT, padx=(0, 12))
         tk.Label(self.batch_options_frame, text="格式:",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+                 font=self.font_body).pack(side=tk.LEFT)
         ttk.Combobox(
             self.batch_options_frame, textvariable=self.batch_text_format_var,
             values=["txt", "json", "csv", "xlsx"],
-            state='readonly', width=5, font=("Microsoft YaHei", 9)
+            state='readonly', width=5, font=self.font_body
         ).pack(side=tk.LEFT, padx=(4, 10))
         tk.Label(self.batch_options_frame, text="模式:",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+                 font=self.font_body).pack(side=tk.LEFT)
         ttk.Combobox(
             self.batch_options_frame, textvariable=self.batch_text_mode_var,
             values=["合并为一个文件", "每页一个文件"],
-            state='readonly', width=8, font=("Microsoft YaHei", 9)
+            state='readonly', width=8, font=self.font_body
         ).pack(side=tk.LEFT, padx=(4, 0))
         self.cv_batch_options = self.panel_canvas.create_window(15, 210, window=self.batch_options_frame, anchor="nw")
         self.panel_canvas.itemconfigure(self.cv_batch_options, state='hidden')
@@ -912,51 +1404,51 @@ class PDFConverterApp:
         self.batch_options2_frame = tk.Frame(self.panel_canvas)
         tk.Checkbutton(self.batch_options2_frame, text="保留换行",
                        variable=self.batch_preserve_layout_var,
-                       font=("Microsoft YaHei", 9)).pack(side=tk.LEFT, padx=(0, 8))
+                       font=self.font_body).pack(side=tk.LEFT, padx=(0, 8))
         tk.Checkbutton(self.batch_options2_frame, text="无文本时OCR",
                        variable=self.batch_ocr_enabled_var,
-                       font=("Microsoft YaHei", 9)).pack(side=tk.LEFT, padx=(0, 10))
+                       font=self.font_body).pack(side=tk.LEFT, padx=(0, 10))
         tk.Label(self.batch_options2_frame, text="页码:",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+                 font=self.font_body).pack(side=tk.LEFT)
         tk.Entry(self.batch_options2_frame, textvariable=self.batch_pages_var,
-                 width=16, font=("Microsoft YaHei", 9)).pack(side=tk.LEFT, padx=(4, 0))
+                 width=16, font=self.font_body).pack(side=tk.LEFT, padx=(4, 0))
         self.cv_batch_options2 = self.panel_canvas.create_window(15, 245, window=self.batch_options2_frame, anchor="nw")
         self.panel_canvas.itemconfigure(self.cv_batch_options2, state='hidden')
 
         self.batch_options3_frame = tk.Frame(self.panel_canvas)
         tk.Checkbutton(self.batch_options3_frame, text="按页文件夹",
                        variable=self.batch_image_per_page_var,
-                       font=("Microsoft YaHei", 9)).pack(side=tk.LEFT, padx=(0, 8))
+                       font=self.font_body).pack(side=tk.LEFT, padx=(0, 8))
         tk.Checkbutton(self.batch_options3_frame, text="图片去重",
                        variable=self.batch_image_dedupe_var,
-                       font=("Microsoft YaHei", 9)).pack(side=tk.LEFT, padx=(0, 10))
+                       font=self.font_body).pack(side=tk.LEFT, padx=(0, 10))
         tk.Label(self.batch_options3_frame, text="图片格式:",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+                 font=self.font_body).pack(side=tk.LEFT)
         ttk.Combobox(
             self.batch_options3_frame, textvariable=self.batch_image_format_var,
             values=["原格式", "PNG", "JPEG"],
-            state='readonly', width=6, font=("Microsoft YaHei", 9)
+            state='readonly', width=6, font=self.font_body
         ).pack(side=tk.LEFT, padx=(4, 10))
         tk.Checkbutton(self.batch_options3_frame, text="打包ZIP",
                        variable=self.batch_zip_enabled_var,
-                       font=("Microsoft YaHei", 9)).pack(side=tk.LEFT, padx=(0, 0))
+                       font=self.font_body).pack(side=tk.LEFT, padx=(0, 0))
         self.cv_batch_options3 = self.panel_canvas.create_window(15, 280, window=self.batch_options3_frame, anchor="nw")
         self.panel_canvas.itemconfigure(self.cv_batch_options3, state='hidden')
 
         self.batch_options4_frame = tk.Frame(self.panel_canvas)
         tk.Label(self.batch_options4_frame, text="关键词:",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+                 font=self.font_body).pack(side=tk.LEFT)
         tk.Entry(self.batch_options4_frame, textvariable=self.batch_keyword_var,
-                 width=12, font=("Microsoft YaHei", 9)).pack(side=tk.LEFT, padx=(4, 12))
+                 width=12, font=self.font_body).pack(side=tk.LEFT, padx=(4, 12))
         tk.Checkbutton(self.batch_options4_frame, text="正则过滤",
                        variable=self.batch_regex_enabled_var,
-                       font=("Microsoft YaHei", 9)).pack(side=tk.LEFT, padx=(0, 10))
+                       font=self.font_body).pack(side=tk.LEFT, padx=(0, 10))
         tk.Label(self.batch_options4_frame, text="模板:",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+                 font=self.font_body).pack(side=tk.LEFT)
         self.batch_regex_template_combo = ttk.Combobox(
             self.batch_options4_frame, textvariable=self.batch_regex_template_var,
             values=[name for name, _ in BATCH_REGEX_TEMPLATES],
-            state='readonly', width=15, font=("Microsoft YaHei", 9)
+            state='readonly', width=15, font=self.font_body
         )
         self.batch_regex_template_combo.pack(side=tk.LEFT, padx=(4, 0))
         self.batch_regex_template_combo.bind("<<ComboboxSelected>>", self._on_batch_regex_template_changed)
@@ -965,85 +1457,87 @@ class PDFConverterApp:
 
         self.batch_options5_frame = tk.Frame(self.panel_canvas)
         tk.Label(self.batch_options5_frame, text="表达式:",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+                 font=self.font_body).pack(side=tk.LEFT)
         tk.Entry(self.batch_options5_frame, textvariable=self.batch_regex_var,
-                 width=44, font=("Microsoft YaHei", 9)).pack(side=tk.LEFT, padx=(6, 0))
+                 width=44, font=self.font_body).pack(side=tk.LEFT, padx=(6, 0))
         self.cv_batch_options5 = self.panel_canvas.create_window(15, 350, window=self.batch_options5_frame, anchor="nw")
         self.panel_canvas.itemconfigure(self.cv_batch_options5, state='hidden')
 
         self.cv_batch_hint = self.panel_canvas.create_text(
             15, 375, text="页码示例: 1,3,5-10；关键词可用逗号分隔；可从“模板”选择后自动填充表达式",
-            font=("Microsoft YaHei", 8), anchor="nw", fill="#888888"
+            font=self.font_small, anchor="nw", fill="#888888"
         )
         self.panel_canvas.itemconfigure(self.cv_batch_hint, state='hidden')
 
-        # PDF批量盖章选项（分4行，避免固定窗口遮挡）
+        return (self.cv_batch_options, self.cv_batch_options2, self.cv_batch_options3,
+                self.cv_batch_options4, self.cv_batch_options5, self.cv_batch_hint)
+
+    def _build_stamp_options(self):
+        """创建PDF批量盖章选项区（分4行，避免固定窗口遮挡）"""
         self.stamp_options_frame = tk.Frame(self.panel_canvas)
         tk.Label(self.stamp_options_frame, text="模式:",
-                 font=("Microsoft YaHei", 9, "bold")).pack(side=tk.LEFT)
+                 font=self.font_body_bold).pack(side=tk.LEFT)
         self.stamp_mode_combo = ttk.Combobox(
             self.stamp_options_frame, textvariable=self.stamp_mode_var,
             values=["普通章", "二维码", "骑缝章", "模板", "签名"],
-            state='readonly', width=7, font=("Microsoft YaHei", 9)
+            state='readonly', width=7, font=self.font_body
         )
         self.stamp_mode_combo.pack(side=tk.LEFT, padx=(6, 8))
         self.stamp_mode_combo.bind("<<ComboboxSelected>>", self._on_stamp_mode_changed)
         tk.Button(self.stamp_options_frame, text="章图(多选)...",
-                  font=("Microsoft YaHei", 8), command=self._choose_stamp_image,
+                  font=self.font_small, command=self._choose_stamp_image,
                   cursor='hand2').pack(side=tk.LEFT, padx=(0, 6))
         tk.Button(self.stamp_options_frame, text="清除章图",
-                  font=("Microsoft YaHei", 8), command=self._clear_stamp_images,
+                  font=self.font_small, command=self._clear_stamp_images,
                   cursor='hand2').pack(side=tk.LEFT, padx=(0, 6))
-        self.stamp_image_label = tk.Label(self.stamp_options_frame, text="",
-                                          font=("Microsoft YaHei", 8), fg="#666")
-        self.stamp_image_label.pack(side=tk.LEFT, padx=(0, 8))
+        tk.Label(self.stamp_options_frame, textvariable=self.stamp_image_text_var,
+                 font=self.font_small, fg="#666").pack(side=tk.LEFT, padx=(0, 8))
         tk.Button(self.stamp_options_frame, text="模板...",
-                  font=("Microsoft YaHei", 8), command=self._choose_stamp_template,
+                  font=self.font_small, command=self._choose_stamp_template,
                   cursor='hand2').pack(side=tk.LEFT, padx=(0, 6))
-        self.stamp_template_label = tk.Label(self.stamp_options_frame, text="",
-                                             font=("Microsoft YaHei", 8), fg="#666")
-        self.stamp_template_label.pack(side=tk.LEFT)
+        tk.Label(self.stamp_options_frame, textvariable=self.stamp_template_text_var,
+                 font=self.font_small, fg="#666").pack(side=tk.LEFT)
         self.cv_stamp_options = self.panel_canvas.create_window(15, 210, window=self.stamp_options_frame, anchor="nw")
         self.panel_canvas.itemconfigure(self.cv_stamp_options, state='hidden')
 
         self.stamp_options2_frame = tk.Frame(self.panel_canvas)
         tk.Label(self.stamp_options2_frame, text="二维码内容:",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+                 font=self.font_body).pack(side=tk.LEFT)
         self.stamp_qr_entry = tk.Entry(self.stamp_options2_frame, textvariable=self.stamp_qr_text_var,
-                                       width=14, font=("Microsoft YaHei", 9))
+                                       width=14, font=self.font_body)
         self.stamp_qr_entry.pack(side=tk.LEFT, padx=(4, 10))
         tk.Label(self.stamp_options2_frame, text="页码:",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+                 font=self.font_body).pack(side=tk.LEFT)
         tk.Entry(self.stamp_options2_frame, textvariable=self.stamp_pages_var,
-                 width=14, font=("Microsoft YaHei", 9)).pack(side=tk.LEFT, padx=(4, 10))
+                 width=14, font=self.font_body).pack(side=tk.LEFT, padx=(4, 10))
         tk.Checkbutton(self.stamp_options2_frame, text="去白底",
                        variable=self.stamp_remove_white_bg_var,
-                       font=("Microsoft YaHei", 9)).pack(side=tk.LEFT, padx=(0, 0))
+                       font=self.font_body).pack(side=tk.LEFT, padx=(0, 0))
         self.cv_stamp_options2 = self.panel_canvas.create_window(15, 245, window=self.stamp_options2_frame, anchor="nw")
         self.panel_canvas.itemconfigure(self.cv_stamp_options2, state='hidden')
 
         self.stamp_options3_frame = tk.Frame(self.panel_canvas)
         tk.Label(self.stamp_options3_frame, text="骑缝边:",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+                 font=self.font_body).pack(side=tk.LEFT)
         self.stamp_seam_side_combo = ttk.Combobox(
             self.stamp_options3_frame, textvariable=self.stamp_seam_side_var,
             values=["右侧", "左侧", "顶部", "底部"],
-            state='readonly', width=5, font=("Microsoft YaHei", 9)
+            state='readonly', width=5, font=self.font_body
         )
         self.stamp_seam_side_combo.pack(side=tk.LEFT, padx=(4, 8))
         tk.Label(self.stamp_options3_frame, text="对齐:",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+                 font=self.font_body).pack(side=tk.LEFT)
         self.stamp_seam_align_combo = ttk.Combobox(
             self.stamp_options3_frame, textvariable=self.stamp_seam_align_var,
             values=["居中", "顶部", "底部"],
-            state='readonly', width=5, font=("Microsoft YaHei", 9)
+            state='readonly', width=5, font=self.font_body
         )
         self.stamp_seam_align_combo.pack(side=tk.LEFT, padx=(4, 8))
         tk.Label(self.stamp_options3_frame, text="压边比例:",
-                 font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+                 font=self.font_body).pack(side=tk.LEFT)
         self.stamp_seam_overlap_entry = tk.Entry(
             self.stamp_options3_frame, textvariable=self.stamp_seam_overlap_var,
-            width=6, font=("Microsoft YaHei", 9)
+            width=6, font=self.font_body
         )
         self.stamp_seam_overlap_entry.pack(side=tk.LEFT, padx=(4, 0))
         self.cv_stamp_options3 = self.panel_canvas.create_window(15, 280, window=self.stamp_options3_frame, anchor="nw")
@@ -1052,95 +1546,39 @@ class PDFConverterApp:
         self.stamp_options4_frame = tk.Frame(self.panel_canvas)
         self.stamp_preview_btn = tk.Button(
             self.stamp_options4_frame, text="预览设置...",
-            font=("Microsoft YaHei", 8), command=self._open_stamp_preview,
+            font=self.font_small, command=self._open_stamp_preview,
             cursor='hand2'
         )
         self.stamp_preview_btn.pack(side=tk.LEFT, padx=(0, 8))
         self.stamp_export_template_btn = tk.Button(
             self.stamp_options4_frame, text="导出模板...",
-            font=("Microsoft YaHei", 8), command=self._export_stamp_template_from_current,
+            font=self.font_small, command=self._export_stamp_template_from_current,
             cursor='hand2'
         )
         self.stamp_export_template_btn.pack(side=tk.LEFT, padx=(0, 8))
         tk.Label(self.stamp_options4_frame, textvariable=self.stamp_preview_info_var,
-                 font=("Microsoft YaHei", 8), fg="#666").pack(side=tk.LEFT)
+                 font=self.font_small, fg="#666").pack(side=tk.LEFT)
         self.cv_stamp_options4 = self.panel_canvas.create_window(15, 315, window=self.stamp_options4_frame, anchor="nw")
         self.panel_canvas.itemconfigure(self.cv_stamp_options4, state='hidden')
 
-        self.stamp_hint_var = tk.StringVar(value="")
         self.stamp_hint_frame = tk.Frame(self.panel_canvas)
         tk.Label(self.stamp_hint_frame, textvariable=self.stamp_hint_var,
-                 font=("Microsoft YaHei", 8), fg="#888888").pack(anchor=tk.W)
+                 font=self.font_small, fg="#888888").pack(anchor=tk.W)
         self.cv_stamp_hint = self.panel_canvas.create_window(15, 340, window=self.stamp_hint_frame, anchor="nw")
         self.panel_canvas.itemconfigure(self.cv_stamp_hint, state='hidden')
+        self._apply_stamp_mode_states()
 
-        # API状态提示
-        self.cv_api_hint = self.panel_canvas.create_text(
-            15, 270, text="", font=("Microsoft YaHei", 8), anchor="nw", fill="#888888"
-        )
+        return (self.cv_stamp_options, self.cv_stamp_options2, self.cv_stamp_options3,
+                self.cv_stamp_options4, self.cv_stamp_hint)
 
-        # 进度条
-        self.progress_bar = ttk.Progressbar(self.panel_canvas, mode='determinate')
-        self.cv_progress_bar = self.panel_canvas.create_window(
-            20, self.progress_y, window=self.progress_bar, anchor="nw", width=1, height=25
-        )
+    def _schedule_layout(self):
+        """空闲时再重新布局；同一轮事件中的多次切换只布局一次"""
+        if self._layout_job is None:
+            self._layout_job = self.root.after_idle(self._run_scheduled_layout)
 
-        # 进度文本
-        self.cv_progress_text = self.panel_canvas.create_text(
-            0, self.progress_text_y, text="", font=("Microsoft YaHei", 9), anchor="n"
-        )
-
-        # 按钮
-        btn_frame = tk.Frame(self.panel_canvas)
-        self.convert_btn = tk.Button(
-            btn_frame, text="开始转换", command=self.start_conversion,
-            font=("Microsoft YaHei", 12, "bold"), padx=40, pady=12, cursor='hand2'
-        )
-        self.convert_btn.pack(side=tk.LEFT, expand=True, padx=5)
-        tk.Button(
-            btn_frame, text="清除", command=self.clear_selection,
-            font=("Microsoft YaHei", 12), padx=40, pady=12, cursor='hand2'
-        ).pack(side=tk.LEFT, expand=True, padx=5)
-        self.cv_btn_frame = self.panel_canvas.create_window(
-            0, self.btn_y, window=btn_frame, anchor="n"
-        )
-
-        # 拖拽提示
-        dnd_text = "支持拖拽文件到窗口" if WINDND_AVAILABLE else ""
-        self.cv_dnd_hint = self.panel_canvas.create_text(
-            0, self.dnd_y, text=dnd_text, font=("Microsoft YaHei", 8),
-            anchor="n", fill="#aaaaaa"
-        )
-
-        # 状态栏
-        self.cv_status_text = self.panel_canvas.create_text(
-            15, 0, text=self.status_message.get(),
-            font=("Microsoft YaHei", 9), anchor="sw"
-        )
-        self.status_message.trace_add("write", self._on_status_var_changed)
-        self._update_stamp_preview_info()
-        self._on_bookmark_mode_changed(save=False)
-
-        # 事件绑定
-        self.root.bind("<Configure>", self.on_root_resize)
-        self.panel_canvas.bind("<Configure>", self.on_panel_resize)
-        self.root.after(50, self.refresh_layout)
-
-    # ==========================================================
-    # Canvas文字/布局
-    # ==========================================================
-
-    def _on_title_var_changed(self, *args):
-        if self.panel_canvas:
-            self.panel_canvas.itemconfigure(self.cv_title, text=self.title_text_var.get())
-
-    def _on_status_var_changed(self, *args):
-        if self.panel_canvas:
-            self.panel_canvas.itemconfigure(self.cv_status_text, text=self.status_message.get())
-
-    def set_progress_text(self, text):
-        if self.panel_canvas:
-            self.panel_canvas.itemconfigure(self.cv_progress_text, text=text)
+    def _run_scheduled_layout(self):
+        self._layout_job = None
+        self.layout_canvas()
 
     def layout_canvas(self):
         """根据Canvas尺寸重新布局所有元素"""
@@ -1148,56 +1586,17 @@ class PDFConverterApp:
         h = self.panel_canvas.winfo_height()
         if w <= 1 or h <= 1:
             return
-        cx = w // 2
-        self.panel_canvas.coords(self.cv_title, cx, 35)
-        self.panel_canvas.coords(self.cv_subtitle, cx, 75)
-        self.panel_canvas.coords(self.cv_section1, 15, 105)
-        self.panel_canvas.coords(self.cv_file_frame, 15, 130)
-        self.panel_canvas.itemconfigure(self.cv_file_frame, width=w - 30)
-        self.panel_canvas.coords(self.cv_section2, 15, 185)
-        self.panel_canvas.coords(self.cv_range_frame, 15, 210)
-        self.panel_canvas.coords(self.cv_formula_frame, 15, 245)
-        self.panel_canvas.coords(self.cv_image_options, 15, 245)
-        self.panel_canvas.coords(self.cv_merge_info, 15, 210)
-        self.panel_canvas.coords(self.cv_split_options, 15, 210)
-        self.panel_canvas.coords(self.cv_img2pdf_options, 15, 210)
-        self.panel_canvas.coords(self.cv_watermark_options, 15, 210)
-        self.panel_canvas.coords(self.cv_watermark_detail, 15, 245)
-        self.panel_canvas.coords(self.cv_encrypt_options, 15, 210)
-        self.panel_canvas.coords(self.cv_encrypt_perm, 15, 245)
-        self.panel_canvas.coords(self.cv_compress_options, 15, 210)
-        self.panel_canvas.coords(self.cv_compress_hint, 15, 245)
-        self.panel_canvas.coords(self.cv_extract_options, 15, 210)
-        self.panel_canvas.coords(self.cv_extract_hint, 15, 245)
-        self.panel_canvas.coords(self.cv_reorder_options, 15, 210)
-        self.panel_canvas.coords(self.cv_reorder_hint, 15, 278)
-        self.panel_canvas.coords(self.cv_bookmark_options, 15, 210)
-        self.panel_canvas.coords(self.cv_bookmark_options2, 15, 245)
-        self.panel_canvas.coords(self.cv_bookmark_options3, 15, 280)
-        self.panel_canvas.coords(self.cv_bookmark_options4, 15, 315)
-        self.panel_canvas.coords(self.cv_bookmark_options5, 15, 350)
-        self.panel_canvas.coords(self.cv_bookmark_hint, 15, 375)
-        self.panel_canvas.coords(self.cv_excel_options, 15, 210)
-        self.panel_canvas.coords(self.cv_excel_mode, 15, 245)
-        self.panel_canvas.coords(self.cv_excel_hint, 15, 270)
-        self.panel_canvas.coords(self.cv_batch_options, 15, 210)
-        self.panel_canvas.coords(self.cv_batch_options2, 15, 245)
-        self.panel_canvas.coords(self.cv_batch_options3, 15, 280)
-        self.panel_canvas.coords(self.cv_batch_options4, 15, 315)
-        self.panel_canvas.coords(self.cv_batch_options5, 15, 350)
-        self.panel_canvas.coords(self.cv_batch_hint, 15, 375)
-        self.panel_canvas.coords(self.cv_stamp_options, 15, 210)
-        self.panel_canvas.coords(self.cv_stamp_options2, 15, 245)
-        self.panel_canvas.coords(self.cv_stamp_options3, 15, 280)
-        self.panel_canvas.coords(self.cv_stamp_options4, 15, 315)
-        self.panel_canvas.coords(self.cv_stamp_hint, 15, 340)
-        self.panel_canvas.coords(self.cv_api_hint, 15, 270)
-        self.panel_canvas.coords(self.cv_progress_bar, 20, self.progress_y)
-        self.panel_canvas.itemconfigure(self.cv_progress_bar, width=w - 40)
-        self.panel_canvas.coords(self.cv_progress_text, cx, self.progress_text_y)
-        self.panel_canvas.coords(self.cv_btn_frame, cx, self.btn_y)
-        self.panel_canvas.coords(self.cv_dnd_hint, cx, self.dnd_y)
-        self.panel_canvas.coords(self.cv_status_text, 15, h - 10)
+        key = (w, h, self.progress_y, self.progress_text_y, self.btn_y, self.dnd_y)
+        if key == self._last_layout:
+            return  # 拖动窗口时 <Configure> 逐像素触发，尺寸未变则无需重排
+        self._last_layout = key
+        # 左对齐的各选项区创建时已在固定坐标，这里只更新随宽高和功能变化的项；
+        # 这些命令预先拼成一段 Tcl 脚本，整段一次求值
+        self.panel_canvas.tk.eval(self._layout_script.format(
+            cx=w // 2, file_w=w - 30, bar_w=w - 40,
+            progress_y=self.progress_y, progress_text_y=self.progress_text_y,
+            btn_y=self.btn_y, dnd_y=self.dnd_y, status_y=h - 10,
+        ))
 
     # ==========================================================
     # 功能切换 / 选项变化
@@ -1205,193 +1604,34 @@ class PDFConverterApp:
 
     def _on_function_changed(self, event=None):
         func = self.current_function_var.get()
-        self.progress_y = 290
-        self.progress_text_y = 325
-        self.btn_y = 370
-        self.dnd_y = 410
-
-        # 先隐藏所有可选区域
-        for cv_item in [self.cv_formula_frame, self.cv_api_hint,
-                        self.cv_image_options, self.cv_merge_info,
-                        self.cv_split_options, self.cv_img2pdf_options,
-                        self.cv_watermark_options, self.cv_watermark_detail,
-                        self.cv_encrypt_options, self.cv_encrypt_perm,
-                        self.cv_compress_options, self.cv_compress_hint,
-                        self.cv_extract_options, self.cv_extract_hint,
-                        self.cv_reorder_options, self.cv_reorder_hint,
-                        self.cv_bookmark_options, self.cv_bookmark_options2, self.cv_bookmark_options3,
-                        self.cv_bookmark_options4, self.cv_bookmark_options5, self.cv_bookmark_hint,
-                        self.cv_excel_options, self.cv_excel_mode, self.cv_excel_hint,
-                        self.cv_batch_options, self.cv_batch_options2, self.cv_batch_options3, self.cv_batch_options4, self.cv_batch_options5, self.cv_batch_hint,
-                        self.cv_stamp_options, self.cv_stamp_options2, self.cv_stamp_options3, self.cv_stamp_options4, self.cv_stamp_hint]:
+        section1, section2, layout, on_enter = FUNCTION_PANEL_CONFIG.get(
+            func, ("", "", DEFAULT_PANEL_LAYOUT, None))
+        # 与上一个功能的纵向布局相同时无需重排（宽高变化由 <Configure> 负责）
+        relayout = layout != (self.progress_y, self.progress_text_y, self.btn_y, self.dnd_y)
+        self.progress_y, self.progress_text_y, self.btn_y, self.dnd_y = layout
+
+        builder = self._option_builders.pop(func, None)
+        if builder is not None:
+            self._mode_frames[func] = frozenset(builder())
+
+        # 只隐藏/显示与上一个功能不同的项，两个功能共用的项保持不动
+        shown = self._mode_frames.get(func, frozenset())
+        for cv_item in self._mode_items_shown - shown:
             self.panel_canvas.itemconfigure(cv_item, state='hidden')
+        for cv_item in shown - self._mode_items_shown:
+            self.panel_canvas.itemconfigure(cv_item, state='normal')
+        self._mode_items_shown = shown
 
-        title_prefix = self.title_text_var.get().split(' - ')[0] if ' - ' in self.title_text_var.get() else self.title_text_var.get()
-
-        if func == "PDF转Word":
-            self.panel_canvas.itemconfigure(self.cv_section2, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_range_frame, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_formula_frame, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_api_hint, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_section1, text="选择PDF文件（可多选）")
-            self.panel_canvas.itemconfigure(self.cv_section2, text="页范围（可选）")
-            self.root.title(f"{title_prefix} - PDF转Word")
-
-        elif func == "PDF转图片":
-            self.panel_canvas.itemconfigure(self.cv_section2, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_range_frame, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_image_options, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_section1, text="选择PDF文件（可多选）")
-            self.panel_canvas.itemconfigure(self.cv_section2, text="页范围（可选）")
-            self.root.title(f"{title_prefix} - PDF转图片")
+        self.panel_canvas.itemconfigure(self.cv_section1, text=section1)
+        self.panel_canvas.itemconfigure(self.cv_section2, text=section2)
+        if on_enter is not None:
+            getattr(self, on_enter)()
+        title = self.title_text_var.get()
+        title_prefix = title.split(' - ')[0] if ' - ' in title else title
+        self.root.title(f"{title_prefix} - {func}")
 
-        elif func == "PDF合并":
-            self.panel_canvas.itemconfigure(self.cv_section2, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_range_frame, state='hidden')
-            self.panel_canvas.itemconfigure(self.cv_merge_info, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_section1, text="选择PDF文件（至少2个）")
-            self.panel_canvas.itemconfigure(self.cv_section2, text="文件信息")
-            self.merge_info_label.config(text="请选择至少2个PDF文件，将按选择顺序合并")
-            self.root.title(f"{title_prefix} - PDF合并")
-
-        elif func == "PDF拆分":
-            self.panel_canvas.itemconfigure(self.cv_section2, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_range_frame, state='hidden')
-            self.panel_canvas.itemconfigure(self.cv_split_options, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_section1, text="选择PDF文件")
-            self.panel_canvas.itemconfigure(self.cv_section2, text="拆分选项")
-            self._on_split_mode_changed()
-            self.root.title(f"{title_prefix} - PDF拆分")
-
-        elif func == "图片转PDF":
-            self.panel_canvas.itemconfigure(self.cv_section2, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_range_frame, state='hidden')
-            self.panel_canvas.itemconfigure(self.cv_img2pdf_options, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_section1, text="选择图片文件（可多选）")
-            self.panel_canvas.itemconfigure(self.cv_section2, text="输出选项")
-            self.root.title(f"{title_prefix} - 图片转PDF")
-
-        elif func == "PDF加水印":
-            self.panel_canvas.itemconfigure(self.cv_section2, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_range_frame, state='hidden')
-            self.panel_canvas.itemconfigure(self.cv_watermark_options, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_watermark_detail, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_section1, text="选择PDF文件")
-            self.panel_canvas.itemconfigure(self.cv_section2, text="水印选项")
-            self.root.title(f"{title_prefix} - PDF加水印")
-
-        elif func == "PDF加密/解密":
-            self.panel_canvas.itemconfigure(self.cv_section2, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_range_frame, state='hidden')
-            self.panel_canvas.itemconfigure(self.cv_encrypt_options, state='normal')
-            self._on_encrypt_mode_changed()
-            self.panel_canvas.itemconfigure(self.cv_section1, text="选择PDF文件")
-            self.panel_canvas.itemconfigure(self.cv_section2, text="加密/解密选项")
-            self.root.title(f"{title_prefix} - PDF加密/解密")
-
-        elif func == "PDF压缩":
-            self.panel_canvas.itemconfigure(self.cv_section2, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_range_frame, state='hidden')
-            self.panel_canvas.itemconfigure(self.cv_compress_options, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_compress_hint, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_section1, text="选择PDF文件")
-            self.panel_canvas.itemconfigure(self.cv_section2, text="压缩选项")
-            self.root.title(f"{title_prefix} - PDF压缩")
-
-        elif func == "PDF提取/删页":
-            self.panel_canvas.itemconfigure(self.cv_section2, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_range_frame, state='hidden')
-            self.panel_canvas.itemconfigure(self.cv_extract_options, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_extract_hint, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_section1, text="选择PDF文件")
-            self.panel_canvas.itemconfigure(self.cv_section2, text="提取/删页选项")
-            self.root.title(f"{title_prefix} - PDF提取/删页")
-
-        elif func == "OCR可搜索PDF":
-            self.panel_canvas.itemconfigure(self.cv_section2, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_range_frame, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_api_hint, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_section1, text="选择扫描版PDF文件")
-            self.panel_canvas.itemconfigure(self.cv_section2, text="页范围（可选）")
-            self.root.title(f"{title_prefix} - OCR可搜索PDF")
-
-        elif func == "PDF页面重排/旋转/倒序":
-            self.panel_canvas.itemconfigure(self.cv_section2, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_range_frame, state='hidden')
-            self.panel_canvas.itemconfigure(self.cv_reorder_options, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_reorder_hint, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_section1, text="选择PDF文件")
-            self.panel_canvas.itemconfigure(self.cv_section2, text="页面处理选项")
-            self.progress_y = 315
-            self.progress_text_y = 350
-            self.btn_y = 395
-            self.dnd_y = 435
-            self._on_reorder_mode_changed()
-            self.root.title(f"{title_prefix} - PDF页面重排/旋转/倒序")
-
-        elif func == "PDF添加/移除书签":
-            self.panel_canvas.itemconfigure(self.cv_section2, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_range_frame, state='hidden')
-            self.panel_canvas.itemconfigure(self.cv_bookmark_options, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_bookmark_options2, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_bookmark_options3, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_bookmark_options4, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_bookmark_options5, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_bookmark_hint, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_section1, text="选择PDF文件")
-            self.panel_canvas.itemconfigure(self.cv_section2, text="书签处理选项")
-            self.progress_y = 400
-            self.progress_text_y = 435
-            self.btn_y = 470
-            self.dnd_y = 510
-            self._on_bookmark_mode_changed()
-            self.root.title(f"{title_prefix} - PDF添加/移除书签")
-
-        elif func == "PDF转Excel":
-            self.panel_canvas.itemconfigure(self.cv_section2, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_range_frame, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_excel_options, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_excel_mode, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_excel_hint, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_section1, text="选择包含表格的PDF文件")
-            self.panel_canvas.itemconfigure(self.cv_section2, text="页范围（可选）")
-            self.root.title(f"{title_prefix} - PDF转Excel")
-
-        if func == "PDF批量文本/图片提取":
-            self.panel_canvas.itemconfigure(self.cv_section2, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_range_frame, state='hidden')
-            self.panel_canvas.itemconfigure(self.cv_batch_options, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_batch_options2, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_batch_options3, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_batch_options4, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_batch_options5, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_batch_hint, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_section1, text="选择PDF文件（可多选）")
-            self.panel_canvas.itemconfigure(self.cv_section2, text="批量提取选项")
-            self.progress_y = 395
-            self.progress_text_y = 430
-            self.btn_y = 465
-            self.dnd_y = 505
-            self.root.title(f"{title_prefix} - PDF批量文本/图片提取")
-
-        if func == "PDF批量盖章":
-            self.panel_canvas.itemconfigure(self.cv_section2, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_range_frame, state='hidden')
-            self.panel_canvas.itemconfigure(self.cv_stamp_options, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_stamp_options2, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_stamp_options3, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_stamp_options4, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_stamp_hint, state='normal')
-            self.panel_canvas.itemconfigure(self.cv_section1, text="选择PDF文件（可多选）")
-            self.panel_canvas.itemconfigure(self.cv_section2, text="批量盖章选项")
-            self.progress_y = 370
-            self.progress_text_y = 405
-            self.btn_y = 450
-            self.dnd_y = 490
-            self._on_stamp_mode_changed()
-            self.root.title(f"{title_prefix} - PDF批量盖章")
-
-        self.layout_canvas()
+        if relayout:
+            self._schedule_layout()
 
         self.selected_file.set("")
         self.selected_files_list = []
@@ -1399,29 +1639,44 @@ class PDFConverterApp:
         self.status_message.set("就绪")
         self.save_settings()
 
+    def _reset_merge_info(self):
+        self.merge_info_label.config(text="请选择至少2个PDF文件，将按选择顺序合并")
+
     def _on_option_changed(self):
         self._update_api_hint()
         self.save_settings()
 
-    def _default_stamp_profile(self):
-        base = self.stamp_preview_profile or {}
-        return {
+    def _clamped_preview_profile(self):
+        """夹取后的 stamp_preview_profile；该字典只会整体替换，按对象身份缓存结果"""
+        base = self.stamp_preview_profile
+        src, clamped = self._clamped_preview_cache
+        if src is base and clamped is not None:
+            return clamped
+        base = base or {}
+        clamp = self._clamp_value
+        clamped = {
             "enabled": True,
-            "x_ratio": self._clamp_value(base.get("x_ratio", 0.85), 0.0, 1.0, 0.85),
-            "y_ratio": self._clamp_value(base.get("y_ratio", 0.85), 0.0, 1.0, 0.85),
-            "size_ratio": self._clamp_value(base.get("size_ratio", 0.18), 0.03, 0.7, 0.18),
-            "opacity": self._clamp_value(base.get("opacity", 0.85), 0.05, 1.0, 0.85),
+            "x_ratio": clamp(base.get("x_ratio", 0.85), 0.0, 1.0, 0.85),
+            "y_ratio": clamp(base.get("y_ratio", 0.85), 0.0, 1.0, 0.85),
+            "size_ratio": clamp(base.get("size_ratio", 0.18), 0.03, 0.7, 0.18),
+            "opacity": clamp(base.get("opacity", 0.85), 0.05, 1.0, 0.85),
         }
+        self._clamped_preview_cache = (self.stamp_preview_profile, clamped)
+        return clamped
+
+    def _default_stamp_profile(self):
+        return dict(self._clamped_preview_profile())
 
     def _normalize_stamp_profile(self, profile):
-        data = dict(profile or {})
-        default = self._default_stamp_profile()
+        data = profile or {}
+        default = self._clamped_preview_profile()
+        clamp = self._clamp_value
         return {
-            "enabled": bool(data.get("enabled", default["enabled"])),
-            "x_ratio": self._clamp_value(data.get("x_ratio", default["x_ratio"]), 0.0, 1.0, default["x_ratio"]),
-            "y_ratio": self._clamp_value(data.get("y_ratio", default["y_ratio"]), 0.0, 1.0, default["y_ratio"]),
-            "size_ratio": self._clamp_value(data.get("size_ratio", default["size_ratio"]), 0.03, 0.7, default["size_ratio"]),
-            "opacity": self._clamp_value(data.get("opacity", default["opacity"]), 0.05, 1.0, default["opacity"]),
+            "enabled": bool(data.get("enabled", True)),
+            "x_ratio": clamp(data.get("x_ratio", default["x_ratio"]), 0.0, 1.0, default["x_ratio"]),
+            "y_ratio": clamp(data.get("y_ratio", default["y_ratio"]), 0.0, 1.0, default["y_ratio"]),
+            "size_ratio": clamp(data.get("size_ratio", default["size_ratio"]), 0.03, 0.7, default["size_ratio"]),
+            "opacity": clamp(data.get("opacity", default["opacity"]), 0.05, 1.0, default["opacity"]),
         }
 
     def _set_stamp_images(self, paths, selected_idx=None):
@@ -1446,7 +1701,7 @@ class PDFConverterApp:
         for full in cleaned:
             self.stamp_profiles[full] = self._normalize_stamp_profile(old_profiles.get(full))
 
-        self.stamp_image_paths = cleaned
+        self._assign_stamp_image_paths(cleaned)
         if isinstance(self.signature_page_profiles, dict):
             new_sig = {}
             for page_key, page_data in self.signature_page_profiles.items():
@@ -1455,7 +1710,7 @@ class PDFConverterApp:
                 kept = {}
                 for p, prof in page_data.items():
                     full = os.path.abspath(str(p))
-                    if full in self.stamp_image_paths and isinstance(prof, dict):
+                    if full in self.stamp_image_path_to_idx and isinstance(prof, dict):
                         kept[full] = prof
                 if kept:
                     new_sig[str(page_key)] = kept
@@ -1463,23 +1718,27 @@ class PDFConverterApp:
         if not cleaned:
             self.stamp_selected_image_idx = 0
             self.stamp_image_path = ""
-            self._update_stamp_image_label()
+            self._update_stamp_image_label(active="")
             return
 
         if selected_idx is None:
-            prev = self.stamp_image_path if self.stamp_image_path in cleaned else None
-            if prev:
-                idx = cleaned.index(prev)
-            else:
+            idx = self.stamp_image_path_to_idx.get(self.stamp_image_path)
+            if idx is None:
                 idx = min(max(int(self.stamp_selected_image_idx or 0), 0), len(cleaned) - 1)
         else:
             idx = min(max(int(selected_idx), 0), len(cleaned) - 1)
 
         self.stamp_selected_image_idx = idx
         self.stamp_image_path = cleaned[idx]
-        self._update_stamp_image_label()
+        # cleaned 刚逐个检查过存在性，直接用选中项更新标签，不再重新扫描
+        self._update_stamp_image_label(active=self.stamp_image_path)
         self._preheat_stamp_images_async(self.stamp_image_paths)
 
+    def _assign_stamp_image_paths(self, paths):
+        """替换章图列表并同步重建路径索引"""
+        self.stamp_image_paths = paths
+        self.stamp_image_path_to_idx = {p: i for i, p in enumerate(paths)}
+
     def _get_stamp_profile_for_path(self, image_path):
         if not image_path:
             return self._default_stamp_profile()
@@ -1487,9 +1746,6 @@ class PDFConverterApp:
         if existing is None:
             existing = self._default_stamp_profile()
             self.stamp_profiles[image_path] = existing
-        else:
-            existing = self._normalize_stamp_profile(existing)
-            self.stamp_profiles[image_path] = existing
         return existing
 
     def _get_enabled_stamp_profiles(self):
@@ -1510,34 +1766,35 @@ class PDFConverterApp:
             })
         return profiles
 
-    def _update_stamp_image_label(self):
+    def _update_stamp_image_label(self, active=None):
         count = len(self.stamp_image_paths or [])
         if count <= 0:
-            self.stamp_image_label.config(text="")
+            self.stamp_image_text_var.set("")
             return
-        active = self._get_active_stamp_image_path()
+        if active is None:
+            active = self._get_active_stamp_image_path()
         if not active:
-            self.stamp_image_label.config(text=f"{count}个章图")
+            self.stamp_image_text_var.set(f"{count}个章图")
             return
         name = os.path.basename(active)
-        short = name if len(name) <= 12 else name[:9] + "..."
+        short = _short_name(name, 12)
         if count == 1:
-            self.stamp_image_label.config(text=short)
+            self.stamp_image_text_var.set(short)
         else:
-            self.stamp_image_label.config(text=f"{count}个章图 | {short}")
+            self.stamp_image_text_var.set(f"{count}个章图 | {short}")
 
     def _get_active_stamp_image_path(self):
         if self.stamp_image_paths:
             valid = [p for p in self.stamp_image_paths if os.path.exists(p)]
             if valid != self.stamp_image_paths:
-                self.stamp_image_paths = valid
+                self._assign_stamp_image_paths(valid)
             if self.stamp_image_paths:
                 idx = min(max(int(self.stamp_selected_image_idx or 0), 0), len(self.stamp_image_paths) - 1)
                 self.stamp_selected_image_idx = idx
                 self.stamp_image_path = self.stamp_image_paths[idx]
                 return self.stamp_image_path
         if self.stamp_image_path and os.path.exists(self.stamp_image_path):
-            self.stamp_image_paths = [self.stamp_image_path]
+            self._assign_stamp_image_paths([self.stamp_image_path])
             self.stamp_selected_image_idx = 0
             return self.stamp_image_path
         self.stamp_image_path = ""
@@ -1546,12 +1803,11 @@ class PDFConverterApp:
     def _choose_stamp_image(self):
         filenames = filedialog.askopenfilenames(
             title="选择章图（可多选）",
-            filetypes=[("图片文件", "*.png;*.jpg;*.jpeg;*.bmp"), ("所有文件", "*.*")]
+            filetypes=IMAGE_FILETYPES
         )
         if filenames:
             self._set_stamp_images(list(filenames), selected_idx=0)
-            self._update_stamp_preview_info()
-            self.save_settings()
+            self._on_stamp_source_chosen()
 
     def _clear_stamp_images(self):
         if not self.stamp_image_paths and not self.stamp_image_path:
@@ -1567,17 +1823,20 @@ class PDFConverterApp:
     def _choose_stamp_template(self):
         filename = filedialog.askopenfilename(
             title="选择模板JSON",
-            filetypes=[("JSON文件", "*.json"), ("所有文件", "*.*")]
+            filetypes=JSON_FILETYPES
         )
         if filename:
             self.stamp_template_path = filename
-            name = os.path.basename(filename)
-            self.stamp_template_label.config(text=name if len(name) <= 16 else name[:13] + "...")
-            self._update_stamp_preview_info()
-            self.save_settings()
+            self.stamp_template_text_var.set(_short_name(os.path.basename(filename), 16))
+            self._on_stamp_source_chosen()
+
+    def _on_stamp_source_chosen(self):
+        """选定章图或模板后刷新预览说明并保存设置"""
+        self._update_stamp_preview_info()
+        self.save_settings()
 
     def _parse_template_pages_scope(self, pages_text):
-        parsed = PDFBatchStampConverter._parse_pages_str((pages_text or "").strip())
+        parsed = _load_converter("PDFBatchStampConverter")._parse_pages_str((pages_text or "").strip())
         if parsed is None:
             return None
         if not parsed:
@@ -1598,7 +1857,7 @@ class PDFConverterApp:
 
         template_data = {
             "version": 1,
-            "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "created_at": time.strftime("%Y-%m-%d %H:%M:%S"),
             "mode": mode_key,
             "remove_white_bg": bool(self.stamp_remove_white_bg_var.get()),
             "elements": [],
@@ -1612,18 +1871,17 @@ class PDFConverterApp:
         if mode_key == "template":
             if not (self.stamp_template_path and os.path.exists(self.stamp_template_path)):
                 raise ValueError("当前未选择模板 JSON。")
-            with open(self.stamp_template_path, "r", encoding="utf-8") as f:
-                loaded = json.load(f)
+            loaded = self._load_stamp_template(os.path.abspath(self.stamp_template_path))
             if isinstance(loaded, dict):
                 loaded_data = dict(loaded)
                 loaded_data.setdefault("version", 1)
-                loaded_data.setdefault("created_at", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+                loaded_data.setdefault("created_at", time.strftime("%Y-%m-%d %H:%M:%S"))
                 loaded_data["exported_from"] = os.path.abspath(self.stamp_template_path)
                 return loaded_data
             if isinstance(loaded, list):
                 return {
                     "version": 1,
-                    "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    "created_at": time.strftime("%Y-%m-%d %H:%M:%S"),
                     "mode": "template",
                     "elements": loaded,
                 }
@@ -1659,11 +1917,9 @@ class PDFConverterApp:
                         "opacity": it["opacity"],
                     }))
             else:
-                seam_side_map = {"右侧": "right", "左侧": "left", "顶部": "top", "底部": "bottom"}
-                seam_align_map = {"居中": "center", "顶部": "top", "底部": "bottom"}
                 overlap = self._clamp_value(self.stamp_seam_overlap_var.get(), 0.05, 0.95, 0.25)
-                side = seam_side_map.get(self.stamp_seam_side_var.get(), "right")
-                align = seam_align_map.get(self.stamp_seam_align_var.get(), "center")
+                side = SEAM_SIDE_TO_KEY.get(self.stamp_seam_side_var.get(), "right")
+                align = SEAM_ALIGN_TO_KEY.get(self.stamp_seam_align_var.get(), "center")
                 for it in items:
                     template_data["elements"].append(with_scope({
                         "type": "seam",
@@ -1717,13 +1973,13 @@ class PDFConverterApp:
             messagebox.showerror("导出失败", f"生成模板数据失败：\n{exc}", parent=parent)
             return ""
 
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        ts = time.strftime("%Y%m%d_%H%M%S")
         default_name = f"stamp_template_{mode_key}_{ts}.json"
         filename = filedialog.asksaveasfilename(
             title="导出模板JSON",
             defaultextension=".json",
             initialfile=default_name,
-            filetypes=[("JSON文件", "*.json"), ("所有文件", "*.*")],
+            filetypes=JSON_FILETYPES,
             parent=parent,
         )
         if not filename:
@@ -1764,23 +2020,37 @@ class PDFConverterApp:
             return max_value
         return numeric
 
-    def _get_stamp_mode_key(self):
-        mode_map = {
-            "普通章": "seal",
-            "二维码": "qr",
-            "骑缝章": "seam",
-            "模板": "template",
-            "签名": "signature",
+    def _snapshot_stamp_preview_profile(self):
+        """一次性读取并夹取 stamp_preview_profile，返回新的 dict"""
+        profile = self.stamp_preview_profile
+        get = profile.get
+        clamp = self._clamp_value
+        return {
+            "x_ratio": clamp(get("x_ratio", 0.85), 0.0, 1.0, 0.85),
+            "y_ratio": clamp(get("y_ratio", 0.85), 0.0, 1.0, 0.85),
+            "size_ratio": clamp(get("size_ratio", 0.18), 0.03, 0.7, 0.18),
+            "opacity": clamp(get("opacity", self.stamp_opacity), 0.05, 1.0, 0.85),
         }
-        return mode_map.get(self.stamp_mode_var.get(), "seal")
+
+    @staticmethod
+    def _set_widget_state(widget, state):
+        """仅在状态变化时才调用 config，省去无谓的 Tcl 往返和重绘"""
+        if str(widget.cget("state")) != state:
+            widget.config(state=state)
+
+    def _on_stamp_mode_var_changed(self, *args):
+        self._stamp_mode_key = STAMP_MODE_TO_KEY.get(self.stamp_mode_var.get(), "seal")
+
+    def _get_stamp_mode_key(self):
+        return self._stamp_mode_key
 
     def _update_stamp_preview_info(self):
         mode_key = self._get_stamp_mode_key()
-        profile = self.stamp_preview_profile or {}
-        x_ratio = self._clamp_value(profile.get("x_ratio", 0.85), 0.0, 1.0, 0.85)
-        y_ratio = self._clamp_value(profile.get("y_ratio", 0.85), 0.0, 1.0, 0.85)
-        size_ratio = self._clamp_value(profile.get("size_ratio", 0.18), 0.03, 0.7, 0.18)
-        opacity = self._clamp_value(profile.get("opacity", 0.85), 0.05, 1.0, 0.85)
+        profile = self._clamped_preview_profile()
+        x_ratio = profile["x_ratio"]
+        y_ratio = profile["y_ratio"]
+        size_ratio = profile["size_ratio"]
+        opacity = profile["opacity"]
         active_path = self._get_active_stamp_image_path()
         image_name = os.path.basename(active_path) if active_path else ""
         image_suffix = f" | {image_name}" if image_name else ""
@@ -1840,11 +2110,47 @@ class PDFConverterApp:
                 })
         return items
 
+    def _get_signature_preview_doc(self, source_pdf):
+        """签名预览的 PDF 句柄在多次打开预览之间复用，文件变化后才重新打开"""
+        self._cancel_signature_doc_close()
+        full = os.path.abspath(source_pdf)
+        key = (full, self._get_file_mtime_safe(full))
+        cached_key, doc = self._signature_preview_doc
+        if cached_key == key and doc is not None and not doc.is_closed:
+            return doc
+        self._close_signature_preview_doc()
+        doc = fitz.open(full)
+        self._signature_preview_doc = (key, doc)
+        return doc
+
+    def _cancel_signature_doc_close(self):
+        if self._signature_doc_close_job is not None:
+            try:
+                self.root.after_cancel(self._signature_doc_close_job)
+            except Exception:
+                pass
+            self._signature_doc_close_job = None
+
+    def _schedule_signature_doc_close(self, event=None, delay_ms=30000):
+        """预览窗口关闭后空闲一段时间再释放 PDF 句柄（Windows 下打开的文件无法删除/重命名）"""
+        self._cancel_signature_doc_close()
+        self._signature_doc_close_job = self.root.after(delay_ms, self._close_signature_preview_doc)
+
+    def _close_signature_preview_doc(self):
+        self._cancel_signature_doc_close()
+        doc = self._signature_preview_doc[1]
+        self._signature_preview_doc = (None, None)
+        if doc is not None:
+            try:
+                doc.close()
+            except Exception:
+                pass
+
     def _open_signature_preview(self):
-        if not PIL_AVAILABLE:
+        if not _load_pil():
             messagebox.showwarning("提示", "预览需要 Pillow 依赖。")
             return
-        if not FITZ_UI_AVAILABLE:
+        if not _load_fitz():
             messagebox.showwarning("提示", "预览需要 PyMuPDF 依赖。")
             return
         preview_paths = [p for p in (self.stamp_image_paths or []) if p and os.path.exists(p)]
@@ -1857,13 +2163,13 @@ class PDFConverterApp:
             return
 
         try:
-            doc = fitz.open(source_pdf)
+            doc = self._get_signature_preview_doc(source_pdf)
         except Exception as exc:
             messagebox.showerror("预览失败", f"无法打开PDF：\n{exc}")
             return
         page_count = len(doc)
         if page_count <= 0:
-            doc.close()
+            self._close_signature_preview_doc()
             messagebox.showwarning("提示", "该 PDF 没有页面。")
             return
 
@@ -1918,7 +2224,7 @@ class PDFConverterApp:
         top_frame = tk.Frame(preview_win)
         top_frame.pack(fill=tk.X, padx=12, pady=(10, 4))
         page_info_var = tk.StringVar(value="")
-        tk.Label(top_frame, textvariable=page_info_var, font=("Microsoft YaHei", 9), fg="#666").pack(side=tk.LEFT)
+        tk.Label(top_frame, textvariable=page_info_var, font=self.font_body, fg="#666").pack(side=tk.LEFT)
 
         nav_frame = tk.Frame(preview_win)
         nav_frame.pack(fill=tk.X, padx=12, pady=(0, 2))
@@ -1927,39 +2233,39 @@ class PDFConverterApp:
         active_path_var = tk.StringVar(value=preview_paths[0])
         enabled_vars = {p: tk.BooleanVar(value=False) for p in preview_paths}
 
-        tk.Button(nav_frame, text="上一页", font=("Microsoft YaHei", 9), width=8).pack(side=tk.LEFT)
+        tk.Button(nav_frame, text="上一页", font=self.font_body, width=8).pack(side=tk.LEFT)
         prev_btn = nav_frame.winfo_children()[-1]
-        tk.Button(nav_frame, text="下一页", font=("Microsoft YaHei", 9), width=8).pack(side=tk.LEFT, padx=(6, 10))
+        tk.Button(nav_frame, text="下一页", font=self.font_body, width=8).pack(side=tk.LEFT, padx=(6, 10))
         next_btn = nav_frame.winfo_children()[-1]
 
         hint_row = tk.Frame(preview_win)
         hint_row.pack(fill=tk.X, padx=12, pady=(0, 2))
-        tk.Label(hint_row, text="勾选=参与当前页，单击签名=当前编辑", font=("Microsoft YaHei", 9), fg="#666").pack(side=tk.LEFT)
+        tk.Label(hint_row, text="勾选=参与当前页，单击签名=当前编辑", font=self.font_body, fg="#666").pack(side=tk.LEFT)
         zoom_info_var = tk.StringVar(value="页面缩放 100%（滚轮）")
-        tk.Label(hint_row, textvariable=zoom_info_var, font=("Microsoft YaHei", 9), fg="#666").pack(side=tk.RIGHT)
+        tk.Label(hint_row, textvariable=zoom_info_var, font=self.font_body, fg="#666").pack(side=tk.RIGHT)
 
         slider_frame = tk.Frame(preview_win)
         slider_frame.pack(fill=tk.X, padx=12, pady=(0, 4))
 
-        tk.Label(slider_frame, text="透明度:", font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+        tk.Label(slider_frame, text="透明度:", font=self.font_body).pack(side=tk.LEFT)
         opacity_var = tk.DoubleVar(value=85)
         opacity_scale = tk.Scale(slider_frame, from_=5, to=100, orient=tk.HORIZONTAL, resolution=1,
                                  showvalue=True, variable=opacity_var, length=180)
         opacity_scale.pack(side=tk.LEFT, padx=(4, 16))
-        tk.Label(slider_frame, text="缩放:", font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+        tk.Label(slider_frame, text="缩放:", font=self.font_body).pack(side=tk.LEFT)
         size_var = tk.DoubleVar(value=18)
         size_scale = tk.Scale(slider_frame, from_=3, to=70, orient=tk.HORIZONTAL, resolution=1,
                               showvalue=True, variable=size_var, length=160)
         size_scale.pack(side=tk.LEFT, padx=(4, 0))
 
-        list_frame = tk.LabelFrame(preview_win, text="签名列表", font=("Microsoft YaHei", 9))
+        list_frame = tk.LabelFrame(preview_win, text="签名列表", font=self.font_body)
         list_frame.pack(fill=tk.X, padx=12, pady=(0, 6))
         for p in preview_paths:
             row = tk.Frame(list_frame)
             row.pack(fill=tk.X, pady=1)
-            tk.Checkbutton(row, variable=enabled_vars[p], font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
-            tk.Radiobutton(row, variable=active_path_var, value=p, font=("Microsoft YaHei", 9)).pack(side=tk.LEFT, padx=(2, 4))
-            tk.Label(row, text=os.path.basename(p), font=("Microsoft YaHei", 9), anchor="w").pack(side=tk.LEFT)
+            tk.Checkbutton(row, variable=enabled_vars[p], font=self.font_body).pack(side=tk.LEFT)
+            tk.Radiobutton(row, variable=active_path_var, value=p, font=self.font_body).pack(side=tk.LEFT, padx=(2, 4))
+            tk.Label(row, text=os.path.basename(p), font=self.font_body, anchor="w").pack(side=tk.LEFT)
 
         canvas_frame = tk.Frame(preview_win, bg="#f5f5f5")
         canvas_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=12, pady=8)
@@ -2018,13 +2324,13 @@ class PDFConverterApp:
                 return page_cache[cache_key]
             page = doc[page_no - 1]
             pix = page.get_pixmap(matrix=fitz.Matrix(1.0, 1.0), alpha=False)
-            pil_img = Image.open(io.BytesIO(pix.tobytes("png"))).convert("RGB")
+            pil_img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
             max_w, max_h = fit_w, fit_h
             base_scale = min(max_w / pil_img.width, max_h / pil_img.height, 1.0)
             scale = max(0.12, base_scale * zoom_state["factor"])
             disp_w = max(1, int(pil_img.width * scale))
             disp_h = max(1, int(pil_img.height * scale))
-            disp = pil_img.resize((disp_w, disp_h), Image.LANCZOS) if (disp_w != pil_img.width or disp_h != pil_img.height) else pil_img.copy()
+            disp = pil_img.resize((disp_w, disp_h), Image.LANCZOS) if (disp_w != pil_img.width or disp_h != pil_img.height) else pil_img
             page_cache[cache_key] = (disp, disp_w, disp_h)
             return page_cache[cache_key]
 
@@ -2035,7 +2341,7 @@ class PDFConverterApp:
             if cache_key in sig_render_cache:
                 return sig_render_cache[cache_key]
             base = self._get_stamp_base_image_cached(path, remove_white=bool(self.stamp_remove_white_bg_var.get()))
-            base = PDFBatchStampConverter._apply_alpha(base.copy(), profile["opacity"])
+            base = _load_converter("PDFBatchStampConverter")._apply_alpha(base.copy(), profile["opacity"])
             ratio = base.height / max(1, base.width)
             min_w = 12
             min_h = 12
@@ -2044,7 +2350,8 @@ class PDFConverterApp:
             if th < min_h:
                 th = min_h
                 tw = max(min_w, int(round(th / max(ratio, 1e-6))))
-            out = base.resize((tw, th), Image.LANCZOS)
+            # 签名图缩小到预览尺寸，BICUBIC 与 LANCZOS 肉眼难辨且快得多
+            out = base.resize((tw, th), Image.BICUBIC)
             sig_render_cache[cache_key] = out
             return out
 
@@ -2282,25 +2589,18 @@ class PDFConverterApp:
             self.signature_page_profiles = compact
             self._update_stamp_preview_info()
             self.save_settings()
-            try:
-                doc.close()
-            except Exception:
-                pass
             preview_win.destroy()
 
-        def on_close():
-            try:
-                doc.close()
-            except Exception:
-                pass
-            preview_win.destroy()
-
-        tk.Button(action_frame, text="取消", command=on_close,
-                  font=("Microsoft YaHei", 9), width=12).pack(side=tk.RIGHT, padx=(8, 0))
+        tk.Button(action_frame, text="取消", command=preview_win.destroy,
+                  font=self.font_body, width=12).pack(side=tk.RIGHT, padx=(8, 0))
         tk.Button(action_frame, text="应用到批量签名", command=apply_preview,
-                  font=("Microsoft YaHei", 9, "bold"), width=14).pack(side=tk.RIGHT)
+                  font=self.font_body_bold, width=14).pack(side=tk.RIGHT)
 
-        preview_win.protocol("WM_DELETE_WINDOW", on_close)
+        preview_win.protocol("WM_DELETE_WINDOW", preview_win.destroy)
+        preview_win.bind(
+            "<Destroy>",
+            lambda e: self._schedule_signature_doc_close() if e.widget is preview_win else None,
+            add="+")
         ensure_page_state(1)
         update_enabled_vars_for_page()
         sync_sliders_from_active()
@@ -2337,36 +2637,30 @@ class PDFConverterApp:
         todo = pdfs[:3]
 
         def worker():
+            if not (_load_fitz() and _load_pil()):
+                return
             for pdf_path in todo:
                 mtime = self._get_file_mtime_safe(pdf_path)
                 with self._preview_cache_lock:
                     old = self._pdf_preview_cache.get(pdf_path)
-                    if old and old.get("mtime") == mtime and old.get("first_page_png"):
+                    if old and old.get("mtime") == mtime:
                         continue
                 try:
                     doc = fitz.open(pdf_path)
                     try:
-                        page_count = len(doc)
-                        if page_count <= 0:
+                        if len(doc) <= 0:
                             continue
-                        pix = doc[0].get_pixmap(matrix=fitz.Matrix(1.1, 1.1), alpha=False)
-                        png_bytes = pix.tobytes("png")
+                        entry = self._render_preview_entry(doc, mtime)
                     finally:
                         doc.close()
-                    with self._preview_cache_lock:
-                        self._pdf_preview_cache[pdf_path] = {
-                            "mtime": mtime,
-                            "page_count": page_count,
-                            "first_page_png": png_bytes,
-                        }
-                        if len(self._pdf_preview_cache) > 20:
-                            self._pdf_preview_cache = dict(list(self._pdf_preview_cache.items())[-10:])
+                    self._store_preview_entry(pdf_path, entry)
                 except Exception:
                     continue
 
         threading.Thread(target=worker, daemon=True).start()
 
     def _get_stamp_base_image_cached(self, path, remove_white=False):
+        _load_pil()
         full = os.path.abspath(path)
         mtime = self._get_file_mtime_safe(full)
         key = (full, mtime, bool(remove_white))
@@ -2375,9 +2669,12 @@ class PDFConverterApp:
             if cached is not None:
                 return cached.copy()
 
-        img = Image.open(full).convert("RGBA")
+        img = Image.open(full)
+        # 仅用于预览：大尺寸 JPEG 直接按缩小比例解码（不小于预览可能用到的尺寸）
+        img.draft("RGB", (1600, 1600))
+        img = img.convert("RGBA")
         if remove_white:
-            img = PDFBatchStampConverter._remove_white_background(img)
+            img = _load_converter("PDFBatchStampConverter")._remove_white_background(img)
 
         with self._preview_cache_lock:
             self._stamp_base_image_cache[key] = img.copy()
@@ -2410,6 +2707,17 @@ class PDFConverterApp:
 
         threading.Thread(target=worker, daemon=True).start()
 
+    def _load_stamp_template(self, template_path):
+        """读取模板 JSON；文件未修改时复用上次解析结果（调用方不得修改返回值）"""
+        key = (template_path, self._get_file_mtime_safe(template_path))
+        cached_key, data = self._stamp_template_data
+        if cached_key == key:
+            return data
+        with open(template_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        self._stamp_template_data = (key, data)
+        return data
+
     def _build_template_preview_image(self, opacity):
         if not self.stamp_template_path or not os.path.exists(self.stamp_template_path):
             return None
@@ -2418,17 +2726,14 @@ class PDFConverterApp:
         op_key = int(self._clamp_value(opacity, 0.05, 1.0, 0.85) * 1000)
         rm_bg = bool(self.stamp_remove_white_bg_var.get())
         cache_key = (template_path, mtime, op_key, rm_bg)
+        # 缓存的是成品图像；调用方只读取（缩放生成新图），命中时直接返回
         with self._preview_cache_lock:
-            cached_png = self._template_preview_cache.get(cache_key)
-        if cached_png:
-            try:
-                return Image.open(io.BytesIO(cached_png)).convert("RGBA")
-            except Exception:
-                pass
+            cached = self._template_preview_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
-            with open(self.stamp_template_path, "r", encoding="utf-8") as f:
-                template = json.load(f)
+            template = self._load_stamp_template(template_path)
         except Exception:
             return None
 
@@ -2438,33 +2743,22 @@ class PDFConverterApp:
             if elem_type == "seal":
                 image_path = str(elem.get("image_path", "")).strip()
                 if image_path and os.path.exists(image_path):
-                    image = Image.open(image_path).convert("RGBA")
-                    if self.stamp_remove_white_bg_var.get():
-                        image = PDFBatchStampConverter._remove_white_background(image)
-                    out_img = PDFBatchStampConverter._apply_alpha(image, opacity)
-                    buf = io.BytesIO()
-                    out_img.save(buf, format="PNG")
-                    with self._preview_cache_lock:
-                        self._template_preview_cache[cache_key] = buf.getvalue()
-                        if len(self._template_preview_cache) > 80:
-                            self._template_preview_cache = dict(list(self._template_preview_cache.items())[-40:])
+                    # 原图（及去白底结果）按文件缓存，透明度变化时只重新套用 alpha
+                    image = self._get_stamp_base_image_cached(image_path, remove_white=rm_bg)
+                    out_img = _load_converter("PDFBatchStampConverter")._apply_alpha(image, opacity)
+                    self._store_template_preview(cache_key, out_img)
                     return out_img
             elif elem_type == "qr":
                 text = str(elem.get("text", "")).strip()
                 if text:
                     try:
-                        qr_bytes = PDFBatchStampConverter._make_qr_png_bytes(
+                        qr_bytes = _load_converter("PDFBatchStampConverter")._make_qr_png_bytes(
                             text,
                             opacity=opacity,
                             remove_white_bg=bool(self.stamp_remove_white_bg_var.get()),
                         )
                         out_img = Image.open(io.BytesIO(qr_bytes)).convert("RGBA")
-                        buf = io.BytesIO()
-                        out_img.save(buf, format="PNG")
-                        with self._preview_cache_lock:
-                            self._template_preview_cache[cache_key] = buf.getvalue()
-                            if len(self._template_preview_cache) > 80:
-                                self._template_preview_cache = dict(list(self._template_preview_cache.items())[-40:])
+                        self._store_template_preview(cache_key, out_img)
                         return out_img
                     except Exception:
                         return None
@@ -2474,22 +2768,24 @@ class PDFConverterApp:
                     image = Image.new("RGBA", (520, 120), (255, 255, 255, 0))
                     draw = ImageDraw.Draw(image)
                     draw.text((10, 40), text, fill=(220, 0, 0, 255))
-                    out_img = PDFBatchStampConverter._apply_alpha(image, opacity)
-                    buf = io.BytesIO()
-                    out_img.save(buf, format="PNG")
-                    with self._preview_cache_lock:
-                        self._template_preview_cache[cache_key] = buf.getvalue()
-                        if len(self._template_preview_cache) > 80:
-                            self._template_preview_cache = dict(list(self._template_preview_cache.items())[-40:])
+                    out_img = _load_converter("PDFBatchStampConverter")._apply_alpha(image, opacity)
+                    self._store_template_preview(cache_key, out_img)
                     return out_img
         return None
 
+    def _store_template_preview(self, cache_key, image):
+        with self._preview_cache_lock:
+            self._template_preview_cache[cache_key] = image
+            # 存的是解码后的图像（不再是 PNG 字节），上限相应收小
+            if len(self._template_preview_cache) > 24:
+                self._template_preview_cache = dict(list(self._template_preview_cache.items())[-12:])
+
     def _open_stamp_preview(self, preloaded=None):
         if preloaded is None:
-            if not PIL_AVAILABLE:
+            if not _load_pil():
                 messagebox.showwarning("提示", "预览需要 Pillow 依赖。")
                 return
-            if not FITZ_UI_AVAILABLE:
+            if not _load_fitz():
                 messagebox.showwarning("提示", "预览需要 PyMuPDF 依赖。")
                 return
 
@@ -2598,35 +2894,42 @@ class PDFConverterApp:
         preview_win.grab_set()
 
         info_text = f"预览文件：{os.path.basename(source_pdf)}  第1页 / 共{page_count}页"
-        tk.Label(preview_win, text=info_text, font=("Microsoft YaHei", 9), fg="#666").pack(anchor="w", padx=12, pady=(10, 4))
+        tk.Label(preview_win, text=info_text, font=self.font_body, fg="#666").pack(anchor="w", padx=12, pady=(10, 4))
 
         control_frame = tk.Frame(preview_win)
         control_frame.pack(fill=tk.X, padx=12, pady=(0, 6))
-        tk.Label(control_frame, text="透明度:", font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+        tk.Label(control_frame, text="透明度:", font=self.font_body).pack(side=tk.LEFT)
         opacity_var = tk.DoubleVar(value=85)
         opacity_scale = tk.Scale(control_frame, from_=5, to=100, orient=tk.HORIZONTAL, resolution=1, showvalue=True, variable=opacity_var, length=220)
         opacity_scale.pack(side=tk.LEFT, padx=(6, 12))
-        tk.Label(control_frame, text="缩放:", font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+        tk.Label(control_frame, text="缩放:", font=self.font_body).pack(side=tk.LEFT)
         size_var = tk.DoubleVar(value=18)
         size_scale = tk.Scale(control_frame, from_=3, to=70, orient=tk.HORIZONTAL, resolution=1, showvalue=True, variable=size_var, length=200)
         size_scale.pack(side=tk.LEFT, padx=(6, 12))
         if mode_key == "seam":
             size_scale.config(state=tk.DISABLED)
-        tk.Label(control_frame, text="勾选=参与输出，单击图章=当前编辑", font=("Microsoft YaHei", 9), fg="#666").pack(side=tk.LEFT)
+        tk.Label(control_frame, text="勾选=参与输出，单击图章=当前编辑", font=self.font_body, fg="#666").pack(side=tk.LEFT)
 
         active_path_var = tk.StringVar(value=(active_stamp_path if active_stamp_path in preview_paths else (preview_paths[0] if preview_paths else "")))
         enabled_vars = {}
+        # 所有勾选框共用一个计数变量触发重绘，避免每个章图各挂一个 trace
+        enabled_dirty_var = tk.IntVar(value=0)
+
+        def mark_enabled_dirty():
+            enabled_dirty_var.set(enabled_dirty_var.get() + 1)
+
         if mode_key in ("seal", "seam"):
-            list_frame = tk.LabelFrame(preview_win, text="章图列表", font=("Microsoft YaHei", 9))
+            list_frame = tk.LabelFrame(preview_win, text="章图列表", font=self.font_body)
             list_frame.pack(fill=tk.X, padx=12, pady=(0, 6))
             for p in preview_paths:
                 row = tk.Frame(list_frame)
                 row.pack(fill=tk.X, pady=1)
                 ev = tk.BooleanVar(value=bool(preview_profiles[p].get("enabled", True)))
                 enabled_vars[p] = ev
-                tk.Checkbutton(row, variable=ev, font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
-                tk.Radiobutton(row, variable=active_path_var, value=p, font=("Microsoft YaHei", 9)).pack(side=tk.LEFT, padx=(2, 4))
-                tk.Label(row, text=os.path.basename(p), font=("Microsoft YaHei", 9), anchor="w").pack(side=tk.LEFT)
+                tk.Checkbutton(row, variable=ev, command=mark_enabled_dirty,
+                               font=self.font_body).pack(side=tk.LEFT)
+                tk.Radiobutton(row, variable=active_path_var, value=p, font=self.font_body).pack(side=tk.LEFT, padx=(2, 4))
+                tk.Label(row, text=os.path.basename(p), font=self.font_body, anchor="w").pack(side=tk.LEFT)
 
         canvas_frame = tk.Frame(preview_win, bg="#f5f5f5")
         canvas_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=12, pady=8)
@@ -2642,6 +2945,8 @@ class PDFConverterApp:
 
         state = {
             "render_job": None,
+            "refine_job": None,
+            "draft": False,  # 缩放窗口/拖动滑块期间用 BILINEAR 快速出图，停下后再用 LANCZOS 重绘
             "suspend_slider": False,
             "drag_path": None,
             "drag_offset_x": 0.0,
@@ -2651,6 +2956,8 @@ class PDFConverterApp:
             "page_border_id": None,
             "page_dim": (0.0, 0.0, 1.0, 1.0),  # origin_x, origin_y, disp_w, disp_h
             "stamp_items": {},
+            "last_drag_pos": None,
+            "drag_bounds": None,
             "selection_rect": canvas.create_rectangle(0, 0, 0, 0, outline="#1e88e5", width=2, dash=(4, 2), state="hidden"),
         }
         page_cache = {}
@@ -2689,7 +2996,12 @@ class PDFConverterApp:
             scale = min(fit_w / page_image.width, fit_h / page_image.height, 1.0)
             disp_w = max(1, int(page_image.width * scale))
             disp_h = max(1, int(page_image.height * scale))
-            disp = page_image.resize((disp_w, disp_h), Image.LANCZOS) if (disp_w != page_image.width or disp_h != page_image.height) else page_image.copy()
+            if disp_w == page_image.width and disp_h == page_image.height:
+                disp = page_image
+            elif state["draft"]:
+                return page_image.resize((disp_w, disp_h), Image.BILINEAR), disp_w, disp_h
+            else:
+                disp = page_image.resize((disp_w, disp_h), Image.LANCZOS)
             page_cache[cache_key] = (disp, disp_w, disp_h)
             return page_cache[cache_key]
 
@@ -2715,17 +3027,19 @@ class PDFConverterApp:
 
             if mode == "seal":
                 base = get_base_image(path).copy()
-                base = PDFBatchStampConverter._apply_alpha(base, profile["opacity"])
+                base = _load_converter("PDFBatchStampConverter")._apply_alpha(base, profile["opacity"])
                 tw = max(16, int(disp_w * profile["size_ratio"]))
                 th = max(16, int(tw * base.height / max(1, base.width)))
+                if state["draft"]:
+                    return base.resize((tw, th), Image.BILINEAR)
                 out = base.resize((tw, th), Image.LANCZOS)
                 render_cache[cache_key] = out
                 return out
 
             if mode == "seam":
                 base = get_base_image(path).copy()
-                base = PDFBatchStampConverter._apply_alpha(base, profile["opacity"])
-                side = {"右侧": "right", "左侧": "left", "顶部": "top", "底部": "bottom"}.get(self.stamp_seam_side_var.get(), "right")
+                base = _load_converter("PDFBatchStampConverter")._apply_alpha(base, profile["opacity"])
+                side = SEAM_SIDE_TO_KEY.get(self.stamp_seam_side_var.get(), "right")
                 n_pages = max(1, page_count)
                 if side in ("left", "right"):
                     step = base.width / n_pages
@@ -2743,6 +3057,8 @@ class PDFConverterApp:
                     sr = self._clamp_value(profile["size_ratio"] / 0.18, 0.6, 2.2, 1.0)
                     tw = max(10, int(base_w * sr))
                     th = max(10, int(tw * piece.height / max(1, piece.width)))
+                if state["draft"]:
+                    return piece.resize((tw, th), Image.BILINEAR)
                 out = piece.resize((tw, th), Image.LANCZOS)
                 render_cache[cache_key] = out
                 return out
@@ -2757,8 +3073,39 @@ class PDFConverterApp:
                     pass
             state["render_job"] = preview_win.after(delay_ms, redraw)
 
+        def schedule_draft_redraw(delay_ms):
+            # 草图结果不进缓存；停止操作 300ms 后按精细缩放重绘一次
+            state["draft"] = True
+            if state["refine_job"] is not None:
+                preview_win.after_cancel(state["refine_job"])
+            state["refine_job"] = preview_win.after(300, refine_redraw)
+            schedule_redraw(delay_ms)
+
+        def refine_redraw():
+            state["refine_job"] = None
+            if not preview_win.winfo_exists():
+                return
+            state["draft"] = False
+            schedule_redraw(1)
+
+        def cancel_jobs(event=None):
+            # 应用/取消/关闭窗口后不再触发延迟重绘（Destroy 会冒泡到子控件，只处理窗口本身）
+            if event is not None and event.widget is not preview_win:
+                return
+            for key in ("render_job", "refine_job"):
+                if state[key] is not None:
+                    try:
+                        preview_win.after_cancel(state[key])
+                    except Exception:
+                        pass
+                    state[key] = None
+
+        preview_win.bind("<Destroy>", cancel_jobs, add="+")
+
         def redraw():
             state["render_job"] = None
+            if not preview_win.winfo_exists():
+                return
             canvas.update_idletasks()
             cw = max(1, canvas.winfo_width())
             ch = max(1, canvas.winfo_height())
@@ -2810,8 +3157,8 @@ class PDFConverterApp:
                         profile["x_ratio"] = self._clamp_value((x + rw / 2 - origin_x) / max(1, disp_w), 0.0, 1.0, 0.85)
                         profile["y_ratio"] = self._clamp_value((y + rh / 2 - origin_y) / max(1, disp_h), 0.0, 1.0, 0.85)
                     else:
-                        side = {"右侧": "right", "左侧": "left", "顶部": "top", "底部": "bottom"}.get(self.stamp_seam_side_var.get(), "right")
-                        align = {"居中": "center", "顶部": "top", "底部": "bottom"}.get(self.stamp_seam_align_var.get(), "center")
+                        side = SEAM_SIDE_TO_KEY.get(self.stamp_seam_side_var.get(), "right")
+                        align = SEAM_ALIGN_TO_KEY.get(self.stamp_seam_align_var.get(), "center")
                         overlap = self._clamp_value(self.stamp_seam_overlap_var.get(), 0.05, 0.95, 0.25)
                         vis_idx = enabled_paths.index(path) if path in enabled_paths else 0
                         stack_off = vis_idx * 6
@@ -2849,20 +3196,20 @@ class PDFConverterApp:
                 profile["size_ratio"] = self._clamp_value(profile.get("size_ratio", 0.18), 0.03, 0.7, 0.18)
                 if mode_key == "qr":
                     try:
+                        # 二维码只在内容/去白底变化时重新生成，透明度变化时只重新套用 alpha
                         qr_key = (
                             self.stamp_qr_text_var.get().strip(),
-                            int(profile["opacity"] * 1000),
                             bool(self.stamp_remove_white_bg_var.get()),
                         )
-                        src = qr_src_cache.get(qr_key)
-                        if src is None:
-                            qr_bytes = PDFBatchStampConverter._make_qr_png_bytes(
-                                self.stamp_qr_text_var.get().strip(),
-                                opacity=profile["opacity"],
-                                remove_white_bg=bool(self.stamp_remove_white_bg_var.get()),
+                        base = qr_src_cache.get(qr_key)
+                        if base is None:
+                            qr_bytes = _load_converter("PDFBatchStampConverter")._make_qr_png_bytes(
+                                qr_key[0], opacity=1.0, remove_white_bg=qr_key[1],
                             )
-                            src = Image.open(io.BytesIO(qr_bytes)).convert("RGBA")
-                            qr_src_cache[qr_key] = src
+                            base = Image.open(io.BytesIO(qr_bytes)).convert("RGBA")
+                            qr_src_cache[qr_key] = base
+                        src = _load_converter("PDFBatchStampConverter")._apply_alpha(
+                            base.copy(), profile["opacity"])
                     except Exception:
                         src = None
                 else:
@@ -2874,7 +3221,7 @@ class PDFConverterApp:
                     return
                 tw = max(16, int(disp_w * profile["size_ratio"]))
                 th = max(16, int(tw * src.height / max(1, src.width)))
-                img = src.resize((tw, th), Image.LANCZOS)
+                img = src.resize((tw, th), Image.BILINEAR if state["draft"] else Image.LANCZOS)
                 x = max(origin_x, min(origin_x + profile["x_ratio"] * disp_w - tw / 2, origin_x + disp_w - tw))
                 y = max(origin_y, min(origin_y + profile["y_ratio"] * disp_h - th / 2, origin_y + disp_h - th))
                 profile["x_ratio"] = self._clamp_value((x + tw / 2 - origin_x) / max(1, disp_w), 0.0, 1.0, 0.85)
@@ -2908,7 +3255,7 @@ class PDFConverterApp:
             profile = get_profile(key)
             profile["opacity"] = self._clamp_value(opacity_var.get() / 100.0, 0.05, 1.0, 0.85)
             profile["size_ratio"] = self._clamp_value(size_var.get() / 100.0, 0.03, 0.7, 0.18)
-            schedule_redraw(24)
+            schedule_draft_redraw(24)
 
         def hit_test_path(x, y):
             for p in reversed(preview_paths):
@@ -2920,6 +3267,16 @@ class PDFConverterApp:
                     return p
             return ""
 
+        def store_drag_bounds(item):
+            # 拖拽期间页面几何与图章尺寸不变，按下时一次性算好夹取边界
+            origin_x, origin_y, disp_w, disp_h = state["page_dim"]
+            w, h = item.get("size", (0, 0))
+            state["drag_bounds"] = (
+                origin_x + w / 2, origin_x + disp_w - w / 2,
+                origin_y + h / 2, origin_y + disp_h - h / 2,
+                1.0 / max(1, disp_w), 1.0 / max(1, disp_h),
+            )
+
         def on_press(event):
             if mode_key == "seal":
                 p = hit_test_path(event.x, event.y)
@@ -2935,6 +3292,7 @@ class PDFConverterApp:
                 state["drag_path"] = p
                 state["drag_offset_x"] = event.x - (x1 + x2) / 2
                 state["drag_offset_y"] = event.y - (y1 + y2) / 2
+                store_drag_bounds(item)
                 return
             if mode_key == "qr":
                 item = state["stamp_items"].get("__single__")
@@ -2946,6 +3304,7 @@ class PDFConverterApp:
                 state["drag_path"] = "__single__"
                 state["drag_offset_x"] = event.x - (x1 + x2) / 2
                 state["drag_offset_y"] = event.y - (y1 + y2) / 2
+                store_drag_bounds(item)
 
         def on_drag(event):
             if mode_key not in ("seal", "qr"):
@@ -2956,35 +3315,43 @@ class PDFConverterApp:
             item = state["stamp_items"].get(p)
             if not item:
                 return
-            origin_x, origin_y, disp_w, disp_h = state["page_dim"]
+            origin_x, origin_y = state["page_dim"][:2]
             w, h = item.get("size", (0, 0))
             if w <= 0 or h <= 0:
                 return
-            cx = event.x - state["drag_offset_x"]
-            cy = event.y - state["drag_offset_y"]
-            cx = max(origin_x + w / 2, min(cx, origin_x + disp_w - w / 2))
-            cy = max(origin_y + h / 2, min(cy, origin_y + disp_h - h / 2))
+            bounds = state.get("drag_bounds")
+            if bounds is None:
+                store_drag_bounds(item)
+                bounds = state["drag_bounds"]
+            cx_min, cx_max, cy_min, cy_max, inv_disp_w, inv_disp_h = bounds
+            cx = max(cx_min, min(event.x - state["drag_offset_x"], cx_max))
+            cy = max(cy_min, min(event.y - state["drag_offset_y"], cy_max))
             x = cx - w / 2
             y = cy - h / 2
-            canvas.coords(item["id"], int(x), int(y))
+            new_pos = (int(x), int(y))
+            if new_pos == state.get("last_drag_pos"):
+                return
+            state["last_drag_pos"] = new_pos
+            canvas.coords(item["id"], new_pos[0], new_pos[1])
             item["bbox"] = (x, y, x + w, y + h)
             prof = get_profile(p)
-            prof["x_ratio"] = self._clamp_value((cx - origin_x) / max(1, disp_w), 0.0, 1.0, 0.85)
-            prof["y_ratio"] = self._clamp_value((cy - origin_y) / max(1, disp_h), 0.0, 1.0, 0.85)
+            prof["x_ratio"] = self._clamp_value((cx - origin_x) * inv_disp_w, 0.0, 1.0, 0.85)
+            prof["y_ratio"] = self._clamp_value((cy - origin_y) * inv_disp_h, 0.0, 1.0, 0.85)
             canvas.coords(state["selection_rect"], x - 2, y - 2, x + w + 2, y + h + 2)
 
         def on_release(_event):
             state["drag_path"] = None
+            state["last_drag_pos"] = None
+            state["drag_bounds"] = None
 
         if mode_key in ("seal", "seam"):
-            for p, ev in enabled_vars.items():
-                ev.trace_add("write", on_enabled_change)
+            enabled_dirty_var.trace_add("write", on_enabled_change)
             active_path_var.trace_add("write", on_active_change)
 
         def on_canvas_configure(_event=None):
             if len(page_cache) > 40:
                 page_cache.clear()
-            schedule_redraw(50)
+            schedule_draft_redraw(50)
 
         canvas.bind("<ButtonPress-1>", on_press)
         canvas.bind("<B1-Motion>", on_drag)
@@ -3000,10 +3367,9 @@ class PDFConverterApp:
             if mode_key in ("seal", "seam"):
                 export_profiles = []
                 for p in preview_paths:
-                    prof = self._normalize_stamp_profile(preview_profiles.get(p))
-                    prof["enabled"] = bool(enabled_vars[p].get())
-                    if not prof["enabled"]:
+                    if not enabled_vars[p].get():
                         continue
+                    prof = self._normalize_stamp_profile(preview_profiles.get(p))
                     export_profiles.append({
                         "image_path": p,
                         "enabled": True,
@@ -3035,8 +3401,8 @@ class PDFConverterApp:
                     profile["enabled"] = bool(enabled_vars[p].get())
                     self.stamp_profiles[p] = profile
                 active_path = active_path_var.get()
-                if active_path in self.stamp_image_paths:
-                    self.stamp_selected_image_idx = self.stamp_image_paths.index(active_path)
+                if active_path in self.stamp_image_path_to_idx:
+                    self.stamp_selected_image_idx = self.stamp_image_path_to_idx[active_path]
                     self.stamp_image_path = active_path
                 active_profile = self._normalize_stamp_profile(preview_profiles.get(active_path))
                 self.stamp_preview_profile = {
@@ -3054,45 +3420,43 @@ class PDFConverterApp:
                     "opacity": profile["opacity"],
                 }
 
-            self.stamp_opacity_var.set(f"{self.stamp_preview_profile['opacity']:.2f}")
+            self.stamp_opacity = f"{self.stamp_preview_profile['opacity']:.2f}"
             self._update_stamp_image_label()
             self._update_stamp_preview_info()
             self.save_settings()
             preview_win.destroy()
 
         tk.Button(action_frame, text="导出模板JSON...", command=export_preview_template,
-                  font=("Microsoft YaHei", 9), width=14).pack(side=tk.LEFT)
+                  font=self.font_body, width=14).pack(side=tk.LEFT)
         tk.Button(action_frame, text="取消", command=preview_win.destroy,
-                  font=("Microsoft YaHei", 9), width=12).pack(side=tk.RIGHT, padx=(8, 0))
+                  font=self.font_body, width=12).pack(side=tk.RIGHT, padx=(8, 0))
         tk.Button(action_frame, text="应用到批量盖章", command=apply_preview,
-                  font=("Microsoft YaHei", 9, "bold"), width=14).pack(side=tk.RIGHT)
+                  font=self.font_body_bold, width=14).pack(side=tk.RIGHT)
 
         sync_sliders_from_active()
         schedule_redraw(1)
 
     def _on_stamp_mode_changed(self, event=None):
         mode_key = self._get_stamp_mode_key()
-        if mode_key == "seal":
-            self.stamp_hint_var.set("普通章：支持多个章图，预览中勾选章图并拖拽定位，可调透明度和缩放。")
-        elif mode_key == "signature":
-            self.stamp_hint_var.set("签名：支持多个签名，预览中可翻页勾选签名并逐页拖拽定位、缩放、调透明度。")
-        elif mode_key == "qr":
-            self.stamp_hint_var.set("二维码：输入内容后可在预览中拖拽位置并调整透明度。")
-        elif mode_key == "seam":
-            self.stamp_hint_var.set("骑缝章：支持多个章图，预览中勾选章图并查看切片效果。")
-        else:
-            self.stamp_hint_var.set("模板：按 JSON 模板批量盖章；可预览模板元素效果。")
-
-        self.stamp_qr_entry.config(state=('normal' if mode_key == "qr" else 'disabled'))
-        seam_state = 'readonly' if mode_key == "seam" else 'disabled'
-        self.stamp_seam_side_combo.config(state=seam_state)
-        self.stamp_seam_align_combo.config(state=seam_state)
-        self.stamp_seam_overlap_entry.config(state=('normal' if mode_key == "seam" else 'disabled'))
-        self.stamp_export_template_btn.config(state=('disabled' if mode_key == "signature" else 'normal'))
+        cfg = STAMP_MODE_CONFIG.get(mode_key, STAMP_MODE_CONFIG["template"])
+        self.stamp_hint_var.set(cfg["hint"])
+        self._apply_stamp_mode_states(cfg)
 
         self._update_stamp_preview_info()
         self.save_settings()
 
+    def _apply_stamp_mode_states(self, cfg=None):
+        """按盖章模式启用/禁用选项控件；选项区尚未创建时跳过"""
+        if "PDF批量盖章" in self._option_builders:
+            return
+        if cfg is None:
+            cfg = STAMP_MODE_CONFIG.get(self._get_stamp_mode_key(), STAMP_MODE_CONFIG["template"])
+        self._set_widget_state(self.stamp_qr_entry, cfg["qr_entry"])
+        self._set_widget_state(self.stamp_seam_side_combo, cfg["seam_combo"])
+        self._set_widget_state(self.stamp_seam_align_combo, cfg["seam_combo"])
+        self._set_widget_state(self.stamp_seam_overlap_entry, cfg["seam_overlap"])
+        self._set_widget_state(self.stamp_export_template_btn, cfg["export_btn"])
+
     def _on_reorder_mode_changed(self, event=None):
         mode = self.reorder_mode_var.get()
         if mode == "页面重排":
@@ -3170,12 +3534,12 @@ class PDFConverterApp:
             filename = filedialog.asksaveasfilename(
                 title="选择书签JSON保存位置",
                 defaultextension=".json",
-                filetypes=[("JSON文件", "*.json"), ("所有文件", "*.*")],
+                filetypes=JSON_FILETYPES,
             )
         else:
             filename = filedialog.askopenfilename(
                 title="选择书签JSON文件",
-                filetypes=[("JSON文件", "*.json"), ("所有文件", "*.*")],
+                filetypes=JSON_FILETYPES,
             )
         if filename:
             self.bookmark_json_path_var.set(filename)
@@ -3200,7 +3564,7 @@ class PDFConverterApp:
         win.transient(self.root)
         win.grab_set()
 
-        tk.Label(win, text=text, font=("Microsoft YaHei", 10), fg="#555").pack(
+        tk.Label(win, text=text, font=self.font_medium, fg="#555").pack(
             anchor="w", padx=16, pady=(16, 8)
         )
         pb = ttk.Progressbar(win, mode="indeterminate", length=320)
@@ -3221,7 +3585,7 @@ class PDFConverterApp:
                 page = doc[i]
                 rect = page.rect
                 pix = page.get_pixmap(matrix=fitz.Matrix(0.22, 0.22), alpha=False)
-                pil_img = Image.open(io.BytesIO(pix.tobytes("png"))).convert("RGB")
+                pil_img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
                 page_infos.append({
                     "page_idx": i,
                     "size_text": f"{int(rect.width)}x{int(rect.height)}",
@@ -3231,47 +3595,48 @@ class PDFConverterApp:
         finally:
             doc.close()
 
-    def _load_stamp_preview_data(self, source_pdf):
-        full = os.path.abspath(source_pdf)
-        mtime = self._get_file_mtime_safe(full)
-        with self._preview_cache_lock:
-            cached = self._pdf_preview_cache.get(full)
-        if cached and cached.get("mtime") == mtime and cached.get("first_page_png"):
-            try:
-                page_image = Image.open(io.BytesIO(cached["first_page_png"])).convert("RGB")
-                first_page_rect = cached.get("first_page_rect")
-                if isinstance(first_page_rect, (list, tuple)) and len(first_page_rect) == 2:
-                    return (page_image, int(cached.get("page_count", 1)), first_page_rect), ""
-            except Exception:
-                pass
+    @staticmethod
+    def _render_preview_entry(doc, mtime):
+        """渲染首页预览图；像素直接取自 pixmap，不经 PNG 编码/解码"""
+        first_page = doc[0]
+        pix = first_page.get_pixmap(matrix=fitz.Matrix(1.1, 1.1), alpha=False)
+        return {
+            "mtime": mtime,
+            "page_count": len(doc),
+            "first_page_image": Image.frombytes("RGB", (pix.width, pix.height), pix.samples),
+            "first_page_rect": (float(first_page.rect.width), float(first_page.rect.height)),
+        }
 
-        doc = fitz.open(full)
-        try:
-            if len(doc) == 0:
-                return None, "该PDF没有可预览的页面。"
-            first_page = doc[0]
-            page_count = len(doc)
-            first_page_rect = (float(first_page.rect.width), float(first_page.rect.height))
-            pix = first_page.get_pixmap(matrix=fitz.Matrix(1.1, 1.1), alpha=False)
-            png_bytes = pix.tobytes("png")
-            page_image = Image.open(io.BytesIO(png_bytes)).convert("RGB")
-            with self._preview_cache_lock:
-                self._pdf_preview_cache[full] = {
-                    "mtime": mtime,
-                    "page_count": page_count,
-                    "first_page_png": png_bytes,
-                    "first_page_rect": first_page_rect,
-                }
-            return (page_image, page_count, first_page_rect), ""
-        finally:
-            doc.close()
+    def _store_preview_entry(self, path, entry):
+        with self._preview_cache_lock:
+            self._pdf_preview_cache[path] = entry
+            # 缓存的是解码后的图像，只保留最近几份
+            if len(self._pdf_preview_cache) > 8:
+                self._pdf_preview_cache = dict(list(self._pdf_preview_cache.items())[-4:])
+
+    def _load_stamp_preview_data(self, source_pdf):
+        full = os.path.abspath(source_pdf)
+        mtime = self._get_file_mtime_safe(full)
+        with self._preview_cache_lock:
+            entry = self._pdf_preview_cache.get(full)
+        if entry is None or entry.get("mtime") != mtime:
+            doc = fitz.open(full)
+            try:
+                if len(doc) == 0:
+                    return None, "该PDF没有可预览的页面。"
+                entry = self._render_preview_entry(doc, mtime)
+            finally:
+                doc.close()
+            self._store_preview_entry(full, entry)
+        # 预览窗口只读取该图（缩放生成新图），多次打开可共用同一份
+        return (entry["first_page_image"], entry["page_count"], entry["first_page_rect"]), ""
 
     def _open_reorder_preview_dialog(self, preloaded=None, pdf_path=None):
         if preloaded is None:
-            if not PIL_AVAILABLE:
+            if not _load_pil():
                 messagebox.showwarning("提示", "顺序预览需要 Pillow 依赖。")
                 return
-            if not FITZ_UI_AVAILABLE:
+            if not _load_fitz():
                 messagebox.showwarning("提示", "顺序预览需要 PyMuPDF 依赖。")
                 return
             if not self.selected_files_list:
@@ -3314,10 +3679,10 @@ class PDFConverterApp:
 
         total_pages, page_infos = preloaded
 
-        if not PIL_AVAILABLE:
+        if not _load_pil():
             messagebox.showwarning("提示", "顺序预览需要 Pillow 依赖。")
             return
-        if not FITZ_UI_AVAILABLE:
+        if not _load_fitz():
             messagebox.showwarning("提示", "顺序预览需要 PyMuPDF 依赖。")
             return
 
@@ -3325,7 +3690,7 @@ class PDFConverterApp:
         initial_order = list(range(total_pages))
         text = (self.reorder_pages_var.get() or "").strip()
         if text:
-            parser = PDFReorderConverter()
+            parser = _load_converter("PDFReorderConverter")()
             seq, err = parser._parse_reorder_sequence(text, total_pages)
             if not err and seq:
                 initial_order = list(seq)
@@ -3351,7 +3716,7 @@ class PDFConverterApp:
         tk.Label(
             dialog,
             text="拖拽或使用上下按钮调整顺序，点击“应用到重排页序”会自动回填。",
-            font=("Microsoft YaHei", 10),
+            font=self.font_medium,
             fg="#666",
         ).pack(anchor="w", padx=14, pady=(10, 6))
 
@@ -3387,14 +3752,14 @@ class PDFConverterApp:
 
         size_row = tk.Frame(btn_col)
         size_row.pack(anchor="nw", pady=(0, 12))
-        tk.Label(size_row, text="缩略图:", font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+        tk.Label(size_row, text="缩略图:", font=self.font_body).pack(side=tk.LEFT)
         size_combo = ttk.Combobox(
             size_row,
             textvariable=size_mode_var,
             values=["小", "中", "大"],
             state="readonly",
             width=4,
-            font=("Microsoft YaHei", 9),
+            font=self.font_body,
         )
         size_combo.pack(side=tk.LEFT, padx=(6, 0))
 
@@ -3458,7 +3823,7 @@ class PDFConverterApp:
                 card_outline = "#2a91e8" if p == selected else "#d0d0d0"
                 preview_canvas.create_rectangle(x1 - 3, y1 - 3, x2 + 3, y2 + 28, fill=card_fill, outline=card_outline, width=2 if p == selected else 1)
                 preview_canvas.create_image(x, y, anchor="nw", image=tk_img)
-                preview_canvas.create_text((x1 + x2) / 2, y2 + 14, text=f"第 {p + 1} 页", font=("Microsoft YaHei", 9))
+                preview_canvas.create_text((x1 + x2) / 2, y2 + 14, text=f"第 {p + 1} 页", font=self.font_body)
 
                 card_boxes[p] = (x1 - 3, y1 - 3, x2 + 3, y2 + 28)
                 card_centers.append((p, (x1 + x2) / 2))
@@ -3515,9 +3880,9 @@ class PDFConverterApp:
             refresh_tree()
             redraw_cards(keep_focus=False)
 
-        tk.Button(btn_col, text="上移", width=10, font=("Microsoft YaHei", 10), command=lambda: reorder_selected(-1)).pack(anchor="nw", pady=(0, 8))
-        tk.Button(btn_col, text="下移", width=10, font=("Microsoft YaHei", 10), command=lambda: reorder_selected(1)).pack(anchor="nw", pady=(0, 8))
-        tk.Button(btn_col, text="重置顺序", width=10, font=("Microsoft YaHei", 10), command=reset_order).pack(anchor="nw")
+        tk.Button(btn_col, text="上移", width=10, font=self.font_medium, command=lambda: reorder_selected(-1)).pack(anchor="nw", pady=(0, 8))
+        tk.Button(btn_col, text="下移", width=10, font=self.font_medium, command=lambda: reorder_selected(1)).pack(anchor="nw", pady=(0, 8))
+        tk.Button(btn_col, text="重置顺序", width=10, font=self.font_medium, command=reset_order).pack(anchor="nw")
 
         def on_tree_select(_event=None):
             cur = tree.selection()
@@ -3620,8 +3985,8 @@ class PDFConverterApp:
 
         bottom_btns = tk.Frame(dialog)
         bottom_btns.pack(fill=tk.X, padx=12, pady=(0, 10))
-        tk.Button(bottom_btns, text="取消", width=10, font=("Microsoft YaHei", 10), command=dialog.destroy).pack(side=tk.RIGHT)
-        tk.Button(bottom_btns, text="应用到重排页序", width=14, font=("Microsoft YaHei", 10, "bold"), command=apply_order).pack(side=tk.RIGHT, padx=(0, 8))
+        tk.Button(bottom_btns, text="取消", width=10, font=self.font_medium, command=dialog.destroy).pack(side=tk.RIGHT)
+        tk.Button(bottom_btns, text="应用到重排页序", width=14, font=self.font_medium_bold, command=apply_order).pack(side=tk.RIGHT, padx=(0, 8))
 
         tree.bind("<<TreeviewSelect>>", on_tree_select)
         size_combo.bind("<<ComboboxSelected>>", on_size_change)
@@ -3641,49 +4006,44 @@ class PDFConverterApp:
         dialog.after(80, lambda: main_pane.sash_place(0, 0, 260))
 
     def _on_split_mode_changed(self, event=None):
-        mode = self.split_mode_var.get()
-        if mode == "每页一个PDF":
-            self.split_param_entry.config(state='disabled')
-            self.split_param_label.config(text="")
-            self.split_param_hint.config(text="每页将生成一个独立PDF文件")
-            self.split_param_var.set("")
-        elif mode == "每N页一个PDF":
-            self.split_param_entry.config(state='normal')
-            self.split_param_label.config(text="N =")
-            self.split_param_hint.config(text="页/文件")
-            if not self.split_param_var.get():
-                self.split_param_var.set("5")
-        elif mode == "按范围拆分":
-            self.split_param_entry.config(state='normal')
-            self.split_param_label.config(text="范围:")
-            self.split_param_hint.config(text="如: 1-3,4-6,7-10")
+        cfg = SPLIT_MODE_CONFIG.get(self.split_mode_var.get())
+        if cfg is None:
+            return
+        entry_state, label_text, hint_text, param_action = cfg
+        self._set_widget_state(self.split_param_entry, entry_state)
+        self.split_param_label.config(text=label_text)
+        self.split_param_hint.config(text=hint_text)
+        if param_action == "clear":
             self.split_param_var.set("")
+        elif not self.split_param_var.get():
+            self.split_param_var.set("5")
 
     def _on_encrypt_mode_changed(self, event=None):
-        mode = self.encrypt_mode_var.get()
-        if mode == "加密":
-            self.encrypt_pw_label.config(text="打开密码:")
-            self.encrypt_pw_entry.config(state='normal')
-            self.encrypt_owner_label.pack(side=tk.LEFT, padx=(8, 0))
-            self.encrypt_owner_entry.pack(side=tk.LEFT, padx=(4, 0))
-            self.panel_canvas.itemconfigure(self.cv_encrypt_perm, state='normal')
-        else:
-            self.encrypt_pw_label.config(text="密码:")
-            self.encrypt_pw_entry.config(state='normal')
-            self.encrypt_owner_label.pack_forget()
-            self.encrypt_owner_entry.pack_forget()
-            self.panel_canvas.itemconfigure(self.cv_encrypt_perm, state='hidden')
+        pw_label, show_owner = ENCRYPT_MODE_CONFIG.get(
+            self.encrypt_mode_var.get(), ENCRYPT_MODE_CONFIG["解密"])
+        self.encrypt_pw_label.config(text=pw_label)
+        self._set_widget_state(self.encrypt_pw_entry, 'normal')
+        if show_owner != self._encrypt_owner_packed:
+            if show_owner:
+                self.encrypt_owner_label.pack(side=tk.LEFT, padx=(8, 0))
+                self.encrypt_owner_entry.pack(side=tk.LEFT, padx=(4, 0))
+            else:
+                self.encrypt_owner_label.pack_forget()
+                self.encrypt_owner_entry.pack_forget()
+            self._encrypt_owner_packed = show_owner
+        self.panel_canvas.itemconfigure(
+            self.cv_encrypt_perm, state=('normal' if show_owner else 'hidden'))
 
     def _choose_watermark_image(self):
         """选择水印图片"""
         filename = filedialog.askopenfilename(
             title="选择水印图片",
-            filetypes=[("图片文件", "*.png;*.jpg;*.jpeg;*.bmp"), ("所有文件", "*.*")]
+            filetypes=IMAGE_FILETYPES
         )
         if filename:
             self.watermark_image_path = filename
             name = os.path.basename(filename)
-            self.watermark_img_label.config(text=name if len(name) <= 15 else name[:12] + "...")
+            self.watermark_img_label.config(text=_short_name(name))
             self.save_settings()
 
     def _resolve_watermark_mode(self, ui_value=None):
@@ -3692,10 +4052,10 @@ class PDFConverterApp:
 
     def _open_watermark_preview(self, preloaded=None):
         if preloaded is None:
-            if not PIL_AVAILABLE:
+            if not _load_pil():
                 messagebox.showwarning("提示", "水印预览需要 Pillow 依赖。")
                 return
-            if not FITZ_UI_AVAILABLE:
+            if not _load_fitz():
                 messagebox.showwarning("提示", "水印预览需要 PyMuPDF 依赖。")
                 return
             source_pdf = self._resolve_preview_pdf()
@@ -3772,20 +4132,20 @@ class PDFConverterApp:
         except Exception:
             init_opacity = 30
         try:
-            init_rotate = int(self.watermark_rotation_var.get())
+            init_rotate = int(self.watermark_rotation)
         except Exception:
             init_rotate = 45
         try:
-            init_size = int(self.watermark_fontsize_var.get())
+            init_size = int(self.watermark_fontsize)
         except Exception:
             init_size = 40
         init_size = max(10, min(120, init_size))
         try:
-            init_random_strength = int(self._clamp_value(float(self.watermark_random_strength_var.get()), 0.0, 1.0, 0.35) * 100)
+            init_random_strength = int(self._clamp_value(float(self.watermark_random_strength), 0.0, 1.0, 0.35) * 100)
         except Exception:
             init_random_strength = 35
         try:
-            init_spacing = int(self._clamp_value(float(self.watermark_spacing_var.get()), 0.5, 2.0, 1.0) * 100)
+            init_spacing = int(self._clamp_value(float(self.watermark_spacing), 0.5, 2.0, 1.0) * 100)
         except Exception:
             init_spacing = 100
         init_pos = self.watermark_position_var.get().strip()
@@ -3813,7 +4173,7 @@ class PDFConverterApp:
         tk.Label(
             info_row,
             text=f"预览文件：{os.path.basename(source_pdf)}  第1页 / 共{page_count}页",
-            font=("Microsoft YaHei", 9),
+            font=self.font_body,
             fg="#666",
         ).pack(side=tk.LEFT)
 
@@ -3822,15 +4182,15 @@ class PDFConverterApp:
         size_var = tk.DoubleVar(value=init_size)
         rotate_var = tk.DoubleVar(value=init_rotate)
         opacity_var = tk.DoubleVar(value=init_opacity)
-        tk.Label(control_row1, text="大小:", font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+        tk.Label(control_row1, text="大小:", font=self.font_body).pack(side=tk.LEFT)
         size_scale = tk.Scale(control_row1, from_=10, to=120, orient=tk.HORIZONTAL, resolution=1,
                               showvalue=True, variable=size_var, length=180)
         size_scale.pack(side=tk.LEFT, padx=(4, 12))
-        tk.Label(control_row1, text="角度:", font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+        tk.Label(control_row1, text="角度:", font=self.font_body).pack(side=tk.LEFT)
         rotate_scale = tk.Scale(control_row1, from_=-180, to=180, orient=tk.HORIZONTAL, resolution=1,
                                 showvalue=True, variable=rotate_var, length=180)
         rotate_scale.pack(side=tk.LEFT, padx=(4, 12))
-        tk.Label(control_row1, text="透明度:", font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+        tk.Label(control_row1, text="透明度:", font=self.font_body).pack(side=tk.LEFT)
         opacity_scale = tk.Scale(control_row1, from_=5, to=100, orient=tk.HORIZONTAL, resolution=1,
                                  showvalue=True, variable=opacity_var, length=180)
         opacity_scale.pack(side=tk.LEFT, padx=(4, 0))
@@ -3839,16 +4199,16 @@ class PDFConverterApp:
         control_row2.pack(fill=tk.X, padx=12, pady=(0, 6))
         pos_var = tk.StringVar(value=init_pos)
         spacing_var = tk.DoubleVar(value=init_spacing)
-        random_size_var = tk.BooleanVar(value=bool(self.watermark_random_size_var.get()))
+        random_size_var = tk.BooleanVar(value=bool(self.watermark_random_size))
         random_strength_var = tk.DoubleVar(value=init_random_strength)
-        tk.Label(control_row2, text="排列:", font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+        tk.Label(control_row2, text="排列:", font=self.font_body).pack(side=tk.LEFT)
         pos_combo = ttk.Combobox(
             control_row2, textvariable=pos_var,
             values=WATERMARK_POSITION_OPTIONS,
-            state="readonly", width=11, font=("Microsoft YaHei", 9)
+            state="readonly", width=11, font=self.font_body
         )
         pos_combo.pack(side=tk.LEFT, padx=(4, 12))
-        tk.Label(control_row2, text="疏密:", font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+        tk.Label(control_row2, text="疏密:", font=self.font_body).pack(side=tk.LEFT)
         spacing_scale = tk.Scale(
             control_row2, from_=50, to=200, orient=tk.HORIZONTAL, resolution=1,
             showvalue=True, variable=spacing_var, length=150
@@ -3856,9 +4216,9 @@ class PDFConverterApp:
         spacing_scale.pack(side=tk.LEFT, padx=(4, 10))
         tk.Checkbutton(
             control_row2, text="随机大小",
-            variable=random_size_var, font=("Microsoft YaHei", 9)
+            variable=random_size_var, font=self.font_body
         ).pack(side=tk.LEFT, padx=(0, 6))
-        tk.Label(control_row2, text="随机强度:", font=("Microsoft YaHei", 9)).pack(side=tk.LEFT)
+        tk.Label(control_row2, text="随机强度:", font=self.font_body).pack(side=tk.LEFT)
         random_strength_scale = tk.Scale(
             control_row2, from_=0, to=100, orient=tk.HORIZONTAL, resolution=1,
             showvalue=True, variable=random_strength_var, length=180
@@ -3891,7 +4251,7 @@ class PDFConverterApp:
             scale = min(fit_w / page_image.width, fit_h / page_image.height, 1.0)
             disp_w = max(1, int(page_image.width * scale))
             disp_h = max(1, int(page_image.height * scale))
-            disp = page_image.resize((disp_w, disp_h), Image.LANCZOS) if (disp_w != page_image.width or disp_h != page_image.height) else page_image.copy()
+            disp = page_image.resize((disp_w, disp_h), Image.LANCZOS) if (disp_w != page_image.width or disp_h != page_image.height) else page_image
             page_cache[cache_key] = (disp, disp_w, disp_h)
             return page_cache[cache_key]
 
@@ -4013,9 +4373,7 @@ class PDFConverterApp:
             if not has_image:
                 return None
             base = Image.open(self.watermark_image_path).convert("RGBA")
-            alpha = base.split()[3]
-            alpha = alpha.point(lambda a: int(a * opacity01))
-            base.putalpha(alpha)
+            base.putalpha(base.getchannel("A").point([int(a * opacity01) for a in range(256)]))
             if abs(rotate_deg) > 0.01:
                 base = base.rotate(rotate_deg, expand=True, resample=Image.BICUBIC)
             image_stamp_cache[key] = base
@@ -4043,6 +4401,7 @@ class PDFConverterApp:
                     else:
                         nominal_w = max(16, int(disp.width * 0.33 * (base_size / 40.0)))
                     nominal_h = max(10, int(nominal_w * base.height / max(1, base.width)))
+                    resized = {(base.width, base.height): base}  # 平铺时同尺寸的水印只缩放一次
                     for cx, cy, row, col in iter_positions(
                         mode_key, layout_key, disp.width, disp.height, nominal_w, nominal_h,
                         min_gap_x=min_gap_x, min_gap_y=min_gap_y, margin_x=margin_x, margin_y=margin_y
@@ -4050,7 +4409,9 @@ class PDFConverterApp:
                         factor = tile_factor(row, col) if mode_key == "tile" else 1.0
                         tw = max(10, int(nominal_w * factor))
                         th = max(10, int(nominal_h * factor))
-                        stamp = base.resize((tw, th), Image.LANCZOS) if (tw != base.width or th != base.height) else base
+                        stamp = resized.get((tw, th))
+                        if stamp is None:
+                            stamp = resized[(tw, th)] = base.resize((tw, th), Image.BICUBIC)
                         paste_alpha(overlay, stamp, cx - tw / 2.0, cy - th / 2.0)
             else:
                 if wm_text:
@@ -4099,23 +4460,23 @@ class PDFConverterApp:
 
         def apply_preview():
             self.watermark_opacity_var.set(f"{self._clamp_value(opacity_var.get() / 100.0, 0.05, 1.0, 0.3):.2f}")
-            self.watermark_rotation_var.set(str(int(round(rotate_var.get()))))
-            self.watermark_fontsize_var.set(str(int(round(size_var.get()))))
-            self.watermark_size_scale_var.set(f"{self._clamp_value(size_var.get() / 40.0, 0.2, 3.0, 1.0):.3f}")
-            self.watermark_spacing_var.set(f"{self._clamp_value(spacing_var.get() / 100.0, 0.5, 2.0, 1.0):.3f}")
+            self.watermark_rotation = str(int(round(rotate_var.get())))
+            self.watermark_fontsize = str(int(round(size_var.get())))
+            self.watermark_size_scale = f"{self._clamp_value(size_var.get() / 40.0, 0.2, 3.0, 1.0):.3f}"
+            self.watermark_spacing = f"{self._clamp_value(spacing_var.get() / 100.0, 0.5, 2.0, 1.0):.3f}"
             self.watermark_position_var.set(pos_var.get())
-            self.watermark_random_size_var.set(bool(random_size_var.get()))
-            self.watermark_random_strength_var.set(f"{self._clamp_value(random_strength_var.get() / 100.0, 0.0, 1.0, 0.35):.3f}")
+            self.watermark_random_size = bool(random_size_var.get())
+            self.watermark_random_strength = f"{self._clamp_value(random_strength_var.get() / 100.0, 0.0, 1.0, 0.35):.3f}"
             self.save_settings()
             preview_win.destroy()
 
         tk.Button(
             action_row, text="取消", command=preview_win.destroy,
-            font=("Microsoft YaHei", 9), width=12
+            font=self.font_body, width=12
         ).pack(side=tk.RIGHT, padx=(8, 0))
         tk.Button(
             action_row, text="确定并应用", command=apply_preview,
-            font=("Microsoft YaHei", 9, "bold"), width=14
+            font=self.font_body_bold, width=14
         ).pack(side=tk.RIGHT)
 
         size_scale.configure(command=lambda _v=None: schedule_redraw())
@@ -4144,7 +4505,7 @@ class PDFConverterApp:
         dialog.grab_set()
 
         tk.Label(dialog, text="拖拽或使用按钮调整文件顺序（上方文件在前）",
-                 font=("Microsoft YaHei", 9), fg="#666").pack(pady=(8, 4))
+                 font=self.font_body, fg="#666").pack(pady=(8, 4))
 
         list_frame = tk.Frame(dialog)
         list_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=4)
@@ -4153,17 +4514,20 @@ class PDFConverterApp:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
         listbox = tk.Listbox(
-            list_frame, font=("Microsoft YaHei", 9),
+            list_frame, font=self.font_body,
             selectmode=tk.SINGLE, yscrollcommand=scrollbar.set
         )
         listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.config(command=listbox.yview)
 
-        # 填充列表
-        for i, f in enumerate(self.selected_files_list):
-            listbox.insert(tk.END, f"{i+1}. {os.path.basename(f)}")
-        if self.selected_files_list:
-            listbox.selection_set(0)
+        files = self.selected_files_list
+
+        def _row_texts(start, stop):
+            return [f"{i+1}. {os.path.basename(files[i])}" for i in range(start, stop)]
+
+        # 填充列表（一次 insert 传入全部行）
+        listbox.insert(tk.END, *_row_texts(0, len(files)))
+        listbox.selection_set(0)
 
         # 按钮区域
         btn_frame = tk.Frame(dialog)
@@ -4174,52 +4538,51 @@ class PDFConverterApp:
             if not sel or sel[0] == 0:
                 return
             idx = sel[0]
-            self.selected_files_list[idx-1], self.selected_files_list[idx] = \
-                self.selected_files_list[idx], self.selected_files_list[idx-1]
-            _refresh_list(idx - 1)
+            files[idx-1], files[idx] = files[idx], files[idx-1]
+            _refresh_rows(idx - 1, idx + 1, idx - 1)
 
         def move_down():
             sel = listbox.curselection()
-            if not sel or sel[0] >= len(self.selected_files_list) - 1:
+            if not sel or sel[0] >= len(files) - 1:
                 return
             idx = sel[0]
-            self.selected_files_list[idx], self.selected_files_list[idx+1] = \
-                self.selected_files_list[idx+1], self.selected_files_list[idx]
-            _refresh_list(idx + 1)
+            files[idx], files[idx+1] = files[idx+1], files[idx]
+            _refresh_rows(idx, idx + 2, idx + 1)
 
         def remove_item():
             sel = listbox.curselection()
             if not sel:
                 return
             idx = sel[0]
-            self.selected_files_list.pop(idx)
-            new_idx = min(idx, len(self.selected_files_list) - 1)
-            _refresh_list(new_idx)
-
-        def _refresh_list(select_idx=0):
-            listbox.delete(0, tk.END)
-            for i, f in enumerate(self.selected_files_list):
-                listbox.insert(tk.END, f"{i+1}. {os.path.basename(f)}")
-            if self.selected_files_list and select_idx >= 0:
+            files.pop(idx)
+            # 其后各行序号都要前移，从 idx 起重写到末尾
+            _refresh_rows(idx, len(files), min(idx, len(files) - 1))
+
+        def _refresh_rows(start, stop, select_idx):
+            """只重写 [start, stop) 范围内的行，其余行保持不动"""
+            listbox.delete(start, tk.END if stop >= len(files) else stop - 1)
+            listbox.insert(start, *_row_texts(start, stop))
+            listbox.selection_clear(0, tk.END)
+            if files and select_idx >= 0:
                 listbox.selection_set(select_idx)
                 listbox.see(select_idx)
 
         tk.Button(btn_frame, text="⬆ 上移", command=move_up,
-                  font=("Microsoft YaHei", 9), width=8, cursor='hand2'
+                  font=self.font_body, width=8, cursor='hand2'
                   ).pack(side=tk.LEFT, padx=4)
         tk.Button(btn_frame, text="⬇ 下移", command=move_down,
-                  font=("Microsoft YaHei", 9), width=8, cursor='hand2'
+                  font=self.font_body, width=8, cursor='hand2'
                   ).pack(side=tk.LEFT, padx=4)
         tk.Button(btn_frame, text="✕ 移除", command=remove_item,
-                  font=("Microsoft YaHei", 9), width=8, cursor='hand2'
+                  font=self.font_body, width=8, cursor='hand2'
                   ).pack(side=tk.LEFT, padx=4)
 
         def on_confirm():
-            count = len(self.selected_files_list)
+            count = len(files)
             if count == 0:
                 self.selected_file.set("")
             elif count == 1:
-                self.selected_file.set(self.selected_files_list[0])
+                self.selected_file.set(files[0])
             else:
                 self.selected_file.set(f"已选择 {count} 个文件")
             func = self.current_function_var.get()
@@ -4231,14 +4594,16 @@ class PDFConverterApp:
             dialog.destroy()
 
         tk.Button(btn_frame, text="✓ 确定", command=on_confirm,
-                  font=("Microsoft YaHei", 9, "bold"), width=8, cursor='hand2'
+                  font=self.font_body_bold, width=8, cursor='hand2'
                   ).pack(side=tk.RIGHT, padx=4)
 
     def _update_order_btn(self):
         """多文件时显示排序按钮，否则隐藏"""
         func = self.current_function_var.get()
-        show = (len(self.selected_files_list) > 1
-                and func in ("图片转PDF", "PDF合并", "PDF转Word", "PDF转图片", "PDF批量文本/图片提取", "PDF批量盖章"))
+        show = len(self.selected_files_list) > 1 and func in ORDER_BTN_FUNCTIONS
+        if show == self._order_btn_shown:
+            return
+        self._order_btn_shown = show
         if show:
             self.order_btn.pack(side=tk.LEFT, padx=(10, 0), ipady=6)
         else:
@@ -4293,11 +4658,11 @@ class PDFConverterApp:
             self.root.config(cursor="watch")
             self.root.update_idletasks()
 
-            if func in ("PDF转Word", "PDF转图片", "PDF合并", "PDF批量文本/图片提取", "PDF批量盖章"):
+            if func in MULTI_PDF_FUNCTIONS:
                 # 多选PDF文件
                 filenames = filedialog.askopenfilenames(
                     title="选择PDF文件（可多选）",
-                    filetypes=[("PDF文件", "*.pdf"), ("所有文件", "*.*")]
+                    filetypes=PDF_FILETYPES
                 )
                 if filenames:
                     self.selected_files_list = list(filenames)
@@ -4307,9 +4672,7 @@ class PDFConverterApp:
                         self.status_message.set(f"已选择: {os.path.basename(filenames[0])}")
                     else:
                         self.selected_file.set(f"已选择 {count} 个PDF文件")
-                        names = ", ".join(os.path.basename(f) for f in filenames[:3])
-                        if count > 3:
-                            names += f" 等共{count}个"
+                        names = self._summarize_file_names(filenames)
                         self.status_message.set(f"已选择: {names}")
                     # 更新合并信息
                     if func == "PDF合并":
@@ -4321,7 +4684,7 @@ class PDFConverterApp:
                 # 单选PDF
                 filename = filedialog.askopenfilename(
                     title="选择PDF文件",
-                    filetypes=[("PDF文件", "*.pdf"), ("所有文件", "*.*")]
+                    filetypes=PDF_FILETYPES
                 )
                 if filename:
                     self.selected_file.set(filename)
@@ -4346,16 +4709,14 @@ class PDFConverterApp:
                             f"已选择: {os.path.basename(filenames[0])}")
                     else:
                         self.selected_file.set(f"已选择 {count} 张图片")
-                        names = ", ".join(os.path.basename(f) for f in filenames[:3])
-                        if count > 3:
-                            names += f" 等共{count}个"
+                        names = self._summarize_file_names(filenames)
                         self.status_message.set(f"已选择: {names}")
 
-            elif func in ("PDF加水印", "PDF加密/解密", "PDF压缩", "PDF提取/删页", "OCR可搜索PDF", "PDF转Excel", "PDF页面重排/旋转/倒序", "PDF添加/移除书签"):
+            elif func in SINGLE_PDF_FUNCTIONS:
                 # 单选PDF
                 filename = filedialog.askopenfilename(
                     title="选择PDF文件",
-                    filetypes=[("PDF文件", "*.pdf"), ("所有文件", "*.*")]
+                    filetypes=PDF_FILETYPES
                 )
                 if filename:
                     self.selected_file.set(filename)
@@ -4367,6 +4728,14 @@ class PDFConverterApp:
         self._preheat_pdf_metadata_async(self.selected_files_list)
         self._update_order_btn()
 
+    @staticmethod
+    def _summarize_file_names(paths):
+        """取前3个文件名拼接用于状态栏，超出时追加总数"""
+        names = ", ".join(islice(map(os.path.basename, paths), 3))
+        if len(paths) > 3:
+            names += f" 等共{len(paths)}个"
+        return names
+
     def clear_selection(self):
         self.selected_file.set("")
         self.selected_files_list = []
@@ -4382,8 +4751,7 @@ class PDFConverterApp:
         self.current_page_total = None
         self.current_phase = None
         self.page_start_time = None
-        self.current_eta_text = ""
-        self.base_status_text = ""
+        self._status_state = ("", "")
         self.conversion_active = False
         self.page_start_var.set("")
         self.page_end_var.set("")
@@ -4406,7 +4774,12 @@ class PDFConverterApp:
                         decoded.append(f.decode('latin-1'))
             else:
                 decoded.append(str(f))
+        # windnd 在窗口消息钩子中回调，这里只做解码；筛选与界面更新
+        # 交给UI队列，钩子立即返回，多个文件的结果一次性应用
+        self._post_ui(lambda: self._apply_dropped_files(decoded))
 
+    def _apply_dropped_files(self, decoded):
+        """按当前功能筛选拖入的文件并更新选择（UI线程）"""
         func = self.current_function_var.get()
 
         if func == '图片转PDF':
@@ -4431,9 +4804,7 @@ class PDFConverterApp:
             self.status_message.set(f"拖拽导入: {os.path.basename(valid[0])}")
         else:
             self.selected_file.set(f"已拖拽 {count} 个文件")
-            names = ", ".join(os.path.basename(f) for f in valid[:3])
-            if count > 3:
-                names += f" 等共{count}个"
+            names = self._summarize_file_names(valid)
             self.status_message.set(f"拖拽导入: {names}")
 
         # 更新合并信息
@@ -4535,13 +4906,24 @@ class PDFConverterApp:
         self.current_page_total = None
         self.current_phase = None
         self.page_start_time = None
-        self.current_eta_text = ""
-        self.base_status_text = ""
+        self._status_state = ("", "")
+        self._last_percent = -1
+        self._last_progress_text = None
+        self._last_status_text = None
         self.start_page_timer()
 
-        thread = threading.Thread(target=self.perform_conversion)
-        thread.daemon = True
-        thread.start()
+        self._job_q.put(self.perform_conversion)
+
+    def _worker_loop(self):
+        """常驻工作线程：依次取出任务执行，避免每次转换都新建线程"""
+        while True:
+            job = self._job_q.get()
+            try:
+                job()
+            except Exception as e:
+                logging.error(f"后台任务异常: {e}", exc_info=True)
+            finally:
+                self._job_q.task_done()
 
     def perform_conversion(self):
         try:
@@ -4582,27 +4964,23 @@ class PDFConverterApp:
                 self._do_convert_bookmark()
         except Exception as e:
             logging.error(f"转换异常: {e}", exc_info=True)
-            self.root.after(0, lambda: messagebox.showerror(
-                "转换失败", f"转换过程中出错：\n{str(e)}"))
-            self.root.after(0, lambda: self.status_message.set("转换失败"))
+            self._post_error("转换失败", f"转换过程中出错：\n{str(e)}", "转换失败")
         finally:
             with self._state_lock:
                 self.conversion_active = False
             self.stop_page_timer()
-            self.root.after(0, lambda: self.convert_btn.config(state=tk.NORMAL))
+            self._post_ui(lambda: self.convert_btn.config(state=tk.NORMAL))
 
     # ----------------------------------------------------------
     # PDF → Word（支持批量）
     # ----------------------------------------------------------
 
     def _do_convert_to_word(self):
-        files = self.selected_files_list
+        files = tuple(self.selected_files_list)
         if not files:
             return
 
-        self.root.after(0, lambda: self.progress_bar.config(
-            mode='determinate', maximum=100, value=0))
-        self.start_time = time.time()
+        self._begin_determinate_progress()
 
         total_files = len(files)
 
@@ -4611,34 +4989,24 @@ class PDFConverterApp:
             start_page, end_page = 0, None
             # 用户设置了页范围时提示
             if self.page_start_var.get().strip() or self.page_end_var.get().strip():
-                self.root.after(0, lambda: self.status_message.set(
+                self._post_ui(lambda: self.status_message.set(
                     "批量模式已自动忽略页范围，每个文件将全部转换"))
         else:
             start_page, end_page = self._parse_page_range_for_converter()
         results = []
+        word_cls = _load_converter("PDFToWordConverter")
 
         for file_idx, input_file in enumerate(files):
             output_file = self.generate_output_filename(input_file, '.docx')
 
             if total_files > 1:
                 # 批量模式：用包装回调显示总体进度
-                def make_progress_cb(fi, tf):
-                    def cb(percent, progress_text, status_text):
-                        overall = int((fi / tf + max(0, percent) / 100 / tf) * 100)
-                        file_label = os.path.basename(files[fi])
-                        self._simple_progress_callback(
-                            overall,
-                            f"[{fi + 1}/{tf}] {file_label}: {progress_text}",
-                            status_text or f"正在转换: {file_label}"
-                        )
-                    return cb
-
-                converter = PDFToWordConverter(
-                    on_progress=make_progress_cb(file_idx, total_files),
+                converter = word_cls(
+                    on_progress=_BatchProgress(self, file_idx, total_files, input_file),
                     pdf2docx_progress=None,  # 批量模式跳过详细进度
                 )
             else:
-                converter = PDFToWordConverter(
+                converter = word_cls(
                     on_progress=self._simple_progress_callback,
                     pdf2docx_progress=self.update_progress,
                 )
@@ -4648,7 +5016,7 @@ class PDFConverterApp:
                 start_page=start_page, end_page=end_page,
                 ocr_enabled=self.ocr_enabled_var.get(),
                 formula_api_enabled=self.formula_api_enabled_var.get(),
-                ocr_mode=self.ocr_quality_mode_var.get(),
+                ocr_mode=self.ocr_quality_mode,
                 api_key=self.baidu_api_key,
                 secret_key=self.baidu_secret_key,
                 xslt_path=self.xslt_path,
@@ -4656,14 +5024,7 @@ class PDFConverterApp:
             results.append((input_file, output_file, result))
 
             # 记录历史
-            self.history.add({
-                'function': 'PDF转Word',
-                'input_files': [input_file],
-                'output': output_file,
-                'success': result['success'],
-                'message': result.get('message', ''),
-                'page_count': result.get('page_count', 0),
-            })
+            self._record_history('PDF转Word', [input_file], result, output=output_file)
 
         # 显示结果
         if total_files == 1:
@@ -4676,9 +5037,7 @@ class PDFConverterApp:
         _, output_file, result = result_tuple
 
         if not result['success']:
-            self.root.after(0, lambda: messagebox.showerror(
-                "转换失败", result.get('message', '未知错误')))
-            self.root.after(0, lambda: self.status_message.set("转换失败"))
+            self._post_error("转换失败", result.get('message', '未知错误'), "转换失败")
             return
 
         mode_text = "OCR模式" if result.get('mode') == 'ocr' else ""
@@ -4691,38 +5050,40 @@ class PDFConverterApp:
             success_msg += f"\n\n⚠ {len(result['errors'])} 页识别出错（已用图片替代）"
         success_msg += "\n\n是否打开文件所在文件夹？"
 
+        skipped_msg = ""
+        if result.get('skipped_pages'):
+            skipped = self.format_skipped_pages(result['skipped_pages'])
+            skipped_msg = f"以下页面在转换中被跳过：\n{skipped}"
+        error_msg = ""
+        if result.get('errors'):
+            err_detail = "\n".join(result['errors'][:10])
+            error_msg = f"以下页面识别失败：\n{err_detail}"
+
         def _show():
             if messagebox.askyesno("转换成功", success_msg):
                 self.open_folder(output_file)
-            if result.get('skipped_pages'):
-                skipped = self.format_skipped_pages(result['skipped_pages'])
-                messagebox.showwarning("跳过异常页",
-                                       f"以下页面在转换中被跳过：\n{skipped}")
-            if result.get('errors'):
-                err_detail = "\n".join(result['errors'][:10])
-                messagebox.showwarning("OCR识别警告",
-                                       f"以下页面识别失败：\n{err_detail}")
+            if skipped_msg:
+                messagebox.showwarning("跳过异常页", skipped_msg)
+            if error_msg:
+                messagebox.showwarning("OCR识别警告", error_msg)
 
-        self.root.after(0, _show)
+        self._post_ui(_show)
 
     # ----------------------------------------------------------
     # PDF批量文本/图片提取
     # ----------------------------------------------------------
 
     def _do_convert_batch_extract(self):
-        converter = PDFBatchExtractConverter(
-            on_progress=self._simple_progress_callback
-        )
+        files_snapshot = tuple(self.selected_files_list)
+        converter = self._get_converter("PDFBatchExtractConverter")
 
-        self.root.after(0, lambda: self.progress_bar.config(
-            mode='determinate', maximum=100, value=0))
-        self.start_time = time.time()
+        self._begin_determinate_progress()
 
         text_mode_val = self.batch_text_mode_var.get()
         text_mode = "merge" if "合并" in text_mode_val else "per_page"
 
         result = converter.convert(
-            files=list(self.selected_files_list),
+            files=files_snapshot,
             pages_str=self.batch_pages_var.get().strip(),
             extract_text=bool(self.batch_text_enabled_var.get()),
             extract_images=bool(self.batch_image_enabled_var.get()),
@@ -4730,7 +5091,7 @@ class PDFConverterApp:
             text_mode=text_mode,
             preserve_layout=bool(self.batch_preserve_layout_var.get()),
             ocr_enabled=bool(self.batch_ocr_enabled_var.get()),
-            ocr_mode=self.ocr_quality_mode_var.get(),
+            ocr_mode=self.ocr_quality_mode,
             api_key=self.baidu_api_key,
             secret_key=self.baidu_secret_key,
             image_per_page=bool(self.batch_image_per_page_var.get()),
@@ -4743,110 +5104,89 @@ class PDFConverterApp:
         )
 
         # 记录历史
-        self.history.add({
-            'function': 'PDF批量文本/图片提取',
-            'input_files': list(self.selected_files_list),
-            'output': result.get('output_dir', ''),
-            'success': result.get('success', False),
-            'message': result.get('message', ''),
-            'page_count': result.get('stats', {}).get('page_count', 0),
-        })
+        self._record_history(
+            'PDF批量文本/图片提取',
+            files_snapshot,
+            result,
+            output=result.get('output_dir', ''),
+            page_count=result.get('stats', {}).get('page_count', 0),
+        )
 
         if not result.get('success'):
-            self.root.after(0, lambda: messagebox.showerror(
-                "批量提取失败", result.get('message', '未知错误')))
-            self.root.after(0, lambda: self.status_message.set("批量提取失败"))
+            self._post_error("批量提取失败", result.get('message', '未知错误'), "批量提取失败")
             return
 
         output_dir = result.get('output_dir', '')
         output_zip = result.get('output_zip', '')
 
+        msg = (f"{result.get('message', '')}\n\n"
+               f"输出目录：\n{output_dir}")
+        if output_zip:
+            msg += f"\n\n已生成ZIP：\n{output_zip}"
+        msg += "\n\n是否打开输出文件夹？"
+
         def _show():
-            msg = (f"{result.get('message', '')}\n\n"
-                   f"输出目录：\n{output_dir}")
-            if output_zip:
-                msg += f"\n\n已生成ZIP：\n{output_zip}"
-            msg += "\n\n是否打开输出文件夹？"
             if messagebox.askyesno("批量提取完成", msg):
                 self.open_folder(output_dir)
             self.status_message.set("批量提取完成")
 
-        self.root.after(0, _show)
+        self._post_ui(_show)
 
     def _do_convert_batch_stamp(self):
-        self.root.after(0, lambda: self.progress_bar.config(
-            mode='determinate', maximum=100, value=0))
-        self.start_time = time.time()
+        files_snapshot = tuple(self.selected_files_list)
+        self._begin_determinate_progress()
 
         mode_key = self._get_stamp_mode_key()
         if mode_key == "signature":
-            sign_converter = PDFBatchSignConverter(
-                on_progress=self._simple_progress_callback
-            )
+            sign_converter = self._get_converter("PDFBatchSignConverter")
             sign_items = self._collect_signature_items()
             result = sign_converter.convert(
-                files=list(self.selected_files_list),
+                files=files_snapshot,
                 signature_items=sign_items,
                 remove_white_bg=bool(self.stamp_remove_white_bg_var.get()),
             )
 
-            self.history.add({
-                'function': 'PDF批量签名',
-                'input_files': list(self.selected_files_list),
-                'output': ', '.join(result.get('output_files', [])),
-                'success': result.get('success', False),
-                'message': result.get('message', ''),
-                'page_count': result.get('page_count', 0),
-            })
+            self._record_history(
+                'PDF批量签名',
+                files_snapshot,
+                result,
+                output=', '.join(result.get('output_files', [])),
+            )
 
             if not result.get('success'):
-                self.root.after(0, lambda: messagebox.showerror(
-                    "批量签名失败", result.get('message', '未知错误')))
-                self.root.after(0, lambda: self.status_message.set("批量签名失败"))
+                self._post_error("批量签名失败", result.get('message', '未知错误'), "批量签名失败")
                 return
 
             output_files = result.get('output_files', [])
 
+            msg = (f"{result.get('message', '批量签名完成')}\n\n"
+                   f"输出文件数量：{len(output_files)}")
+            if output_files:
+                msg += f"\n\n示例输出：\n{output_files[0]}"
+            msg += "\n\n是否打开输出文件夹？"
+
             def _show_sign():
-                msg = (f"{result.get('message', '批量签名完成')}\n\n"
-                       f"输出文件数量：{len(output_files)}")
-                if output_files:
-                    msg += f"\n\n示例输出：\n{output_files[0]}"
-                msg += "\n\n是否打开输出文件夹？"
                 if messagebox.askyesno("批量签名完成", msg) and output_files:
                     self.open_folder(output_files[0])
                 self.status_message.set("批量签名完成")
 
-            self.root.after(0, _show_sign)
+            self._post_ui(_show_sign)
             return
 
-        converter = PDFBatchStampConverter(
-            on_progress=self._simple_progress_callback
-        )
+        converter = self._get_converter("PDFBatchStampConverter")
 
-        seam_side_map = {"右侧": "right", "左侧": "left", "顶部": "top", "底部": "bottom"}
-        seam_align_map = {"居中": "center", "顶部": "top", "底部": "bottom"}
-        opacity_value = self._clamp_value(
-            self.stamp_preview_profile.get("opacity", self.stamp_opacity_var.get()),
-            0.05,
-            1.0,
-            0.85,
-        )
-        size_ratio = self._clamp_value(
-            self.stamp_preview_profile.get("size_ratio", 0.18),
-            0.03,
-            0.7,
-            0.18,
-        )
+        preview_profile = self._snapshot_stamp_preview_profile()
+        opacity_value = preview_profile["opacity"]
+        size_ratio = preview_profile["size_ratio"]
         placement = {
-            "x_ratio": self._clamp_value(self.stamp_preview_profile.get("x_ratio", 0.85), 0.0, 1.0, 0.85),
-            "y_ratio": self._clamp_value(self.stamp_preview_profile.get("y_ratio", 0.85), 0.0, 1.0, 0.85),
+            "x_ratio": preview_profile["x_ratio"],
+            "y_ratio": preview_profile["y_ratio"],
             "size_ratio": size_ratio,
         }
         stamp_profiles = self._get_enabled_stamp_profiles()
 
         result = converter.convert(
-            files=list(self.selected_files_list),
+            files=files_snapshot,
             mode=mode_key,
             pages_str=self.stamp_pages_var.get().strip(),
             opacity=opacity_value,
@@ -4854,8 +5194,8 @@ class PDFConverterApp:
             size_ratio=size_ratio,
             seal_image_path=self._get_active_stamp_image_path(),
             qr_text=self.stamp_qr_text_var.get().strip(),
-            seam_side=seam_side_map.get(self.stamp_seam_side_var.get(), "right"),
-            seam_align=seam_align_map.get(self.stamp_seam_align_var.get(), "center"),
+            seam_side=SEAM_SIDE_TO_KEY.get(self.stamp_seam_side_var.get(), "right"),
+            seam_align=SEAM_ALIGN_TO_KEY.get(self.stamp_seam_align_var.get(), "center"),
             seam_overlap_ratio=self.stamp_seam_overlap_var.get().strip() or "0.25",
             template_path=self.stamp_template_path,
             placement=placement,
@@ -4863,84 +5203,84 @@ class PDFConverterApp:
             stamp_profiles=stamp_profiles,
         )
 
-        self.history.add({
-            'function': 'PDF批量盖章',
-            'input_files': list(self.selected_files_list),
-            'output': ', '.join(result.get('output_files', [])),
-            'success': result.get('success', False),
-            'message': result.get('message', ''),
-            'page_count': result.get('page_count', 0),
-        })
+        self._record_history(
+            'PDF批量盖章',
+            files_snapshot,
+            result,
+            output=', '.join(result.get('output_files', [])),
+        )
 
         if not result.get('success'):
-            self.root.after(0, lambda: messagebox.showerror(
-                "批量盖章失败", result.get('message', '未知错误')))
-            self.root.after(0, lambda: self.status_message.set("批量盖章失败"))
+            self._post_error("批量盖章失败", result.get('message', '未知错误'), "批量盖章失败")
             return
 
         output_files = result.get('output_files', [])
+        message = result.get('message', '批量盖章完成')
+
+        msg = (f"{message}\n\n"
+               f"输出文件数量：{len(output_files)}")
+        if output_files:
+            msg += f"\n\n示例输出：\n{output_files[0]}"
+        msg += "\n\n是否打开输出文件夹？"
 
         def _show():
-            msg = (f"{result.get('message', '批量盖章完成')}\n\n"
-                   f"输出文件数量：{len(output_files)}")
-            if output_files:
-                msg += f"\n\n示例输出：\n{output_files[0]}"
-            msg += "\n\n是否打开输出文件夹？"
             if messagebox.askyesno("批量盖章完成", msg) and output_files:
                 self.open_folder(output_files[0])
             self.status_message.set("批量盖章完成")
 
-        self.root.after(0, _show)
+        self._post_ui(_show)
 
     def _show_batch_word_result(self, results):
         """显示批量Word转换结果"""
         total = len(results)
-        success_count = sum(1 for _, _, r in results if r['success'])
+        success_count = total_pages = 0
+        failures = []
+        for f, _, r in results:
+            if r['success']:
+                success_count += 1
+            else:
+                failures.append((f, r.get('message', '未知错误')))
+            total_pages += r.get('page_count', 0)
         fail_count = total - success_count
-        total_pages = sum(r.get('page_count', 0) for _, _, r in results)
+
+        if fail_count == 0:
+            msg = (f"批量转换完成！\n\n"
+                   f"成功: {success_count} 个文件\n"
+                   f"共 {total_pages} 页\n\n"
+                   f"输出文件保存在各PDF同目录下")
+        else:
+            msg = (f"批量转换部分完成\n\n"
+                   f"成功: {success_count} 个\n"
+                   f"失败: {fail_count} 个")
+            for f, err in failures:
+                msg += f"\n\n❌ {os.path.basename(f)}: {err}"
+        status_text = f"转换完成: {success_count}/{total} 成功, 共{total_pages}页"
 
         def _show():
             if fail_count == 0:
-                msg = (f"批量转换完成！\n\n"
-                       f"成功: {success_count} 个文件\n"
-                       f"共 {total_pages} 页\n\n"
-                       f"输出文件保存在各PDF同目录下")
                 messagebox.showinfo("批量转换完成", msg)
             else:
-                msg = (f"批量转换部分完成\n\n"
-                       f"成功: {success_count} 个\n"
-                       f"失败: {fail_count} 个")
-                for f, _, r in results:
-                    if not r['success']:
-                        msg += f"\n\n❌ {os.path.basename(f)}: {r.get('message', '未知错误')}"
                 messagebox.showwarning("批量转换", msg)
+            self.status_message.set(status_text)
 
-            self.status_message.set(
-                f"转换完成: {success_count}/{total} 成功, 共{total_pages}页")
-
-        self.root.after(0, _show)
+        self._post_ui(_show)
 
     # ----------------------------------------------------------
     # PDF → 图片
     # ----------------------------------------------------------
 
     def _do_convert_to_images(self):
-        converter = PDFToImageConverter(
-            on_progress=self._simple_progress_callback
-        )
+        files_snapshot = tuple(self.selected_files_list)
+        converter = self._get_converter("PDFToImageConverter")
 
-        self.root.after(0, lambda: self.progress_bar.config(
-            mode='determinate', maximum=100, value=0))
-        self.start_time = time.time()
+        self._begin_determinate_progress()
 
         # 解析页范围
-        start_text = self.page_start_var.get().strip()
-        end_text = self.page_end_var.get().strip()
-        start_page = int(start_text) if start_text and start_text.isdigit() else None
-        end_page = int(end_text) if end_text and end_text.isdigit() else None
+        start_page = _parse_int(self.page_start_var.get(), min_value=0)
+        end_page = _parse_int(self.page_end_var.get(), min_value=0)
 
         result = converter.convert(
-            files=self.selected_files_list,
+            files=files_snapshot,
             dpi=self.image_dpi_var.get(),
             img_format=self.image_format_var.get(),
             start_page=start_page,
@@ -4948,211 +5288,163 @@ class PDFConverterApp:
         )
 
         # 记录历史
-        self.history.add({
-            'function': 'PDF转图片',
-            'input_files': list(self.selected_files_list),
-            'output': ', '.join(result.get('output_dirs', [])),
-            'success': result['success'],
-            'message': result.get('message', ''),
-            'page_count': result.get('page_count', 0),
-        })
+        self._record_history(
+            'PDF转图片',
+            files_snapshot,
+            result,
+            output=', '.join(result.get('output_dirs', [])),
+        )
 
         if not result['success'] and result.get('message'):
-            self.root.after(0, lambda: messagebox.showerror(
-                "转换失败", result['message']))
-            self.root.after(0, lambda: self.status_message.set("转换失败"))
+            self._post_error("转换失败", result['message'], "转换失败")
             return
 
-        def _show():
-            output_dirs = result['output_dirs']
-            errors = result['errors']
-            processed = result['page_count']
-            files = self.selected_files_list
-            dpi = result['dpi']
-            img_format = result['format']
+        output_dirs = result['output_dirs']
+        errors = result['errors']
+        processed = result['page_count']
+        files = files_snapshot
+        dpi = result['dpi']
+        img_format = result['format']
+
+        if errors:
+            # 大批量时只列出前若干条，避免弹窗文字过长
+            err_msg = "\n".join(islice(errors, 10))
+            if len(errors) > 10:
+                err_msg += f"\n...等共 {len(errors)} 个错误"
+            msg = f"转换完成，但有 {len(errors)} 个文件出错：\n\n{err_msg}"
+            if output_dirs:
+                msg += "\n\n成功的文件已保存到各PDF同目录下的文件夹中"
+        elif len(files) == 1:
+            msg = (f"PDF已成功转换为图片！\n\nDPI: {dpi}  格式: {img_format}\n"
+                   f"共 {processed} 页\n\n保存位置：\n{output_dirs[0]}")
+        else:
+            dir_list = "\n".join(islice(output_dirs, 5))
+            if len(output_dirs) > 5:
+                dir_list += f"\n...等共 {len(output_dirs)} 个文件夹"
+            msg = (f"所有PDF已成功转换为图片！\n\nDPI: {dpi}  格式: {img_format}\n"
+                   f"共 {len(files)} 个文件，{processed} 页\n\n保存位置：\n{dir_list}")
+        status_text = f"转换完成：{len(files)}个文件，共{processed}页"
 
+        def _show():
             if errors:
-                err_msg = "\n".join(errors)
-                msg = f"转换完成，但有 {len(errors)} 个文件出错：\n\n{err_msg}"
-                if output_dirs:
-                    msg += "\n\n成功的文件已保存到各PDF同目录下的文件夹中"
                 messagebox.showwarning("部分完成", msg)
             else:
-                if len(files) == 1:
-                    msg = (f"PDF已成功转换为图片！\n\nDPI: {dpi}  格式: {img_format}\n"
-                           f"共 {processed} 页\n\n保存位置：\n{output_dirs[0]}")
-                else:
-                    dir_list = "\n".join(output_dirs[:5])
-                    if len(output_dirs) > 5:
-                        dir_list += f"\n...等共 {len(output_dirs)} 个文件夹"
-                    msg = (f"所有PDF已成功转换为图片！\n\nDPI: {dpi}  格式: {img_format}\n"
-                           f"共 {len(files)} 个文件，{processed} 页\n\n保存位置：\n{dir_list}")
                 messagebox.showinfo("转换成功", msg)
 
             if output_dirs:
-                try:
-                    os.startfile(output_dirs[0])
-                except Exception:
-                    pass
+                self._start_file_async(output_dirs[0])
 
-            self.status_message.set(
-                f"转换完成：{len(files)}个文件，共{processed}页")
+            self.status_message.set(status_text)
 
-        self.root.after(0, _show)
+        self._post_ui(_show)
 
     # ----------------------------------------------------------
     # PDF 合并
     # ----------------------------------------------------------
 
     def _do_convert_merge(self):
-        converter = PDFMergeConverter(
-            on_progress=self._simple_progress_callback
-        )
+        files_snapshot = tuple(self.selected_files_list)
+        converter = self._get_converter("PDFMergeConverter")
 
-        self.root.after(0, lambda: self.progress_bar.config(
-            mode='determinate', maximum=100, value=0))
-        self.start_time = time.time()
+        self._begin_determinate_progress()
 
-        result = converter.convert(files=self.selected_files_list)
+        result = converter.convert(files=files_snapshot)
 
         # 记录历史
-        self.history.add({
-            'function': 'PDF合并',
-            'input_files': list(self.selected_files_list),
-            'output': result.get('output_file', ''),
-            'success': result['success'],
-            'message': result.get('message', ''),
-            'page_count': result.get('page_count', 0),
-        })
+        self._record_history('PDF合并', files_snapshot, result)
 
         if not result['success']:
-            self.root.after(0, lambda: messagebox.showerror(
-                "合并失败", result['message']))
-            self.root.after(0, lambda: self.status_message.set("合并失败"))
+            self._post_error("合并失败", result['message'], "合并失败")
             return
 
         output_file = result['output_file']
         page_count = result['page_count']
         file_count = result['file_count']
 
+        msg = (f"PDF合并成功！\n\n"
+               f"合并了 {file_count} 个文件，共 {page_count} 页\n\n"
+               f"保存位置：\n{output_file}\n\n"
+               f"是否打开文件所在文件夹？")
+
         def _show():
-            msg = (f"PDF合并成功！\n\n"
-                   f"合并了 {file_count} 个文件，共 {page_count} 页\n\n"
-                   f"保存位置：\n{output_file}\n\n"
-                   f"是否打开文件所在文件夹？")
             if messagebox.askyesno("合并成功", msg):
                 self.open_folder(output_file)
             self.status_message.set(
                 f"合并完成: {file_count}个文件, {page_count}页")
 
-        self.root.after(0, _show)
+        self._post_ui(_show)
 
     # ----------------------------------------------------------
     # PDF 拆分
     # ----------------------------------------------------------
 
     def _do_convert_split(self):
-        converter = PDFSplitConverter(
-            on_progress=self._simple_progress_callback
-        )
+        files_snapshot = tuple(self.selected_files_list)
+        converter = self._get_converter("PDFSplitConverter")
 
-        self.root.after(0, lambda: self.progress_bar.config(
-            mode='determinate', maximum=100, value=0))
-        self.start_time = time.time()
+        self._begin_determinate_progress()
 
         # 解析拆分模式
         mode_text = self.split_mode_var.get()
-        mode_map = {
-            "每页一个PDF": "every_page",
-            "每N页一个PDF": "by_interval",
-            "按范围拆分": "by_ranges",
-        }
-        mode = mode_map.get(mode_text, "every_page")
+        mode = SPLIT_MODE_TO_KEY.get(mode_text, "every_page")
 
         interval = 1
         ranges = None
         if mode == "by_interval":
-            try:
-                interval = int(self.split_param_var.get())
-                if interval < 1:
-                    raise ValueError
-            except (ValueError, TypeError):
-                self.root.after(0, lambda: messagebox.showerror(
-                    "参数错误", "请输入有效的页数（正整数）"))
+            interval = _parse_int(self.split_param_var.get(), min_value=1)
+            if interval is None:
+                self._post_error("参数错误", "请输入有效的页数（正整数）")
                 return
         elif mode == "by_ranges":
             ranges = self.split_param_var.get().strip()
             if not ranges:
-                self.root.after(0, lambda: messagebox.showerror(
-                    "参数错误", "请输入拆分范围，如：1-3,4-6,7-10"))
+                self._post_error("参数错误", "请输入拆分范围，如：1-3,4-6,7-10")
                 return
 
         result = converter.convert(
-            input_file=self.selected_files_list[0],
+            input_file=files_snapshot[0],
             mode=mode,
             interval=interval,
             ranges=ranges,
         )
 
         # 记录历史
-        self.history.add({
-            'function': 'PDF拆分',
-            'input_files': list(self.selected_files_list),
-            'output': result.get('output_dir', ''),
-            'success': result['success'],
-            'message': result.get('message', ''),
-            'page_count': result.get('page_count', 0),
-        })
+        self._record_history('PDF拆分', files_snapshot, result, output=result.get('output_dir', ''))
 
         if not result['success']:
-            self.root.after(0, lambda: messagebox.showerror(
-                "拆分失败", result['message']))
-            self.root.after(0, lambda: self.status_message.set("拆分失败"))
+            self._post_error("拆分失败", result['message'], "拆分失败")
             return
 
         output_dir = result['output_dir']
         file_count = result['file_count']
         page_count = result['page_count']
 
+        msg = (f"PDF拆分成功！\n\n"
+               f"共 {page_count} 页拆分为 {file_count} 个文件\n\n"
+               f"保存位置：\n{output_dir}")
+
         def _show():
-            msg = (f"PDF拆分成功！\n\n"
-                   f"共 {page_count} 页拆分为 {file_count} 个文件\n\n"
-                   f"保存位置：\n{output_dir}")
             messagebox.showinfo("拆分成功", msg)
-            try:
-                os.startfile(output_dir)
-            except Exception:
-                pass
+            self._start_file_async(output_dir)
             self.status_message.set(f"拆分完成: {file_count}个文件")
 
-        self.root.after(0, _show)
+        self._post_ui(_show)
 
     # ----------------------------------------------------------
     # PDF 页面重排 / 旋转 / 倒序
     # ----------------------------------------------------------
 
     def _do_convert_reorder(self):
-        converter = PDFReorderConverter(
-            on_progress=self._simple_progress_callback
-        )
+        files_snapshot = tuple(self.selected_files_list)
+        converter = self._get_converter("PDFReorderConverter")
 
-        self.root.after(0, lambda: self.progress_bar.config(
-            mode='determinate', maximum=100, value=0))
-        self.start_time = time.time()
+        self._begin_determinate_progress()
 
-        input_file = self.selected_files_list[0]
+        input_file = files_snapshot[0]
         mode_text = self.reorder_mode_var.get()
-        mode_map = {
-            "页面重排": "reorder",
-            "页面旋转": "rotate",
-            "页面倒序": "reverse",
-        }
-        mode = mode_map.get(mode_text, "reorder")
+        mode = REORDER_MODE_TO_KEY.get(mode_text, "reorder")
 
-        try:
-            rotate_angle = int(self.rotate_angle_var.get())
-        except Exception:
-            rotate_angle = 90
+        rotate_angle = _parse_int(self.rotate_angle_var.get(), 90)
 
         result = converter.convert(
             input_file=input_file,
@@ -5162,68 +5454,43 @@ class PDFConverterApp:
             rotate_angle=rotate_angle,
         )
 
-        self.history.add({
-            'function': f'PDF{mode_text}',
-            'input_files': [input_file],
-            'output': result.get('output_file', ''),
-            'success': result.get('success', False),
-            'message': result.get('message', ''),
-            'page_count': result.get('page_count', 0),
-        })
+        self._record_history(f'PDF{mode_text}', [input_file], result)
 
         if not result.get('success'):
-            self.root.after(0, lambda: messagebox.showerror(
-                f"{mode_text}失败", result.get('message', '未知错误')))
-            self.root.after(0, lambda: self.status_message.set(f"{mode_text}失败"))
+            self._post_error(f"{mode_text}失败", result.get('message', '未知错误'), f"{mode_text}失败")
             return
 
         output_file = result.get('output_file', '')
         page_count = result.get('page_count', 0)
 
+        msg = (f"{mode_text}完成！\n\n"
+               f"处理页数：{page_count}\n\n"
+               f"保存位置：\n{output_file}\n\n"
+               f"是否打开文件所在文件夹？")
+
         def _show():
-            msg = (f"{mode_text}完成！\n\n"
-                   f"处理页数：{page_count}\n\n"
-                   f"保存位置：\n{output_file}\n\n"
-                   f"是否打开文件所在文件夹？")
             if messagebox.askyesno(f"{mode_text}完成", msg):
                 self.open_folder(output_file)
             self.status_message.set(f"{mode_text}完成")
 
-        self.root.after(0, _show)
+        self._post_ui(_show)
 
     # ----------------------------------------------------------
     # PDF 添加/移除书签
     # ----------------------------------------------------------
 
     def _do_convert_bookmark(self):
-        converter = PDFBookmarkConverter(
-            on_progress=self._simple_progress_callback
-        )
+        files_snapshot = tuple(self.selected_files_list)
+        converter = self._get_converter("PDFBookmarkConverter")
 
-        self.root.after(0, lambda: self.progress_bar.config(
-            mode='determinate', maximum=100, value=0))
-        self.start_time = time.time()
+        self._begin_determinate_progress()
 
-        input_file = self.selected_files_list[0]
+        input_file = files_snapshot[0]
         mode_text = self.bookmark_mode_var.get().strip()
-        mode_map = {
-            "添加书签": "add",
-            "移除书签": "remove",
-            "导入JSON": "import_json",
-            "导出JSON": "export_json",
-            "清空书签": "clear",
-            "自动生成": "auto",
-        }
-        mode = mode_map.get(mode_text, "add")
+        mode = BOOKMARK_MODE_TO_KEY.get(mode_text, "add")
 
-        try:
-            level_i = int(self.bookmark_level_var.get().strip() or "1")
-        except Exception:
-            level_i = 1
-        try:
-            page_i = int(self.bookmark_page_var.get().strip() or "1")
-        except Exception:
-            page_i = 1
+        level_i = _parse_int(self.bookmark_level_var.get(), 1)
+        page_i = _parse_int(self.bookmark_page_var.get(), 1)
 
         result = converter.convert(
             input_file=input_file,
@@ -5239,134 +5506,103 @@ class PDFConverterApp:
         )
 
         output_ref = result.get('output_file', '') or result.get('output_json', '')
-        self.history.add({
-            'function': f'PDF书签-{mode_text}',
-            'input_files': [input_file],
-            'output': output_ref,
-            'success': result.get('success', False),
-            'message': result.get('message', ''),
-            'page_count': result.get('bookmark_count', 0),
-        })
+        self._record_history(
+            f'PDF书签-{mode_text}',
+            [input_file],
+            result,
+            output=output_ref,
+            page_count=result.get('bookmark_count', 0),
+        )
 
         if not result.get('success'):
-            self.root.after(0, lambda: messagebox.showerror(
-                f"{mode_text}失败", result.get('message', '未知错误')))
-            self.root.after(0, lambda: self.status_message.set(f"{mode_text}失败"))
+            self._post_error(f"{mode_text}失败", result.get('message', '未知错误'), f"{mode_text}失败")
             return
 
         output_pdf = result.get('output_file', '')
         output_json = result.get('output_json', '')
+        message = result.get('message', '书签处理完成')
+
+        msg = f"{message}\n\n"
+        if output_pdf:
+            msg += f"输出PDF：\n{output_pdf}\n\n"
+        if output_json:
+            msg += f"输出JSON：\n{output_json}\n\n"
+        msg += "是否打开输出所在文件夹？"
+
+        open_target = output_pdf or output_json
 
         def _show():
-            msg = f"{result.get('message', '书签处理完成')}\n\n"
-            if output_pdf:
-                msg += f"输出PDF：\n{output_pdf}\n\n"
-            if output_json:
-                msg += f"输出JSON：\n{output_json}\n\n"
-            msg += "是否打开输出所在文件夹？"
-
-            open_target = output_pdf or output_json
             if messagebox.askyesno(f"{mode_text}完成", msg) and open_target:
                 self.open_folder(open_target)
             self.status_message.set(f"{mode_text}完成")
 
-        self.root.after(0, _show)
+        self._post_ui(_show)
 
     # ----------------------------------------------------------
     # 图片 → PDF
     # ----------------------------------------------------------
 
     def _do_convert_img2pdf(self):
-        converter = ImageToPDFConverter(
-            on_progress=self._simple_progress_callback
-        )
+        files_snapshot = tuple(self.selected_files_list)
+        converter = self._get_converter("ImageToPDFConverter")
 
-        self.root.after(0, lambda: self.progress_bar.config(
-            mode='determinate', maximum=100, value=0))
-        self.start_time = time.time()
+        self._begin_determinate_progress()
 
         result = converter.convert(
-            files=self.selected_files_list,
+            files=files_snapshot,
             page_size=self.page_size_var.get(),
         )
 
         # 记录历史
-        self.history.add({
-            'function': '图片转PDF',
-            'input_files': list(self.selected_files_list),
-            'output': result.get('output_file', ''),
-            'success': result['success'],
-            'message': result.get('message', ''),
-            'page_count': result.get('page_count', 0),
-        })
+        self._record_history('图片转PDF', files_snapshot, result)
 
         if not result['success']:
-            self.root.after(0, lambda: messagebox.showerror(
-                "转换失败", result['message']))
-            self.root.after(0, lambda: self.status_message.set("转换失败"))
+            self._post_error("转换失败", result['message'], "转换失败")
             return
 
         output_file = result['output_file']
         page_count = result['page_count']
 
+        msg = (f"图片转PDF成功！\n\n"
+               f"共 {page_count} 张图片\n\n"
+               f"保存位置：\n{output_file}\n\n"
+               f"是否打开文件所在文件夹？")
+
         def _show():
-            msg = (f"图片转PDF成功！\n\n"
-                   f"共 {page_count} 张图片\n\n"
-                   f"保存位置：\n{output_file}\n\n"
-                   f"是否打开文件所在文件夹？")
             if messagebox.askyesno("转换成功", msg):
                 self.open_folder(output_file)
             self.status_message.set(f"转换完成: {page_count}张图片")
 
-        self.root.after(0, _show)
+        self._post_ui(_show)
 
     # ----------------------------------------------------------
     # PDF 加水印
     # ----------------------------------------------------------
 
     def _do_convert_watermark(self):
-        converter = PDFWatermarkConverter(
-            on_progress=self._simple_progress_callback
-        )
+        files_snapshot = tuple(self.selected_files_list)
+        converter = self._get_converter("PDFWatermarkConverter")
 
-        self.root.after(0, lambda: self.progress_bar.config(
-            mode='determinate', maximum=100, value=0))
-        self.start_time = time.time()
+        self._begin_determinate_progress()
 
         position, layout = self._resolve_watermark_mode(self.watermark_position_var.get())
 
-        try:
-            opacity = float(self.watermark_opacity_var.get())
-        except (ValueError, TypeError):
-            opacity = 0.3
+        opacity = _parse_float(self.watermark_opacity_var.get(), 0.3)
 
-        try:
-            font_size = int(self.watermark_fontsize_var.get())
-        except (ValueError, TypeError):
-            font_size = 40
-        try:
-            size_scale = float(self.watermark_size_scale_var.get())
-        except (ValueError, TypeError):
+        font_size = _parse_int(self.watermark_fontsize, 40)
+        size_scale = _parse_float(self.watermark_size_scale)
+        if size_scale is None:
             size_scale = max(0.2, min(3.0, float(font_size) / 40.0))
 
-        try:
-            rotation = int(self.watermark_rotation_var.get())
-        except (ValueError, TypeError):
-            rotation = 45
-        try:
-            random_strength = float(self.watermark_random_strength_var.get())
-        except (ValueError, TypeError):
-            random_strength = 0.35
-        try:
-            spacing_scale = float(self.watermark_spacing_var.get())
-        except (ValueError, TypeError):
-            spacing_scale = 1.0
+        rotation = _parse_int(self.watermark_rotation, 45)
+        random_strength = _parse_float(self.watermark_random_strength, 0.35)
+        spacing_scale = _parse_float(self.watermark_spacing, 1.0)
         random_strength = self._clamp_value(random_strength, 0.0, 1.0, 0.35)
         spacing_scale = self._clamp_value(spacing_scale, 0.5, 2.0, 1.0)
-        random_size = bool(self.watermark_random_size_var.get())
+        random_size = bool(self.watermark_random_size)
 
         result = converter.convert(
-            input_file=self.selected_files_list[0],
+            input_file=files_snapshot[0],
             watermark_text=self.watermark_text_var.get().strip() or None,
             watermark_image=self.watermark_image_path,
             opacity=opacity,
@@ -5382,111 +5618,89 @@ class PDFConverterApp:
         )
 
         # 记录历史
-        self.history.add({
-            'function': 'PDF加水印',
-            'input_files': list(self.selected_files_list),
-            'output': result.get('output_file', ''),
-            'success': result['success'],
-            'message': result.get('message', ''),
-            'page_count': result.get('page_count', 0),
-        })
+        self._record_history('PDF加水印', files_snapshot, result)
 
         if not result['success']:
-            self.root.after(0, lambda: messagebox.showerror(
-                "水印失败", result['message']))
-            self.root.after(0, lambda: self.status_message.set("添加水印失败"))
+            self._post_error("水印失败", result['message'], "添加水印失败")
             return
 
         output_file = result['output_file']
         page_count = result['page_count']
 
+        msg = (f"水印添加成功！\n\n"
+               f"共 {page_count} 页\n\n"
+               f"保存位置：\n{output_file}\n\n"
+               f"是否打开文件所在文件夹？")
+
         def _show():
-            msg = (f"水印添加成功！\n\n"
-                   f"共 {page_count} 页\n\n"
-                   f"保存位置：\n{output_file}\n\n"
-                   f"是否打开文件所在文件夹？")
             if messagebox.askyesno("水印成功", msg):
                 self.open_folder(output_file)
             self.status_message.set(f"水印完成: {page_count}页")
 
-        self.root.after(0, _show)
+        self._post_ui(_show)
 
     # ----------------------------------------------------------
     # PDF 加密/解密
     # ----------------------------------------------------------
 
     def _do_convert_encrypt(self):
-        converter = PDFEncryptConverter(
-            on_progress=self._simple_progress_callback
-        )
+        files_snapshot = tuple(self.selected_files_list)
+        converter = self._get_converter("PDFEncryptConverter")
 
-        self.root.after(0, lambda: self.progress_bar.config(
-            mode='determinate', maximum=100, value=0))
-        self.start_time = time.time()
-
-        mode = self.encrypt_mode_var.get()
-        input_file = self.selected_files_list[0]
-
-        if mode == "加密":
-            result = converter.encrypt(
-                input_file=input_file,
-                user_password=self.user_password_var.get(),
-                owner_password=self.owner_password_var.get(),
-                allow_print=self.allow_print_var.get(),
-                allow_copy=self.allow_copy_var.get(),
-                allow_modify=self.allow_modify_var.get(),
-                allow_annotate=self.allow_annotate_var.get(),
-            )
-            func_name = 'PDF加密'
-        else:
-            result = converter.decrypt(
-                input_file=input_file,
-                password=self.user_password_var.get(),
-            )
-            func_name = 'PDF解密'
+        self._begin_determinate_progress()
+
+        method_name, kwargs_name, func_name = ENCRYPT_ACTIONS.get(
+            self.encrypt_mode_var.get(), ENCRYPT_ACTIONS["解密"])
+        result = getattr(converter, method_name)(
+            input_file=files_snapshot[0],
+            **getattr(self, kwargs_name)(),
+        )
 
         # 记录历史
-        self.history.add({
-            'function': func_name,
-            'input_files': list(self.selected_files_list),
-            'output': result.get('output_file', ''),
-            'success': result['success'],
-            'message': result.get('message', ''),
-            'page_count': result.get('page_count', 0),
-        })
+        self._record_history(func_name, files_snapshot, result)
 
         if not result['success']:
-            self.root.after(0, lambda: messagebox.showerror(
-                f"{func_name}失败", result['message']))
-            self.root.after(0, lambda: self.status_message.set(f"{func_name}失败"))
+            self._post_error(f"{func_name}失败", result['message'], f"{func_name}失败")
             return
 
         output_file = result['output_file']
+        message = result['message']
+
+        msg = (f"{message}\n\n"
+               f"保存位置：\n{output_file}\n\n"
+               f"是否打开文件所在文件夹？")
 
         def _show():
-            msg = (f"{result['message']}\n\n"
-                   f"保存位置：\n{output_file}\n\n"
-                   f"是否打开文件所在文件夹？")
             if messagebox.askyesno(f"{func_name}成功", msg):
                 self.open_folder(output_file)
             self.status_message.set(f"{func_name}完成")
 
-        self.root.after(0, _show)
+        self._post_ui(_show)
+
+    def _encrypt_kwargs(self):
+        return {
+            'user_password': self.user_password_var.get(),
+            'owner_password': self.owner_password_var.get(),
+            'allow_print': self.allow_print_var.get(),
+            'allow_copy': self.allow_copy_var.get(),
+            'allow_modify': self.allow_modify_var.get(),
+            'allow_annotate': self.allow_annotate_var.get(),
+        }
+
+    def _decrypt_kwargs(self):
+        return {'password': self.user_password_var.get()}
 
     # ----------------------------------------------------------
     # PDF 压缩
     # ----------------------------------------------------------
 
     def _do_convert_compress(self):
-        converter = PDFCompressConverter(
-            on_progress=self._simple_progress_callback
-        )
+        files_snapshot = tuple(self.selected_files_list)
+        converter = self._get_converter("PDFCompressConverter")
 
-        self.root.after(0, lambda: self.progress_bar.config(
-            mode='determinate', maximum=100, value=0))
-        self.start_time = time.time()
+        self._begin_determinate_progress()
 
-        input_file = self.selected_files_list[0]
+        input_file = files_snapshot[0]
         compress_level = self.compress_level_var.get()
 
         result = converter.convert(
@@ -5495,53 +5709,42 @@ class PDFConverterApp:
         )
 
         # 记录历史
-        self.history.add({
-            'function': 'PDF压缩',
-            'input_files': list(self.selected_files_list),
-            'output': result.get('output_file', ''),
-            'success': result['success'],
-            'message': result.get('message', ''),
-            'page_count': result.get('page_count', 0),
-        })
+        self._record_history('PDF压缩', files_snapshot, result)
 
         if not result['success']:
-            self.root.after(0, lambda: messagebox.showerror(
-                "PDF压缩失败", result['message']))
-            self.root.after(0, lambda: self.status_message.set("压缩失败"))
+            self._post_error("PDF压缩失败", result['message'], "压缩失败")
             return
 
         output_file = result['output_file']
+        message = result['message']
+
+        msg = (f"{message}\n\n"
+               f"保存位置：\n{output_file}\n\n"
+               f"是否打开文件所在文件夹？")
 
         def _show():
-            msg = (f"{result['message']}\n\n"
-                   f"保存位置：\n{output_file}\n\n"
-                   f"是否打开文件所在文件夹？")
             if messagebox.askyesno("PDF压缩完成", msg):
                 self.open_folder(output_file)
             self.status_message.set("压缩完成")
 
-        self.root.after(0, _show)
+        self._post_ui(_show)
 
     def _on_compress_level_changed(self):
         """压缩级别切换时更新说明文字"""
-        level = self.compress_level_var.get()
-        preset = COMPRESS_PRESETS.get(level, {})
-        self.compress_hint_var.set(preset.get('description', ''))
+        self.compress_hint_var.set(
+            COMPRESS_DESCRIPTIONS.get(self.compress_level_var.get(), ''))
 
     # ----------------------------------------------------------
     # PDF 提取/删页
     # ----------------------------------------------------------
 
     def _do_convert_extract(self):
-        converter = PDFExtractConverter(
-            on_progress=self._simple_progress_callback
-        )
+        files_snapshot = tuple(self.selected_files_list)
+        converter = self._get_converter("PDFExtractConverter")
 
-        self.root.after(0, lambda: self.progress_bar.config(
-            mode='determinate', maximum=100, value=0))
-        self.start_time = time.time()
+        self._begin_determinate_progress()
 
-        input_file = self.selected_files_list[0]
+        input_file = files_snapshot[0]
         mode = self.extract_mode_var.get()
         pages_str = self.extract_pages_var.get()
 
@@ -5554,47 +5757,42 @@ class PDFConverterApp:
         func_name = f'PDF{mode}页面'
 
         # 记录历史
-        self.history.add({
-            'function': func_name,
-            'input_files': list(self.selected_files_list),
-            'output': result.get('output_file', ''),
-            'success': result['success'],
-            'message': result.get('message', ''),
-            'page_count': result.get('result_pages', 0),
-        })
+        self._record_history(
+            func_name,
+            files_snapshot,
+            result,
+            page_count=result.get('result_pages', 0),
+        )
 
         if not result['success']:
-            self.root.after(0, lambda: messagebox.showerror(
-                f"{func_name}失败", result['message']))
-            self.root.after(0, lambda: self.status_message.set(f"{func_name}失败"))
+            self._post_error(f"{func_name}失败", result['message'], f"{func_name}失败")
             return
 
         output_file = result['output_file']
+        message = result['message']
+
+        msg = (f"{message}\n\n"
+               f"保存位置：\n{output_file}\n\n"
+               f"是否打开文件所在文件夹？")
 
         def _show():
-            msg = (f"{result['message']}\n\n"
-                   f"保存位置：\n{output_file}\n\n"
-                   f"是否打开文件所在文件夹？")
             if messagebox.askyesno(f"{func_name}完成", msg):
                 self.open_folder(output_file)
             self.status_message.set(f"{func_name}完成")
 
-        self.root.after(0, _show)
+        self._post_ui(_show)
 
     # ----------------------------------------------------------
     # OCR可搜索PDF
     # ----------------------------------------------------------
 
     def _do_convert_ocr(self):
-        converter = PDFOCRConverter(
-            on_progress=self._simple_progress_callback
-        )
+        files_snapshot = tuple(self.selected_files_list)
+        converter = self._get_converter("PDFOCRConverter")
 
-        self.root.after(0, lambda: self.progress_bar.config(
-            mode='determinate', maximum=100, value=0))
-        self.start_time = time.time()
+        self._begin_determinate_progress()
 
-        input_file = self.selected_files_list[0]
+        input_file = files_snapshot[0]
         start_page, end_page = self._parse_page_range_for_converter()
 
         # _parse_page_range_for_converter 返回 (0-based start, end)
@@ -5606,38 +5804,31 @@ class PDFConverterApp:
             input_file=input_file,
             api_key=self.baidu_api_key,
             secret_key=self.baidu_secret_key,
-            ocr_mode=self.ocr_quality_mode_var.get(),
+            ocr_mode=self.ocr_quality_mode,
             start_page=ocr_start,
             end_page=ocr_end,
         )
 
         # 记录历史
-        self.history.add({
-            'function': 'OCR可搜索PDF',
-            'input_files': list(self.selected_files_list),
-            'output': result.get('output_file', ''),
-            'success': result['success'],
-            'message': result.get('message', ''),
-            'page_count': result.get('page_count', 0),
-        })
+        self._record_history('OCR可搜索PDF', files_snapshot, result)
 
         if not result['success']:
-            self.root.after(0, lambda: messagebox.showerror(
-                "OCR失败", result['message']))
-            self.root.after(0, lambda: self.status_message.set("OCR失败"))
+            self._post_error("OCR失败", result['message'], "OCR失败")
             return
 
         output_file = result['output_file']
+        message = result['message']
+
+        msg = (f"{message}\n\n"
+               f"保存位置：\n{output_file}\n\n"
+               f"是否打开文件所在文件夹？")
 
         def _show():
-            msg = (f"{result['message']}\n\n"
-                   f"保存位置：\n{output_file}\n\n"
-                   f"是否打开文件所在文件夹？")
             if messagebox.askyesno("OCR完成", msg):
                 self.open_folder(output_file)
             self.status_message.set("OCR可搜索PDF完成")
 
-        self.root.after(0, _show)
+        self._post_ui(_show)
 
     # ----------------------------------------------------------
     # PDF转Excel
@@ -5645,20 +5836,16 @@ class PDFConverterApp:
 
     def _on_excel_strategy_changed(self):
         """Excel提取策略切换时更新说明文字"""
-        strategy = self.excel_strategy_var.get()
-        info = TABLE_STRATEGIES.get(strategy, {})
-        self.excel_hint_var.set(info.get('description', ''))
+        self.excel_hint_var.set(
+            TABLE_STRATEGY_DESCRIPTIONS.get(self.excel_strategy_var.get(), ''))
 
     def _do_convert_excel(self):
-        converter = PDFToExcelConverter(
-            on_progress=self._simple_progress_callback
-        )
+        files_snapshot = tuple(self.selected_files_list)
+        converter = self._get_converter("PDFToExcelConverter")
 
-        self.root.after(0, lambda: self.progress_bar.config(
-            mode='determinate', maximum=100, value=0))
-        self.start_time = time.time()
+        self._begin_determinate_progress()
 
-        input_file = self.selected_files_list[0]
+        input_file = files_snapshot[0]
         start_page, end_page = self._parse_page_range_for_converter()
 
         # _parse_page_range_for_converter 返回 (0-based start, end_page 1-based)
@@ -5677,121 +5864,178 @@ class PDFConverterApp:
             strategy=strategy,
             merge_sheets=merge_sheets,
             extract_mode=extract_mode,
-            ocr_mode=self.ocr_quality_mode_var.get(),
+            ocr_mode=self.ocr_quality_mode,
             api_key=self.baidu_api_key,
             secret_key=self.baidu_secret_key,
         )
 
         # 记录历史
-        self.history.add({
-            'function': 'PDF转Excel',
-            'input_files': list(self.selected_files_list),
-            'output': result.get('output_file', ''),
-            'success': result['success'],
-            'message': result.get('message', ''),
-            'page_count': result.get('table_count', 0),
-        })
+        self._record_history(
+            'PDF转Excel',
+            files_snapshot,
+            result,
+            page_count=result.get('table_count', 0),
+        )
 
         if not result['success']:
-            self.root.after(0, lambda: messagebox.showerror(
-                "提取失败", result['message']))
-            self.root.after(0, lambda: self.status_message.set("PDF转Excel失败"))
+            self._post_error("提取失败", result['message'], "PDF转Excel失败")
             return
 
         output_file = result['output_file']
+        message = result['message']
+
+        msg = (f"{message}\n\n"
+               f"保存位置：\n{output_file}\n\n"
+               f"是否打开文件所在文件夹？")
 
         def _show():
-            msg = (f"{result['message']}\n\n"
-                   f"保存位置：\n{output_file}\n\n"
-                   f"是否打开文件所在文件夹？")
             if messagebox.askyesno("PDF转Excel完成", msg):
                 self.open_folder(output_file)
             self.status_message.set("PDF转Excel完成")
 
-        self.root.after(0, _show)
+        self._post_ui(_show)
 
     # ==========================================================
     # 进度回调
     # ==========================================================
 
+    def _post_ui(self, func):
+        """从工作线程投递一次性UI调用，与进度更新按提交顺序执行"""
+        self._ui_queue.append(('call', func))
+
+    def _get_converter(self, name):
+        """按类名缓存转换器实例，重复转换时复用（转换任务在同一工作线程中串行执行）"""
+        converter = self._converter_cache.get(name)
+        if converter is None:
+            converter = self._converter_cache[name] = _load_converter(name)(
+                on_progress=self._simple_progress_callback)
+        return converter
+
+    def _begin_determinate_progress(self):
+        """转换开始：进度条切回确定模式并清零，记录开始时间（用于预计剩余）"""
+        self._post_ui(lambda: self.progress_bar.config(
+            mode='determinate', maximum=100, value=0))
+        self.start_time = time.monotonic()
+
+    def _record_history(self, function, input_files, result, output=None, page_count=None):
+        """按统一格式写入转换历史；output/page_count 缺省取结果中的 output_file/page_count"""
+        self.history.add({
+            'function': function,
+            'input_files': input_files,
+            'output': result.get('output_file', '') if output is None else output,
+            'success': result.get('success', False),
+            'message': result.get('message', ''),
+            'page_count': result.get('page_count', 0) if page_count is None else page_count,
+        })
+
+    def _post_error(self, title, message, status=None):
+        """投递错误弹窗（及状态栏文字），合并为一次UI调用；参数在工作线程中即时求值"""
+        def _show():
+            messagebox.showerror(title, message)
+            if status is not None:
+                self.status_message.set(status)
+        self._ui_queue.append(('call', _show))
+
+    def _ui_pump(self):
+        """UI线程定时取出队列：同一帧内的进度/文字/状态只应用最后一次"""
+        pending = {}
+        try:
+            while True:
+                kind, payload = self._ui_queue.popleft()
+                if kind == 'call':
+                    self._apply_ui_updates(pending)
+                    pending = {}
+                    try:
+                        payload()
+                    except Exception as e:
+                        logging.error(f"UI回调异常: {e}", exc_info=True)
+                else:
+                    pending[kind] = payload
+        except IndexError:
+            pass
+        self._apply_ui_updates(pending)
+        delay = self.UI_PUMP_ACTIVE_MS if self.conversion_active else self.UI_PUMP_IDLE_MS
+        self.root.after(delay, self._ui_pump)
+
+    def _apply_ui_updates(self, pending):
+        if 'prog' in pending:
+            self.progress_bar['value'] = pending['prog']
+        if 'text' in pending:
+            self.set_progress_text(pending['text'])
+        if 'status' in pending:
+            self.apply_status_text()
+
     def _simple_progress_callback(self, percent, progress_text, status_text):
         """通用进度回调（线程安全）— 供 converters 使用"""
-        if percent >= 0:
-            self.root.after(0, lambda: self.progress_bar.config(value=percent))
-        if progress_text:
-            self.root.after(0, lambda t=progress_text: self.set_progress_text(t))
-        if status_text:
-            with self._state_lock:
-                self.base_status_text = status_text
-            self.root.after(0, self.apply_status_text)
+        if percent >= 0 and percent != self._last_percent:
+            self._last_percent = percent
+            self._ui_queue.append(('prog', percent))
+        if progress_text and progress_text != self._last_progress_text:
+            self._last_progress_text = progress_text
+            self._ui_queue.append(('text', progress_text))
+        if status_text and status_text != self._last_status_text:
+            self._last_status_text = status_text
+            self._status_state = (status_text, self._status_state[1])
+            self._ui_queue.append(('status', None))
 
     def update_progress(self, phase, current, total, page_id):
         """pdf2docx ProgressConverter 的详细进度回调"""
         if total <= 0:
             return
+        # 以下各分支都会改写状态文字，使通用回调的去重基准失效
+        self._last_status_text = None
 
         total_steps = total * 2
+        phase_text = PROGRESS_PHASE_TEXT.get(phase, "生成")
         if phase in ('start-parse', 'start-make'):
-            phase_text = "解析" if phase == 'start-parse' else "生成"
             self.current_phase = phase_text
             self.current_page_id = page_id
             self.current_page_index = current
             self.current_page_total = total
-            self.page_start_time = time.time()
-            with self._state_lock:
-                self.base_status_text = f"正在{phase_text}第 {page_id} 页，共 {total} 页"
-            self.root.after(0, self.apply_status_text)
+            self.page_start_time = time.monotonic()
+            self._status_state = (PAGE_STATUS_FORMATS[phase_text](page_id, total),
+                                  self._status_state[1])
+            self._ui_queue.append(('status', None))
             return
 
         if phase in ('skip-parse', 'skip-make'):
-            phase_text = "解析" if phase == 'skip-parse' else "生成"
-            with self._state_lock:
-                self.base_status_text = f"第 {page_id} 页{phase_text}失败，已跳过"
-            self.root.after(0, self.apply_status_text)
+            self._status_state = (f"第 {page_id} 页{phase_text}失败，已跳过",
+                                  self._status_state[1])
+            self._ui_queue.append(('status', None))
             return
 
-        if phase == 'parse':
-            completed_steps = current
-            percent = int(round((completed_steps / total_steps) * 100))
-            phase_text = "解析"
-        else:
-            completed_steps = total + current
-            percent = int(round((completed_steps / total_steps) * 100))
-            phase_text = "生成"
+        completed_steps = current if phase == 'parse' else total + current
+        # 整数运算四舍五入，避免每次回调的浮点除法
+        percent = (completed_steps * 200 + total_steps) // (total_steps * 2)
 
         page_text = self.format_page_text(phase_text, current, total, page_id)
-        with self._state_lock:
-            self.base_status_text = f"正在{phase_text}第 {page_id} 页，共 {total} 页"
 
         eta_text = ""
         if self.start_time and completed_steps > 0:
-            elapsed = time.time() - self.start_time
+            elapsed = time.monotonic() - self.start_time
             remaining = max(total_steps - completed_steps, 0)
             eta_seconds = int(round(elapsed * remaining / completed_steps))
             eta_text = f"，预计剩余 {self.format_eta(eta_seconds)}"
-        with self._state_lock:
-            self.current_eta_text = eta_text
-
-        def _apply():
-            self.progress_bar.config(mode='determinate', maximum=100)
-            self.progress_bar['value'] = percent
-            self.set_progress_text(f"{page_text} ({percent}%)")
-            self.apply_status_text()
+        self._status_state = (PAGE_STATUS_FORMATS[phase_text](page_id, total), eta_text)
 
-        self.root.after(0, _apply)
+        self._last_percent = percent
+        self._last_progress_text = None
+        self._ui_queue.append(('prog', percent))
+        self._ui_queue.append(('text', f"{page_text} ({percent}%)"))
+        self._ui_queue.append(('status', None))
 
     def apply_status_text(self):
-        with self._state_lock:
-            text = self.base_status_text or ""
-            eta = self.current_eta_text
+        text, eta = self._status_state
+        text = text or ""
         if eta:
             text += eta
         if self.page_start_time:
-            elapsed = int(time.time() - self.page_start_time)
+            elapsed = int(time.monotonic() - self.page_start_time)
             text += f"，当前页耗时 {self.format_eta(elapsed)}"
             if elapsed >= self.page_timeout_seconds:
                 text += "，该页复杂请耐心等待"
-        if text:
+        # 文字未变时不写变量，避免触发 trace 与状态栏重绘
+        if text and text != self._status_shown:
             self.status_message.set(text)
 
     def format_page_text(self, phase_text, current, total, page_id):
@@ -5827,7 +6071,9 @@ class PDFConverterApp:
             self.page_timer_job = None
 
     def refresh_page_timer(self):
-        self.apply_status_text()
+        # 状态/ETA 变化已由进度队列即时应用，定时器只负责刷新“当前页耗时”
+        if self.page_start_time:
+            self.apply_status_text()
         if self.conversion_active:
             self.page_timer_job = self.root.after(1000, self.refresh_page_timer)
         else:
@@ -5859,10 +6105,8 @@ class PDFConverterApp:
             raise RuntimeError("requests库未安装")
         if not self.baidu_api_key or not self.baidu_secret_key:
             raise RuntimeError("百度OCR API未配置")
-        if self._baidu_client is None:
-            self._baidu_client = BaiduOCRClient(
-                self.baidu_api_key, self.baidu_secret_key)
-        return self._baidu_client
+        # 与转换器共用同一客户端；修改 Key 后自然按新 Key 取到新客户端
+        return get_shared_client(self.baidu_api_key, self.baidu_secret_key)
 
     # ==========================================================
     # 背景图片
@@ -5876,15 +6120,14 @@ class PDFConverterApp:
         )
         if not filename:
             return
-        if not PIL_AVAILABLE:
+        if not _load_pil():
             messagebox.showerror(
                 "错误", "Pillow库未安装，无法加载图片背景。\n请运行: pip install Pillow")
             return
         try:
-            app_dir = get_app_dir()
             ext = os.path.splitext(filename)[1].lower() or ".png"
-            target = os.path.join(app_dir, f"background{ext}")
-            shutil.copyfile(filename, target)
+            target = os.path.join(self._app_dir, f"background{ext}")
+            copy_file_fast(filename, target)
             self.bg_image_path = target
             self.apply_background_image()
             self.save_settings()
@@ -5895,6 +6138,8 @@ class PDFConverterApp:
         self.bg_image_path = None
         self.bg_image = None
         self.bg_pil = None
+        self._bg_source = None
+        self._bg_key = None
 
         if self.bg_label is not None:
             try:
@@ -5910,26 +6155,56 @@ class PDFConverterApp:
                 pass
             self.panel_image_id = None
         self.panel_image = None
+        self._panel_last_key = None
 
         self.save_settings()
         self.status_message.set("背景已清除")
 
-    def apply_background_image(self):
-        if not PIL_AVAILABLE:
+    def apply_background_image(self, width=None, height=None, draft=False):
+        """按窗口尺寸铺设背景图；width/height 由 <Configure> 事件传入，缺省时查询窗口。
+
+        draft=True 时用快速插值生成草图，随后由 on_root_resize 安排的精细版本替换。
+        """
+        if not _load_pil():
             return
         if not self.bg_image_path or not os.path.exists(self.bg_image_path):
             return
         try:
-            img = Image.open(self.bg_image_path)
-            width = self.root.winfo_width()
-            height = self.root.winfo_height()
-            if width <= 1 or height <= 1:
-                self.root.update_idletasks()
+            path = self.bg_image_path
+            mtime_ns = os.stat(path).st_mtime_ns
+            if not width or not height or width <= 1 or height <= 1:
                 width = self.root.winfo_width()
                 height = self.root.winfo_height()
-            img = img.resize((width, height), Image.LANCZOS).convert("RGB")
+                if width <= 1 or height <= 1:
+                    self.root.update_idletasks()
+                    width = self.root.winfo_width()
+                    height = self.root.winfo_height()
+            key = (path, mtime_ns, width, height)
+            if (self.bg_pil is not None and self.bg_label is not None
+                    and self._bg_key == key and (draft or not self._bg_draft)):
+                return  # 图片与尺寸均未变，沿用已缩放的背景
+            img = self._load_cached_background(key)
+            from_cache = img is not None
+            if img is None:
+                source = self._bg_source
+                if source is None or source[0] != path or source[1] != mtime_ns:
+                    with Image.open(path) as src:
+                        source = (path, mtime_ns, src.convert("RGB"), None)
+                    self._bg_source = source
+                base = self._background_draft_base() if draft else source[2]
+                img = _resize_background(base, (width, height), draft=draft)
+                if not draft:
+                    self._store_cached_background(key, img)
             self.bg_pil = img
-            self.bg_image = ImageTk.PhotoImage(img)
+            self._bg_key = key
+            self._bg_draft = draft and not from_cache
+            self._panel_last_key = None
+            photo = self.bg_image
+            if photo is not None and (photo.width(), photo.height()) == img.size:
+                # 尺寸相同（如草图→精细图）时原地粘贴，免去重建 Tk 图像
+                photo.paste(img)
+            else:
+                self.bg_image = ImageTk.PhotoImage(img)
             if self.bg_label is None:
                 self.bg_label = tk.Label(self.root, image=self.bg_image)
                 self.bg_label.place(x=0, y=0, relwidth=1, relheight=1)
@@ -5940,24 +6215,78 @@ class PDFConverterApp:
         except Exception as e:
             messagebox.showerror("错误", f"背景图片加载失败：\n{str(e)}")
 
+    def _background_draft_base(self):
+        """拖动缩放用的底图：原图按屏幕尺寸 thumbnail 一次后缓存，草图都从这张较小的图缩放"""
+        path, mtime_ns, full, proxy = self._bg_source
+        if proxy is None:
+            proxy = full.copy()
+            proxy.thumbnail((self.root.winfo_screenwidth(), self.root.winfo_screenheight()),
+                            Image.BILINEAR)
+            self._bg_source = (path, mtime_ns, full, proxy)
+        return proxy
+
+    def _background_cache_path(self, key):
+        digest = hashlib.blake2b("|".join(map(str, key)).encode("utf-8"), digest_size=8).hexdigest()
+        return os.path.join(self._cache_dir, f"bg_{digest}.png")
+
+    def _load_cached_background(self, key):
+        """读取磁盘上已按窗口尺寸缩放好的背景图（键: 路径/修改时间/宽高），没有则返回 None"""
+        cache_path = self._background_cache_path(key)
+        if not os.path.exists(cache_path):
+            return None
+        try:
+            with Image.open(cache_path) as cached:
+                img = cached.convert("RGB")
+        except Exception:
+            return None
+        return img if img.size == key[2:] else None
+
+    def _store_cached_background(self, key, img):
+        """保存缩放后的背景图供下次启动直接使用，只保留最新一份"""
+        cache_path = self._background_cache_path(key)
+        cache_dir = os.path.dirname(cache_path)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            img.save(cache_path, "PNG", compress_level=1)
+            for name in os.listdir(cache_dir):
+                if name.startswith("bg_") and name.endswith(".png"):
+                    stale = os.path.join(cache_dir, name)
+                    if stale != cache_path:
+                        os.remove(stale)
+        except Exception as e:
+            logging.debug(f"背景缓存写入失败: {e}")
+
     def on_root_resize(self, event):
-        if not self.bg_image_path:
+        # 子控件的 <Configure> 也会冒泡到窗口绑定，只处理窗口自身尺寸变化
+        if event.widget is not self.root or not self.bg_image_path:
             return
-        if self.resize_job is not None:
-            try:
-                self.root.after_cancel(self.resize_job)
-            except Exception:
-                pass
-        self.resize_job = self.root.after(200, self.apply_background_image)
+        for job in (self.resize_job, self._bg_refine_job):
+            if job is not None:
+                try:
+                    self.root.after_cancel(job)
+                except Exception:
+                    pass
+        # 拖动中 50ms 无新事件即铺快速草图；停止 300ms 后再换成精细缩放结果
+        w, h = event.width, event.height
+        self.resize_job = self.root.after(
+            50, lambda: self.apply_background_image(w, h, draft=True))
+        self._bg_refine_job = self.root.after(
+            300, lambda: self.apply_background_image(w, h))
 
     def on_panel_resize(self, event):
-        self.layout_canvas()
+        # 拖动时 <Configure> 连续触发，30ms 内只重排一次（届时按最新尺寸布局）
+        if self._resize_layout_job is None:
+            self._resize_layout_job = self.root.after(30, self._run_resize_layout)
         if self.panel_resize_job is not None:
             try:
                 self.root.after_cancel(self.panel_resize_job)
             except Exception:
                 pass
-        self.panel_resize_job = self.root.after(50, self.apply_panel_image)
+        self.panel_resize_job = self.root.after(120, self.apply_panel_image)
+
+    def _run_resize_layout(self):
+        self._resize_layout_job = None
+        self.layout_canvas()
 
     def refresh_layout(self):
         self.root.update_idletasks()
@@ -5965,7 +6294,7 @@ class PDFConverterApp:
         self.apply_panel_image()
 
     def apply_panel_image(self):
-        if not PIL_AVAILABLE:
+        if not _load_pil():
             return
         if not self.bg_pil or self.panel_canvas is None:
             return
@@ -5975,14 +6304,26 @@ class PDFConverterApp:
         panel_height = max(height - self.panel_padding * 2, 1)
         if self.bg_pil.size[0] != width or self.bg_pil.size[1] != height:
             return
+        opacity = max(0.2, min(1.0, self.panel_opacity_var.get() / 100.0))
+        panel_key = (panel_width, panel_height, round(opacity * 1000))
+        if panel_key == self._panel_last_key and self.panel_image_id is not None:
+            return
+        self._panel_last_key = panel_key
         left = self.panel_padding
         top = self.panel_padding
         right = left + panel_width
         bottom = top + panel_height
         panel_img = self.bg_pil.crop((left, top, right, bottom))
-        opacity = max(0.2, min(1.0, self.panel_opacity_var.get() / 100.0))
-        overlay = Image.new("RGB", panel_img.size, (255, 255, 255))
-        panel_img = Image.blend(overlay, panel_img, opacity)
+        if opacity < 0.999:
+            overlay = self._panel_overlay
+            if overlay is None or overlay.size != panel_img.size:
+                overlay = self._panel_overlay = Image.new("RGB", panel_img.size, (255, 255, 255))
+            panel_img = Image.blend(overlay, panel_img, opacity)
+        photo = self.panel_image
+        if (photo is not None and self.panel_image_id is not None
+                and (photo.width(), photo.height()) == panel_img.size):
+            photo.paste(panel_img)  # 仅透明度变化时原地更新
+            return
         self.panel_image = ImageTk.PhotoImage(panel_img)
         if self.panel_image_id is None:
             self.panel_image_id = self.panel_canvas.create_image(
@@ -5991,23 +6332,81 @@ class PDFConverterApp:
         else:
             self.panel_canvas.itemconfigure(
                 self.panel_image_id, image=self.panel_image)
-        self.panel_canvas.update_idletasks()
 
     # ==========================================================
     # 设置存取
     # ==========================================================
 
+    def _settings_file_key(self):
+        try:
+            st = os.stat(self.settings_path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _read_settings_file(self):
+        """读取 settings.json；文件未变化（mtime/大小相同）时直接复用缓存，不存在时返回 None"""
+        key = self._settings_file_key()
+        if key is None:
+            return None
+        cache = self._settings_cache
+        if cache is not None and cache[0] == key:
+            if cache[1] is None:
+                self._settings_cache = cache = (key, _settings_loads(cache[2]), cache[2])
+            return cache[1]
+        cache = self._load_compiled_settings(key)
+        if cache is not None:
+            self._settings_cache = cache
+            return cache[1]
+        with open(self.settings_path, 'r', encoding='utf-8') as f:
+            text = f.read()
+        data = _settings_loads(text)
+        self._settings_cache = (key, data, text)
+        self._store_compiled_settings(self._settings_cache)
+        return data
+
+    def _load_compiled_settings(self, key):
+        """读取上次解析 settings.json 得到的 marshal 快照 (key, data, text)；
+        与当前文件的 mtime/大小不符时返回 None"""
+        try:
+            with open(self._compiled_settings_path, 'rb') as f:
+                cached_key, data, text = marshal.load(f)
+        except Exception:
+            return None
+        if tuple(cached_key) != key or not isinstance(data, dict):
+            return None
+        return key, data, text
+
+    def _store_compiled_settings(self, cache):
+        """保存解析结果的 marshal 快照，下次启动时设置文件未变化即可跳过 JSON 解析"""
+        cache_path = self._compiled_settings_path
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, 'wb') as f:
+                marshal.dump(cache, f)
+        except Exception as e:
+            logging.debug(f"设置快照写入失败: {e}")
+
     def load_settings(self):
-        if not os.path.exists(self.settings_path):
-            return
+        self._loading_settings = True
+        try:
+            self._load_settings()
+        finally:
+            self._loading_settings = False
+
+    def _load_settings(self):
+        # 仅在本次加载内缓存路径查询：签名配置按页重复引用同一批章图路径
+        _abspath = functools.lru_cache(maxsize=256)(os.path.abspath)
+        _exists = functools.lru_cache(maxsize=256)(os.path.exists)
         try:
-            with open(self.settings_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self._read_settings_file()
+            if data is None:
+                return
             title_text = data.get('title_text')
             if title_text:
                 self.title_text_var.set(title_text)
             bg_path = data.get('background_image')
-            if bg_path and os.path.exists(bg_path):
+            if bg_path and _exists(bg_path):
                 self.bg_image_path = bg_path
             opacity = data.get('panel_opacity', data.get('background_opacity'))
             if isinstance(opacity, (int, float)):
@@ -6023,12 +6422,11 @@ class PDFConverterApp:
             saved_ocr_mode = data.get('ocr_quality_mode', '平衡')
             if saved_ocr_mode not in OCR_QUALITY_MODES:
                 saved_ocr_mode = '平衡'
-            self.ocr_quality_mode_var.set(saved_ocr_mode)
+            self.ocr_quality_mode = saved_ocr_mode
             # 功能选择和图片选项
             saved_func = data.get('current_function', 'PDF转Word')
             if saved_func in ALL_FUNCTIONS:
                 self.current_function_var.set(saved_func)
-                self._on_function_changed()
             saved_dpi = data.get('image_dpi', '200')
             if saved_dpi:
                 self.image_dpi_var.set(str(saved_dpi))
@@ -6070,22 +6468,22 @@ class PDFConverterApp:
             self.bookmark_merge_existing_var.set(bool(data.get('bookmark_merge_existing', False)))
             self.watermark_text_var.set(data.get('watermark_text', self.watermark_text_var.get()))
             self.watermark_opacity_var.set(str(data.get('watermark_opacity', self.watermark_opacity_var.get())))
-            self.watermark_rotation_var.set(str(data.get('watermark_rotation', self.watermark_rotation_var.get())))
-            self.watermark_fontsize_var.set(str(data.get('watermark_fontsize', self.watermark_fontsize_var.get())))
-            self.watermark_size_scale_var.set(str(data.get('watermark_size_scale', self.watermark_size_scale_var.get())))
-            self.watermark_spacing_var.set(str(data.get('watermark_spacing', self.watermark_spacing_var.get())))
+            self.watermark_rotation = str(data.get('watermark_rotation', self.watermark_rotation))
+            self.watermark_fontsize = str(data.get('watermark_fontsize', self.watermark_fontsize))
+            self.watermark_size_scale = str(data.get('watermark_size_scale', self.watermark_size_scale))
+            self.watermark_spacing = str(data.get('watermark_spacing', self.watermark_spacing))
             self.watermark_pages_var.set(str(data.get('watermark_pages', self.watermark_pages_var.get())))
             saved_wm_pos = data.get('watermark_position', self.watermark_position_var.get())
             if saved_wm_pos not in WATERMARK_POSITION_OPTIONS:
                 saved_wm_pos = "平铺"
             self.watermark_position_var.set(saved_wm_pos)
-            self.watermark_random_size_var.set(bool(data.get('watermark_random_size', False)))
-            self.watermark_random_strength_var.set(str(data.get('watermark_random_strength', self.watermark_random_strength_var.get())))
+            self.watermark_random_size = bool(data.get('watermark_random_size', False))
+            self.watermark_random_strength = str(data.get('watermark_random_strength', self.watermark_random_strength))
             saved_wm_img = data.get('watermark_image_path', '') or ''
-            if saved_wm_img and os.path.exists(saved_wm_img):
+            if saved_wm_img and _exists(saved_wm_img):
                 self.watermark_image_path = saved_wm_img
                 nm = os.path.basename(saved_wm_img)
-                self.watermark_img_label.config(text=nm if len(nm) <= 15 else nm[:12] + "...")
+                self.watermark_img_label.config(text=_short_name(nm))
             else:
                 self.watermark_image_path = None
                 self.watermark_img_label.config(text="")
@@ -6126,9 +6524,9 @@ class PDFConverterApp:
             if saved_stamp_mode in ("普通章", "二维码", "骑缝章", "模板", "签名"):
                 self.stamp_mode_var.set(saved_stamp_mode)
             self.stamp_pages_var.set(data.get('stamp_pages', ''))
-            self.stamp_opacity_var.set(str(data.get('stamp_opacity', '0.85')))
-            self.stamp_position_var.set(data.get('stamp_position', '右下'))
-            self.stamp_size_ratio_var.set(str(data.get('stamp_size_ratio', '0.18')))
+            self.stamp_opacity = str(data.get('stamp_opacity', '0.85'))
+            self.stamp_position = data.get('stamp_position', '右下')
+            self.stamp_size_ratio = str(data.get('stamp_size_ratio', '0.18'))
             self.stamp_qr_text_var.set(data.get('stamp_qr_text', ''))
             self.stamp_seam_side_var.set(data.get('stamp_seam_side', '右侧'))
             self.stamp_seam_align_var.set(data.get('stamp_seam_align', '居中'))
@@ -6140,16 +6538,16 @@ class PDFConverterApp:
                     "x_ratio": self._clamp_value(preview_profile.get("x_ratio", 0.85), 0.0, 1.0, 0.85),
                     "y_ratio": self._clamp_value(preview_profile.get("y_ratio", 0.85), 0.0, 1.0, 0.85),
                     "size_ratio": self._clamp_value(preview_profile.get("size_ratio", 0.18), 0.03, 0.7, 0.18),
-                    "opacity": self._clamp_value(preview_profile.get("opacity", self.stamp_opacity_var.get()), 0.05, 1.0, 0.85),
+                    "opacity": self._clamp_value(preview_profile.get("opacity", self.stamp_opacity), 0.05, 1.0, 0.85),
                 }
             else:
                 self.stamp_preview_profile = {
                     "x_ratio": 0.85,
                     "y_ratio": 0.85,
-                    "size_ratio": self._clamp_value(self.stamp_size_ratio_var.get(), 0.03, 0.7, 0.18),
-                    "opacity": self._clamp_value(self.stamp_opacity_var.get(), 0.05, 1.0, 0.85),
+                    "size_ratio": self._clamp_value(self.stamp_size_ratio, 0.03, 0.7, 0.18),
+                    "opacity": self._clamp_value(self.stamp_opacity, 0.05, 1.0, 0.85),
                 }
-            self.stamp_opacity_var.set(f"{self.stamp_preview_profile.get('opacity', 0.85):.2f}")
+            self.stamp_opacity = f"{self.stamp_preview_profile.get('opacity', 0.85):.2f}"
             saved_image_paths = data.get('stamp_image_paths', [])
             if not isinstance(saved_image_paths, list):
                 saved_image_paths = []
@@ -6162,8 +6560,8 @@ class PDFConverterApp:
             if isinstance(saved_profiles, dict):
                 loaded_profiles = {}
                 for k, v in saved_profiles.items():
-                    full = os.path.abspath(str(k))
-                    if full in self.stamp_image_paths and isinstance(v, dict):
+                    full = _abspath(str(k))
+                    if full in self.stamp_image_path_to_idx and isinstance(v, dict):
                         loaded_profiles[full] = self._normalize_stamp_profile(v)
                 for full in self.stamp_image_paths:
                     loaded_profiles[full] = self._normalize_stamp_profile(loaded_profiles.get(full))
@@ -6180,8 +6578,8 @@ class PDFConverterApp:
                         continue
                     kept = {}
                     for p, prof in page_data.items():
-                        full = os.path.abspath(str(p))
-                        if full in self.stamp_image_paths and isinstance(prof, dict):
+                        full = _abspath(str(p))
+                        if full in self.stamp_image_path_to_idx and isinstance(prof, dict):
                             norm = self._normalize_stamp_profile(prof)
                             norm["enabled"] = bool(prof.get("enabled", False))
                             kept[full] = norm
@@ -6189,11 +6587,13 @@ class PDFConverterApp:
                         loaded_signature_profiles[str(page_no)] = kept
             self.signature_page_profiles = loaded_signature_profiles
             self.stamp_template_path = data.get('stamp_template_path', '') or ''
-            if self.stamp_template_path and os.path.exists(self.stamp_template_path):
+            if self.stamp_template_path and _exists(self.stamp_template_path):
                 nm2 = os.path.basename(self.stamp_template_path)
-                self.stamp_template_label.config(text=nm2 if len(nm2) <= 16 else nm2[:13] + "...")
+                self.stamp_template_text_var.set(_short_name(nm2, 16))
             if self.bg_image_path:
                 self.apply_background_image()
+            # 所有变量就绪后再统一刷新一次界面
+            self._on_function_changed()
             self._on_reorder_mode_changed()
             self._on_bookmark_mode_changed(save=False)
             self._on_stamp_mode_changed()
@@ -6203,7 +6603,7 @@ class PDFConverterApp:
             pass
 
     def save_settings(self, immediate=False):
-        if not getattr(self, "root", None):
+        if not getattr(self, "root", None) or self._loading_settings:
             return
         if immediate:
             if self._save_settings_job is not None:
@@ -6215,13 +6615,20 @@ class PDFConverterApp:
             self._save_settings_now()
             return
 
-        # 防抖写盘：频繁操作时只写最后一次，降低UI卡顿
-        if self._save_settings_job is not None:
-            try:
-                self.root.after_cancel(self._save_settings_job)
-            except Exception:
-                pass
-        self._save_settings_job = self.root.after(250, self._save_settings_now)
+        # 防抖写盘：频繁操作（如拖动透明度滑块）时只顺延截止时间，
+        # 不反复取消/重建定时器，停止操作 SAVE_SETTINGS_DELAY_MS 后写一次
+        self._save_settings_due = time.monotonic() + self.SAVE_SETTINGS_DELAY_MS / 1000.0
+        if self._save_settings_job is None:
+            self._save_settings_job = self.root.after(
+                self.SAVE_SETTINGS_DELAY_MS, self._flush_pending_settings_save)
+
+    def _flush_pending_settings_save(self):
+        remaining_ms = int((self._save_settings_due - time.monotonic()) * 1000)
+        if remaining_ms > 10:
+            self._save_settings_job = self.root.after(
+                remaining_ms, self._flush_pending_settings_save)
+            return
+        self._save_settings_now()
 
     def _save_settings_now(self):
         self._save_settings_job = None
@@ -6234,21 +6641,21 @@ class PDFConverterApp:
             'baidu_api_key_enc': simple_encrypt(self.baidu_api_key),
             'baidu_secret_key_enc': simple_encrypt(self.baidu_secret_key),
             'xslt_path': self.xslt_path or '',
-            'ocr_quality_mode': self.ocr_quality_mode_var.get(),
+            'ocr_quality_mode': self.ocr_quality_mode,
             'current_function': self.current_function_var.get(),
             'image_dpi': self.image_dpi_var.get(),
             'image_format': self.image_format_var.get(),
             'watermark_text': self.watermark_text_var.get(),
             'watermark_opacity': self.watermark_opacity_var.get(),
-            'watermark_rotation': self.watermark_rotation_var.get(),
-            'watermark_fontsize': self.watermark_fontsize_var.get(),
-            'watermark_size_scale': self.watermark_size_scale_var.get(),
-            'watermark_spacing': self.watermark_spacing_var.get(),
+            'watermark_rotation': self.watermark_rotation,
+            'watermark_fontsize': self.watermark_fontsize,
+            'watermark_size_scale': self.watermark_size_scale,
+            'watermark_spacing': self.watermark_spacing,
             'watermark_pages': self.watermark_pages_var.get(),
             'watermark_position': self.watermark_position_var.get(),
             'watermark_image_path': self.watermark_image_path or '',
-            'watermark_random_size': bool(self.watermark_random_size_var.get()),
-            'watermark_random_strength': self.watermark_random_strength_var.get(),
+            'watermark_random_size': bool(self.watermark_random_size),
+            'watermark_random_strength': self.watermark_random_strength,
             'split_mode': self.split_mode_var.get(),
             'reorder_mode': self.reorder_mode_var.get(),
             'reorder_pages': self.reorder_pages_var.get(),
@@ -6282,24 +6689,19 @@ class PDFConverterApp:
             'batch_regex_template': self.batch_regex_template_var.get(),
             'stamp_mode': self.stamp_mode_var.get(),
             'stamp_pages': self.stamp_pages_var.get(),
-            'stamp_opacity': self.stamp_opacity_var.get(),
-            'stamp_position': self.stamp_position_var.get(),
-            'stamp_size_ratio': self.stamp_size_ratio_var.get(),
+            'stamp_opacity': self.stamp_opacity,
+            'stamp_position': self.stamp_position,
+            'stamp_size_ratio': self.stamp_size_ratio,
             'stamp_qr_text': self.stamp_qr_text_var.get(),
             'stamp_seam_side': self.stamp_seam_side_var.get(),
             'stamp_seam_align': self.stamp_seam_align_var.get(),
             'stamp_seam_overlap': self.stamp_seam_overlap_var.get(),
             'stamp_remove_white_bg': bool(self.stamp_remove_white_bg_var.get()),
-            'stamp_preview_profile': {
-                'x_ratio': self._clamp_value(self.stamp_preview_profile.get("x_ratio", 0.85), 0.0, 1.0, 0.85),
-                'y_ratio': self._clamp_value(self.stamp_preview_profile.get("y_ratio", 0.85), 0.0, 1.0, 0.85),
-                'size_ratio': self._clamp_value(self.stamp_preview_profile.get("size_ratio", 0.18), 0.03, 0.7, 0.18),
-                'opacity': self._clamp_value(self.stamp_preview_profile.get("opacity", self.stamp_opacity_var.get()), 0.05, 1.0, 0.85),
-            },
+            'stamp_preview_profile': self._snapshot_stamp_preview_profile(),
             'stamp_image_paths': list(self.stamp_image_paths),
             'stamp_selected_image_idx': int(self.stamp_selected_image_idx),
             'stamp_profiles': {
-                p: self._normalize_stamp_profile(self.stamp_profiles.get(p))
+                p: self.stamp_profiles.get(p) or self._default_stamp_profile()
                 for p in self.stamp_image_paths if p
             },
             'signature_page_profiles': self.signature_page_profiles if isinstance(self.signature_page_profiles, dict) else {},
@@ -6307,8 +6709,14 @@ class PDFConverterApp:
             'stamp_template_path': self.stamp_template_path,
         }
         try:
+            text = _settings_dumps(data)
+            cache = self._settings_cache
+            if cache is not None and cache[2] == text and cache[0] == self._settings_file_key():
+                return  # 内容与磁盘上一致，跳过写盘
             with open(self.settings_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+                f.write(text)
+            # 不缓存 data 本身（其中含可变的界面状态引用），下次读取时再从文本解析
+            self._settings_cache = (self._settings_file_key(), None, text)
         except Exception:
             pass
 
@@ -6318,43 +6726,51 @@ class PDFConverterApp:
 
     def _parse_page_range_for_converter(self):
         """将UI的页范围文本转为 (start_page_0based, end_page_0based_exclusive) 或 (0, None)"""
-        start_text = self.page_start_var.get().strip()
-        end_text = self.page_end_var.get().strip()
-        if not start_text and not end_text:
-            return 0, None
-        start_page = int(start_text) - 1 if start_text and start_text.isdigit() else 0
-        end_page = int(end_text) if end_text and end_text.isdigit() else None
-        start_page = max(0, start_page)
-        # 验证起始页不超过结束页
-        if end_page is not None and start_page >= end_page:
-            return 0, None
-        return start_page, end_page
+        return _parse_page_range(self.page_start_var.get().strip(),
+                                 self.page_end_var.get().strip())
 
     @staticmethod
     def format_skipped_pages(skipped_pages):
         pages = sorted(set(skipped_pages))
+        head = ", ".join(map(str, islice(pages, 30)))
         if len(pages) <= 30:
-            return ", ".join(str(p) for p in pages)
-        head = ", ".join(str(p) for p in pages[:30])
+            return head
         return f"{head} ...（共 {len(pages)} 页）"
 
     def generate_output_filename(self, input_file, extension):
         directory = os.path.dirname(input_file)
         basename = os.path.splitext(os.path.basename(input_file))[0]
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         output_filename = f"{basename}_converted_{timestamp}{extension}"
         return os.path.join(directory, output_filename)
 
     def open_folder(self, filepath):
-        try:
-            folder = os.path.dirname(os.path.abspath(filepath))
-            os.startfile(folder)
-        except Exception as e:
-            messagebox.showerror("错误", f"无法打开文件夹：\n{str(e)}")
+        folder = os.path.dirname(os.path.abspath(filepath))
+        self._start_file_async(folder, error_title="错误", error_prefix="无法打开文件夹")
+
+    def _start_file_async(self, path, error_title=None, error_prefix=""):
+        """在后台线程中调用 os.startfile，避免资源管理器启动较慢时卡住界面。
+
+        指定 error_title 时，失败会通过UI队列弹出错误提示；否则静默忽略。
+        """
+        def _run():
+            try:
+                os.startfile(path)
+            except Exception as e:
+                if error_title:
+                    self._post_error(error_title, f"{error_prefix}：\n{str(e)}")
+
+        threading.Thread(target=_run, daemon=True).start()
 
     def _on_root_close(self):
         try:
             self.save_settings(immediate=True)
         except Exception:
             pass
+        self._close_signature_preview_doc()
+        try:
+            self.history.flush()
+        except Exception:
+            pass
+        shutdown_process_pool()
         self.root.destroy()
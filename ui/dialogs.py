@@ -31,25 +31,25 @@ def open_settings_window(app):
     tab_appearance = tk.Frame(notebook, padx=12, pady=12)
     notebook.add(tab_appearance, text="外观设置")
 
-    tk.Label(tab_appearance, text="标题文字:", font=("Microsoft YaHei", 10)).pack(anchor=tk.W)
+    tk.Label(tab_appearance, text="标题文字:", font=app.font_medium).pack(anchor=tk.W)
     title_entry = tk.Entry(tab_appearance, textvariable=app.title_text_var,
-                           font=("Microsoft YaHei", 10))
+                           font=app.font_medium)
     title_entry.pack(fill=tk.X, pady=(4, 12))
 
     bg_btn_frame = tk.Frame(tab_appearance)
     bg_btn_frame.pack(anchor=tk.W)
-    tk.Button(bg_btn_frame, text="更换背景", font=("Microsoft YaHei", 10),
+    tk.Button(bg_btn_frame, text="更换背景", font=app.font_medium,
               command=app.choose_background_image).pack(side=tk.LEFT)
-    tk.Button(bg_btn_frame, text="清除背景", font=("Microsoft YaHei", 10),
+    tk.Button(bg_btn_frame, text="清除背景", font=app.font_medium,
               command=app.clear_background_image).pack(side=tk.LEFT, padx=(8, 0))
 
-    tk.Label(tab_appearance, text="面板透明度:", font=("Microsoft YaHei", 10)
+    tk.Label(tab_appearance, text="面板透明度:", font=app.font_medium
              ).pack(anchor=tk.W, pady=(12, 0))
     tk.Scale(tab_appearance, from_=0, to=100, orient=tk.HORIZONTAL,
              resolution=1, showvalue=True, variable=app.panel_opacity_var,
              command=app.on_opacity_change).pack(fill=tk.X, pady=(4, 0))
 
-    tk.Button(tab_appearance, text="应用标题", font=("Microsoft YaHei", 10),
+    tk.Button(tab_appearance, text="应用标题", font=app.font_medium,
               command=app.apply_title_text).pack(anchor=tk.W, pady=(12, 0))
 
     # ========== 页签2：API设置 ==========
@@ -58,33 +58,33 @@ def open_settings_window(app):
 
     # 百度OCR配置
     tk.Label(tab_api, text="百度OCR API（用于文字识别和公式识别）",
-             font=("Microsoft YaHei", 10, "bold")).pack(anchor=tk.W, pady=(0, 8))
+             font=app.font_medium_bold).pack(anchor=tk.W, pady=(0, 8))
 
-    tk.Label(tab_api, text="API Key:", font=("Microsoft YaHei", 9)).pack(anchor=tk.W)
+    tk.Label(tab_api, text="API Key:", font=app.font_body).pack(anchor=tk.W)
     api_key_var = tk.StringVar(value=app.baidu_api_key)
-    tk.Entry(tab_api, textvariable=api_key_var, font=("Microsoft YaHei", 9),
+    tk.Entry(tab_api, textvariable=api_key_var, font=app.font_body,
              width=50).pack(fill=tk.X, pady=(2, 6))
 
-    tk.Label(tab_api, text="Secret Key:", font=("Microsoft YaHei", 9)).pack(anchor=tk.W)
+    tk.Label(tab_api, text="Secret Key:", font=app.font_body).pack(anchor=tk.W)
     secret_key_var = tk.StringVar(value=app.baidu_secret_key)
-    tk.Entry(tab_api, textvariable=secret_key_var, font=("Microsoft YaHei", 9),
+    tk.Entry(tab_api, textvariable=secret_key_var, font=app.font_body,
              width=50, show="*").pack(fill=tk.X, pady=(2, 8))
 
-    tk.Label(tab_api, text="OCR识别模式:", font=("Microsoft YaHei", 9)).pack(anchor=tk.W)
-    ocr_quality_var = tk.StringVar(value=app.ocr_quality_mode_var.get())
+    tk.Label(tab_api, text="OCR识别模式:", font=app.font_body).pack(anchor=tk.W)
+    ocr_quality_var = tk.StringVar(value=app.ocr_quality_mode)
     ocr_mode_combo = ttk.Combobox(
         tab_api,
         textvariable=ocr_quality_var,
         values=("快速", "平衡", "高精"),
         state="readonly",
-        font=("Microsoft YaHei", 9),
+        font=app.font_body,
         width=12,
     )
     ocr_mode_combo.pack(anchor=tk.W, pady=(2, 8))
     tk.Label(
         tab_api,
         text="快速=更快速度，平衡=默认推荐，高精=更高质量但更慢",
-        font=("Microsoft YaHei", 8),
+        font=app.font_small,
         fg="#666666",
     ).pack(anchor=tk.W, pady=(0, 8))
 
@@ -115,11 +115,11 @@ def open_settings_window(app):
 
         threading.Thread(target=_test_thread, daemon=True).start()
 
-    test_btn = tk.Button(test_frame, text="测试连接", font=("Microsoft YaHei", 9),
+    test_btn = tk.Button(test_frame, text="测试连接", font=app.font_body,
               command=do_test)
     test_btn.pack(side=tk.LEFT)
     tk.Label(test_frame, textvariable=test_status_var,
-             font=("Microsoft YaHei", 9)).pack(side=tk.LEFT, padx=(10, 0))
+             font=app.font_body).pack(side=tk.LEFT, padx=(10, 0))
 
     # 说明
     hint_text = (
@@ -129,31 +129,30 @@ def open_settings_window(app):
         "3. 同一个应用可同时使用文字识别和公式识别\n"
         "4. 免费额度：通用文字500次/月"
     )
-    tk.Label(tab_api, text=hint_text, font=("Microsoft YaHei", 8),
+    tk.Label(tab_api, text=hint_text, font=app.font_small,
              fg="#666666", justify=tk.LEFT, wraplength=420).pack(anchor=tk.W, pady=(4, 12))
 
     # XSLT路径（高级选项）
     tk.Label(tab_api, text="高级选项（通常无需修改）:",
-             font=("Microsoft YaHei", 8), fg="#aaaaaa").pack(anchor=tk.W, pady=(8, 0))
+             font=app.font_small, fg="#aaaaaa").pack(anchor=tk.W, pady=(8, 0))
     xslt_hint = "留空自动检测Office安装路径，仅Office路径异常时手动填写"
     tk.Label(tab_api, text=f"MML2OMML.XSL: {xslt_hint}",
-             font=("Microsoft YaHei", 8), fg="#aaaaaa").pack(anchor=tk.W)
+             font=app.font_small, fg="#aaaaaa").pack(anchor=tk.W)
     xslt_var = tk.StringVar(value=app.xslt_path or "")
-    tk.Entry(tab_api, textvariable=xslt_var, font=("Microsoft YaHei", 8),
+    tk.Entry(tab_api, textvariable=xslt_var, font=app.font_small,
              fg="#aaaaaa").pack(fill=tk.X, pady=(2, 0))
 
     # 保存按钮
     def save_api_settings():
         app.baidu_api_key = api_key_var.get().strip()
         app.baidu_secret_key = secret_key_var.get().strip()
-        app.ocr_quality_mode_var.set(ocr_quality_var.get().strip() or "平衡")
+        app.ocr_quality_mode = ocr_quality_var.get().strip() or "平衡"
         app.xslt_path = xslt_var.get().strip() or None
-        app._baidu_client = None  # 重建客户端
         app.save_settings()
         app._update_api_hint()
         messagebox.showinfo("设置", "API设置已保存", parent=win)
 
-    tk.Button(tab_api, text="保存设置", font=("Microsoft YaHei", 10, "bold"),
+    tk.Button(tab_api, text="保存设置", font=app.font_medium_bold,
               command=save_api_settings).pack(anchor=tk.E, pady=(12, 0))
 
 
@@ -174,11 +173,11 @@ def open_history_window(app):
     toolbar.pack(fill=tk.X, padx=10, pady=5)
     count_label = tk.Label(
         toolbar, text=f"共 {app.history.count} 条记录",
-        font=("Microsoft YaHei", 9)
+        font=app.font_body
     )
     count_label.pack(side=tk.LEFT)
     tk.Button(
-        toolbar, text="清空历史", font=("Microsoft YaHei", 9),
+        toolbar, text="清空历史", font=app.font_body,
         command=lambda: _clear_history()
     ).pack(side=tk.RIGHT)
 